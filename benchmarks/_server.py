@@ -0,0 +1,69 @@
+"""Local HTTPS server imitating the TV, serving fixed JSON responses."""
+
+import json
+import ssl
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@dataclass
+class BenchServer:
+    host: str = "127.0.0.1"
+    port: int = 0
+    responses: dict[str, Any] = field(default_factory=dict)
+    """Response bodies of the paths, other paths respond with 404."""
+
+
+def _create_handler(server: BenchServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._handle()
+
+        def do_POST(self) -> None:
+            self._handle()
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _handle(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.path in server.responses:
+                status, body = 200, server.responses[self.path]
+            else:
+                status, body = 404, None
+            content = b"" if body is None else json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+    return Handler
+
+
+@contextmanager
+def run_server() -> Iterator[BenchServer]:
+    server = BenchServer()
+    httpd = ThreadingHTTPServer((server.host, 0), _create_handler(server))
+    httpd.daemon_threads = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(DATA_DIR / "cert.pem", DATA_DIR / "key.pem")
+    httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+    server.port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
@@ -0,0 +1,89 @@
+"""Measure the time of typical PhilipsTVRemote calls, replayed from a recording of a real TV.
+
+First record the calls against a real TV, which doesn't change its state::
+
+    python -m benchmarks.remote record 192.168.0.100 <id> <key> session.jsonl.gz
+
+Then replay the recording offline as many times as needed. With ``--latency 1`` the recorded
+latency of the TV is reproduced, otherwise only the client overhead is measured::
+
+    python -m benchmarks.remote replay session.jsonl.gz
+
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from philipstv import PhilipsTV, PhilipsTVAPI, PhilipsTVRemote
+from philipstv.replay import RecordingTransport, ReplayTransport
+from philipstv.transport import PhilipsTVTransport
+
+WORKFLOWS: dict[str, Callable[[PhilipsTVRemote], object]] = {
+    "get_power": lambda remote: remote.get_power(),
+    "get_volume": lambda remote: remote.get_volume(),
+    "get_current_channel": lambda remote: remote.get_current_channel(),
+    "get_all_channels": lambda remote: remote.get_all_channels(),
+    "get_applications": lambda remote: remote.get_applications(),
+}
+
+
+def create_remote(tv: PhilipsTVTransport, fast_json: bool) -> PhilipsTVRemote:
+    return PhilipsTVRemote(PhilipsTVAPI(tv, fast_json=fast_json))
+
+
+def record(args: argparse.Namespace) -> None:
+    with RecordingTransport(PhilipsTV(args.host, auth=(args.id, args.key))) as tv:
+        remote = create_remote(tv, fast_json=False)
+        for workflow in WORKFLOWS.values():
+            workflow(remote)
+    tv.save(args.file)
+    print(f"Recorded {len(tv.exchanges)} requests to {args.file}")
+
+
+def replay(args: argparse.Namespace) -> None:
+    tv = ReplayTransport.load(args.file, latency=args.latency)
+    print(f"{'workflow':<20} {'fast_json':>9} {'mean':>10} {'p50':>10} {'p99':>10}")
+    for name, workflow in WORKFLOWS.items():
+        for fast_json in (False, True):
+            remote = create_remote(tv, fast_json)
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                workflow(remote)
+                times.append(time.perf_counter() - start)
+            p99 = statistics.quantiles(times, n=100)[98]
+            print(
+                f"{name:<20} {fast_json!s:>9} "
+                f"{statistics.mean(times) * 1e6:>8.0f}us "
+                f"{statistics.median(times) * 1e6:>8.0f}us "
+                f"{p99 * 1e6:>8.0f}us"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(required=True)
+
+    record_parser = subparsers.add_parser("record", help="record the calls against a real TV")
+    record_parser.add_argument("host", help="IP address of the TV")
+    record_parser.add_argument("id", help="credentials ID")
+    record_parser.add_argument("key", help="credentials key")
+    record_parser.add_argument("file", help="file to save the recording to")
+    record_parser.set_defaults(command=record)
+
+    replay_parser = subparsers.add_parser("replay", help="replay the recorded calls")
+    replay_parser.add_argument("file", help="recording saved by the record command")
+    replay_parser.add_argument("-n", "--repeat", type=int, default=200, help="calls per workflow")
+    replay_parser.add_argument(
+        "-l", "--latency", type=float, default=0.0, help="multiplier of the recorded latency"
+    )
+    replay_parser.set_defaults(command=replay)
+
+    args = parser.parse_args()
+    args.command(args)
+
+
+if __name__ == "__main__":
+    main()
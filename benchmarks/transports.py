@@ -0,0 +1,69 @@
+"""Compare the per-request overhead of the available HTTP backends.
+
+Sends the same requests through each backend to a local HTTPS server imitating the TV and reports
+the client CPU time and the wall time per request. The server runs in other threads, so the CPU
+time only includes the work done by the client. Run from the repository root::
+
+    python -m benchmarks.transports
+
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from philipstv import PhilipsTV, Urllib3PhilipsTV
+
+from ._server import run_server
+
+BACKENDS: dict[str, Callable[[str, int], PhilipsTV | Urllib3PhilipsTV]] = {
+    "requests": PhilipsTV,
+    "urllib3": Urllib3PhilipsTV,
+}
+RESPONSE = {"powerstate": "On"}
+PAYLOAD = {"key": "VolumeUp"}
+
+
+def bench(tv: PhilipsTV | Urllib3PhilipsTV, requests: int) -> tuple[list[float], list[float]]:
+    cpu_times = []
+    wall_times = []
+    for i in range(requests):
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if i % 2:
+            tv.post("6/input/key", PAYLOAD)
+        else:
+            tv.get("6/powerstate")
+        cpu_times.append(time.thread_time() - cpu_start)
+        wall_times.append(time.perf_counter() - wall_start)
+    return cpu_times, wall_times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--requests", type=int, default=2000, help="requests per backend")
+    parser.add_argument("-w", "--warmup", type=int, default=100, help="warm-up requests")
+    args = parser.parse_args()
+
+    with run_server() as server:
+        server.responses = {"/6/powerstate": RESPONSE, "/6/input/key": None}
+        print(
+            f"{'backend':<10} {'cpu mean':>10} {'cpu p50':>10} {'wall mean':>10} {'wall p99':>10}"
+        )
+        for name, backend in BACKENDS.items():
+            with backend(server.host, server.port) as tv:
+                bench(tv, args.warmup)
+                cpu_times, wall_times = bench(tv, args.requests)
+            wall_p99 = statistics.quantiles(wall_times, n=100)[98]
+            print(
+                f"{name:<10} "
+                f"{statistics.mean(cpu_times) * 1e6:>8.0f}us "
+                f"{statistics.median(cpu_times) * 1e6:>8.0f}us "
+                f"{statistics.mean(wall_times) * 1e6:>8.0f}us "
+                f"{wall_p99 * 1e6:>8.0f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
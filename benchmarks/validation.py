@@ -0,0 +1,145 @@
+"""Compare the validation levels on realistic Ambilight and channel list responses.
+
+Each endpoint is read through PhilipsTVAPI from a response kept in memory, so only the client
+work is measured: decoding the JSON and creating the model, with and without ``fast_json``.
+Run from the repository root::
+
+    python -m benchmarks.validation
+
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from philipstv import PhilipsTVAPI, ValidationLevel
+from philipstv.types import Credentials
+
+ENDPOINTS: dict[str, tuple[str, Callable[[PhilipsTVAPI], object]]] = {
+    "ambilight/measured": ("6/ambilight/measured", PhilipsTVAPI.get_ambilight_measured),
+    "ambilight/processed": ("6/ambilight/processed", PhilipsTVAPI.get_ambilight_processed),
+    "channel list": ("6/channeldb/tv/channelLists/all", PhilipsTVAPI.get_all_channels),
+}
+
+
+def ambilight_colors(left: int, top: int, right: int, bottom: int) -> dict[str, Any]:
+    def side(points: int, offset: int) -> dict[str, Any]:
+        return {
+            str(point): {"r": (point * 7) % 256, "g": (offset * 13) % 256, "b": point % 256}
+            for point in range(points)
+        }
+
+    return {
+        "layer1": {
+            "left": side(left, 0),
+            "top": side(top, 1),
+            "right": side(right, 2),
+            "bottom": side(bottom, 3),
+        }
+    }
+
+
+def channel_list(channels: int) -> dict[str, Any]:
+    return {
+        "version": 12,
+        "id": "all",
+        "listType": "MixedSources",
+        "medium": "mixed",
+        "operator": "UPC",
+        "installCountry": "Poland",
+        "Channel": [
+            {
+                "ccid": 1000 + number,
+                "preset": str(number),
+                "name": f"Channel {number} HD",
+                "onid": 1537,
+                "tsid": 24 + number // 10,
+                "sid": 2400 + number,
+                "serviceType": "audio_video",
+                "type": "DVB_C",
+                "logoVersion": 33,
+            }
+            for number in range(1, channels + 1)
+        ],
+    }
+
+
+class MemoryTransport:
+    """Transport returning responses kept encoded, decoding them like the real transports."""
+
+    def __init__(self, responses: dict[str, Any]) -> None:
+        self.host = ""
+        self.auth: Credentials | None = None
+        self._responses = {path: json.dumps(body).encode() for path, body in responses.items()}
+
+    def get(self, path: str) -> Any:
+        return json.loads(self._responses[path])
+
+    def get_raw(self, path: str) -> bytes:
+        return self._responses[path]
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        raise NotImplementedError
+
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+def bench(api: PhilipsTVAPI, read: Callable[[PhilipsTVAPI], object], repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read(api)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--repeat", type=int, default=500, help="reads per combination")
+    parser.add_argument("-c", "--channels", type=int, default=600, help="channels in the list")
+    parser.add_argument(
+        "-t", "--topology", type=int, nargs=4, default=(4, 9, 4, 9), help="points on each side"
+    )
+    args = parser.parse_args()
+
+    ambilight = ambilight_colors(*args.topology)
+    tv = MemoryTransport(
+        {
+            "6/ambilight/measured": ambilight,
+            "6/ambilight/processed": ambilight,
+            "6/channeldb/tv/channelLists/all": channel_list(args.channels),
+        }
+    )
+
+    print(
+        f"{'endpoint':<20} {'fast_json':>9} {'level':<5} "
+        f"{'mean':>10} {'p50':>10} {'p99':>10} {'speedup':>8}"
+    )
+    for name, (path, read) in ENDPOINTS.items():
+        baseline = None
+        for fast_json in (False, True):
+            for level in ValidationLevel:
+                api = PhilipsTVAPI(tv, fast_json=fast_json, validation={path[2:]: level})
+                bench(api, read, args.repeat // 10)
+                times = bench(api, read, args.repeat)
+                mean = statistics.mean(times)
+                baseline = baseline or mean
+                p99 = statistics.quantiles(times, n=100)[98]
+                print(
+                    f"{name:<20} {fast_json!s:>9} {level.value:<5} "
+                    f"{mean * 1e6:>8.0f}us "
+                    f"{statistics.median(times) * 1e6:>8.0f}us "
+                    f"{p99 * 1e6:>8.0f}us "
+                    f"{baseline / mean:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,39 @@
+from ._pool import PoolStats
 from .api import PhilipsTVAPI
+from .cache import ResponseCache
+from .circuit import CircuitBreaker, CircuitState
 from .exceptions import (
     PhilipsError,
     PhilipsTVAPIError,
     PhilipsTVAPIMalformedResponseError,
     PhilipsTVAPIUnauthorizedError,
+    PhilipsTVAPIUnsupportedError,
+    PhilipsTVConnectTimeoutError,
     PhilipsTVError,
     PhilipsTVPairingError,
+    PhilipsTVRateLimitError,
+    PhilipsTVRemoteAmbiguousChannelError,
     PhilipsTVRemoteError,
+    PhilipsTVTimeoutError,
+    PhilipsTVUnavailableError,
 )
+from .keys import KeyBurst, KeyPress
 from .model import DeviceInfo
 from .pairing import PhilipsTVPairer
+from .ratelimit import RateLimit, RateLimiter
 from .remote import AmbilightColor, InputKeyValue, PhilipsTVRemote
-from .tv import PhilipsTV
+from .replay import RecordingTransport, ReplayTransport
+from .snapshot import TVSnapshot, TVState
+from .timeouts import Timeout, deadline
+from .timing import RequestTiming
+from .transport import (
+    PhilipsTVPooledTransport,
+    PhilipsTVRawTransport,
+    PhilipsTVStreamTransport,
+    PhilipsTVTransport,
+)
+from .tv import PhilipsTV, Urllib3PhilipsTV
+from .validation import ValidationLevel
 
 try:
     # `_version` module is generated during the build.
@@ -22,18 +44,45 @@ except ImportError:
 
 __all__ = [
     "AmbilightColor",
+    "CircuitBreaker",
+    "CircuitState",
     "DeviceInfo",
     "InputKeyValue",
+    "KeyBurst",
+    "KeyPress",
     "PhilipsError",
     "PhilipsTV",
     "PhilipsTVAPI",
     "PhilipsTVAPIError",
     "PhilipsTVAPIMalformedResponseError",
     "PhilipsTVAPIUnauthorizedError",
+    "PhilipsTVAPIUnsupportedError",
+    "PhilipsTVConnectTimeoutError",
     "PhilipsTVError",
     "PhilipsTVPairer",
     "PhilipsTVPairingError",
+    "PhilipsTVPooledTransport",
+    "PhilipsTVRateLimitError",
+    "PhilipsTVRawTransport",
     "PhilipsTVRemote",
+    "PhilipsTVRemoteAmbiguousChannelError",
     "PhilipsTVRemoteError",
+    "PhilipsTVStreamTransport",
+    "PhilipsTVTimeoutError",
+    "PhilipsTVTransport",
+    "PhilipsTVUnavailableError",
+    "PoolStats",
+    "RateLimit",
+    "RateLimiter",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RequestTiming",
+    "ResponseCache",
+    "TVSnapshot",
+    "TVState",
+    "Timeout",
+    "Urllib3PhilipsTV",
+    "ValidationLevel",
     "__version__",
+    "deadline",
 ]
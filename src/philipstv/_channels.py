@@ -0,0 +1,50 @@
+from collections import defaultdict
+from collections.abc import Iterable
+
+from .exceptions import PhilipsTVRemoteAmbiguousChannelError, PhilipsTVRemoteError
+from .model import Channel
+
+DEFAULT_CHANNELS_TTL = 10.0
+"""Default number of seconds for which a downloaded channel list is used without checking it."""
+
+
+class ChannelIndex:
+    """Channels of a channel list, indexed for constant time lookups by number and name.
+
+    Channels sharing a number or a name are all kept, so that a lookup can report the ambiguity
+    instead of picking one of them.
+    """
+
+    def __init__(self, channels: Iterable[Channel]) -> None:
+        self.channels = list(channels)
+        """All the channels, in the order of the list."""
+        self._by_number: defaultdict[int, list[Channel]] = defaultdict(list)
+        self._by_name: defaultdict[str, list[Channel]] = defaultdict(list)
+        self._by_folded_name: defaultdict[str, list[Channel]] = defaultdict(list)
+        for channel in self.channels:
+            if channel.preset.isdecimal():
+                self._by_number[int(channel.preset)].append(channel)
+            self._by_name[channel.name].append(channel)
+            self._by_folded_name[channel.name.casefold()].append(channel)
+
+    def find(self, channel: int | str) -> Channel:
+        """Return the channel with the given number or name.
+
+        Names are matched exactly, or ignoring the case if no name matches exactly.
+
+        Raises:
+            PhilipsTVRemoteAmbiguousChannelError: If more than one channel matches.
+            PhilipsTVRemoteError: If no channel matches.
+
+        """
+        if isinstance(channel, str):
+            matches = self._by_name.get(channel) or self._by_folded_name.get(channel.casefold())
+        else:
+            matches = self._by_number.get(channel)
+        if not matches:
+            raise PhilipsTVRemoteError(f"Channel '{channel}' not available")
+        if len(matches) > 1:
+            raise PhilipsTVRemoteAmbiguousChannelError(
+                channel, [(match.preset, match.name) for match in matches]
+            )
+        return matches[0]
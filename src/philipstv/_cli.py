@@ -10,7 +10,7 @@ from click.exceptions import UsageError
 
 from philipstv import __version__
 
-from ._data import HostData, PhilipsTVData
+from ._data import HostData, PhilipsTVData, digest_store
 from .exceptions import (
     PhilipsError,
     PhilipsTVAPIUnauthorizedError,
@@ -200,7 +200,8 @@ def cli(
     elif save:  # if all auth is given and we want to save
         PhilipsTVData(last_host=HostData(host=host, id=id, key=key)).save()
 
-    ctx.obj = TVContext(PhilipsTVRemote.new(host, (id, key)), host, id, key, save)
+    remote = PhilipsTVRemote.new(host, (id, key), digest_store=digest_store())
+    ctx.obj = TVContext(remote, host, id, key, save)
 
 
 @cli.command("pair")
@@ -312,7 +313,8 @@ def channel_get(tv_ctx: TVContext) -> None:
 @pass_tv_context
 @handle_tv_errors
 def channel_list(tv_ctx: TVContext) -> None:
-    click.echo("\n".join(f"{no}\t{chan}" for no, chan in tv_ctx.remote.get_all_channels().items()))
+    for no, chan in tv_ctx.remote.iter_all_channels():
+        click.echo(f"{no}\t{chan}")
 
 
 @channel.command("set", help="Set TV channel.")
@@ -6,10 +6,18 @@ from typing import Optional
 from appdirs import user_data_dir
 from pydantic import BaseModel, ValidationError
 
+from .auth import FileDigestChallengeStore
+
 _LOGGER = logging.getLogger(__name__)
 
 
 DATA_FILE = Path(user_data_dir("philipstv", "cyran.dev")) / "data.json"
+DIGEST_FILE_NAME = "digest.json"
+
+
+def digest_store() -> FileDigestChallengeStore:
+    """Return the store persisting digest authentication state next to the data file."""
+    return FileDigestChallengeStore(DATA_FILE.parent / DIGEST_FILE_NAME)
 
 
 class HostData(BaseModel):
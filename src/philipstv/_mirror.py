@@ -0,0 +1,82 @@
+import threading
+import time
+from dataclasses import fields
+from typing import Any
+
+from .notify import Change
+from .snapshot import TVSnapshot, TVState, state_from_snapshot
+
+_NODE_SNAPSHOT_FIELDS = {
+    "powerstate": "powerstate",
+    "audio/volume": "volume",
+    "activities/tv": "current_channel",
+    "ambilight/power": "ambilight_power",
+    "ambilight/mode": "ambilight_mode",
+}
+
+_STATE_FIELDS = tuple(field.name for field in fields(TVState) if field.name != "errors")
+
+
+class StateMirror:
+    """Locally known values of the TV state, named like the fields of :class:`TVState`.
+
+    Values are learned from successful writes (optimistically, assuming the TV applied them), reads
+    and change notifications, and served until they are ``ttl`` seconds old. Every read has to
+    take a :attr:`version` before sending the request, so that its response doesn't overwrite a
+    value written in the meantime.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._values: dict[str, tuple[float, Any]] = {}
+        self._written: dict[str, int] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def get(self, field: str) -> Any | None:
+        """Return the value of the field, ``None`` if it's unknown or stale."""
+        with self._lock:
+            entry = self._values.get(field)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                return None
+            return entry[1]
+
+    def write(self, field: str, value: Any) -> None:
+        """Store the value written to the TV."""
+        with self._lock:
+            self._version += 1
+            self._written[field] = self._version
+            self._values[field] = (time.monotonic(), value)
+
+    def read(self, field: str, value: Any, version: int) -> None:
+        """Store the value read from the TV, unless it was written after ``version``."""
+        with self._lock:
+            if self._written.get(field, 0) > version:
+                return
+            self._values[field] = (time.monotonic(), value)
+
+    def read_state(self, state: TVState, version: int) -> None:
+        """Store all the known values of the state read from the TV."""
+        for field in _STATE_FIELDS:
+            if (value := getattr(state, field)) is not None:
+                self.read(field, value, version)
+
+    def notify(self, change: Change) -> None:
+        """Store the value from the change notification, which is always the latest one."""
+        if (snapshot_field := _NODE_SNAPSHOT_FIELDS.get(change.node)) is None:
+            return
+        state = state_from_snapshot(TVSnapshot(**{snapshot_field: change.value}))  # type: ignore[arg-type]
+        self.read_state(state, self.version)
+
+    def discard(self, *fields: str) -> None:
+        """Forget the values of the fields, so they are read from the TV again."""
+        with self._lock:
+            self._version += 1
+            for field in fields or _STATE_FIELDS:
+                self._written[field] = self._version
+                self._values.pop(field, None)
@@ -0,0 +1,23 @@
+import re
+from collections.abc import Iterable
+
+_VERSION_PREFIX = re.compile(r"^/*\d+/")
+
+
+def match_profile(path: str, profiles: Iterable[str]) -> str | None:
+    """Find the most specific profile matching the given request path.
+
+    Profiles are keyed by API paths without the version prefix. A profile matches the path itself
+    and all paths below it.
+
+    Returns:
+        Key of the matching profile or ``None`` if no profile matches.
+
+    """
+    api_path = _VERSION_PREFIX.sub("", path).strip("/")
+    matching = [
+        profile_path
+        for profile_path in profiles
+        if api_path == profile_path or api_path.startswith(f"{profile_path}/")
+    ]
+    return max(matching, key=len) if matching else None
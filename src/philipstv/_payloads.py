@@ -0,0 +1,28 @@
+import functools
+from dataclasses import dataclass
+from typing import Any
+
+from .model import APIObject
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """Request payload prepared in advance, sent without creating and dumping its model.
+
+    Both forms are shared by all the requests sending the payload, so they must not be modified.
+    """
+
+    data: Any
+    """JSON data of the payload, for transports without raw requests."""
+    body: bytes
+    """Encoded JSON data of the payload, for raw transports."""
+
+
+@functools.cache
+def fixed_payload(model: type[APIObject], field: str, value: str) -> EncodedPayload:
+    """Return the payload of the model with a single field, encoded once for each value.
+
+    Meant for payloads with a small set of possible values, e.g. key presses.
+    """
+    payload = model.model_validate({field: value})
+    return EncodedPayload(payload.dump(), payload.dump_json())
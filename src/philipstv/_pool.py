@@ -0,0 +1,306 @@
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from requests import Request
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPSConnectionPool, PoolManager
+from urllib3.connection import HTTPSConnection
+from urllib3.exceptions import EmptyPoolError
+from urllib3.util.wait import wait_for_read
+
+from .timing import current_recorder
+
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of connection pool usage counters of a :class:`~philipstv.PhilipsTV` instance."""
+
+    hits: int = 0
+    """Number of requests sent over an already open connection."""
+    misses: int = 0
+    """Number of requests which had to open a new connection."""
+    discarded: int = 0
+    """Number of connections closed after use, because the pool was already full."""
+    expired: int = 0
+    """Number of idle connections closed because they exceeded the keep-alive expiry."""
+    resumed: int = 0
+    """Number of new connections which resumed a previous TLS session, skipping the full
+    handshake."""
+
+
+class _PoolCounters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "discarded": 0, "expired": 0, "resumed": 0}
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**self._counts)
+
+
+class _SessionCachingSSLContext(ssl.SSLContext):
+    """SSL context resuming the last TLS session of the server when opening a new connection.
+
+    TLS handshake is the slowest part of opening a connection to the TV. Resuming the session
+    makes it much cheaper.
+    """
+
+    counters: _PoolCounters
+    _sessions: dict[str | None, ssl.SSLSession]
+    _sessions_lock: threading.Lock
+
+    def wrap_socket(  # type: ignore[override]
+        self,
+        sock: socket.socket,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str | None = None,
+        session: ssl.SSLSession | None = None,
+    ) -> ssl.SSLSocket:
+        if session is None:
+            with self._sessions_lock:
+                session = self._sessions.get(server_hostname)
+        recorder = current_recorder()
+        started = time.perf_counter() if recorder is not None else 0.0
+        ssl_sock = super().wrap_socket(
+            sock,
+            server_side=server_side,
+            do_handshake_on_connect=do_handshake_on_connect,
+            suppress_ragged_eofs=suppress_ragged_eofs,
+            server_hostname=server_hostname,
+            session=session,
+        )
+        if recorder is not None:
+            recorder.tls += time.perf_counter() - started
+        if ssl_sock.session_reused:
+            self.counters.increment("resumed")
+        self.save_session(ssl_sock)
+        return ssl_sock
+
+    def save_session(self, ssl_sock: ssl.SSLSocket) -> None:
+        # With TLS 1.3 the session ticket arrives after the handshake, so this is called again
+        # whenever the connection returns to the pool.
+        session = ssl_sock.session
+        if session is not None and (session.has_ticket or ssl_sock.version() != "TLSv1.3"):
+            with self._sessions_lock:
+                self._sessions[ssl_sock.server_hostname] = session
+
+
+def create_ssl_context(counters: _PoolCounters) -> _SessionCachingSSLContext:
+    """Create SSL context for connections to the TV, which doesn't verify certificates."""
+    context = _SessionCachingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.options |= ssl.OP_NO_COMPRESSION
+    context.counters = counters
+    context._sessions = {}
+    context._sessions_lock = threading.Lock()
+    return context
+
+
+def warm_pool(pool: HTTPSConnectionPool, connections: int, timeout: float | None) -> int:
+    """Open connections in the pool, so the following requests don't have to.
+
+    Returns:
+        Number of connections ready in the pool, which is limited by the pool size.
+
+    """
+    count = min(connections, pool.pool.maxsize if pool.pool is not None else 0)
+    conns: list[Any] = []
+    try:
+        for _ in range(count):
+            try:
+                conns.append(pool._get_conn(timeout=0))
+            except EmptyPoolError:
+                # All the other connections are in use, so they're already open.
+                break
+        cold_conns = [conn for conn in conns if conn.sock is None]
+        if cold_conns:
+            with ThreadPoolExecutor(max_workers=len(cold_conns)) as executor:
+                list(executor.map(lambda conn: _connect(conn, timeout), cold_conns))
+    finally:
+        for conn in conns:
+            pool._put_conn(conn)
+    return count
+
+
+def _connect(conn: Any, timeout: float | None) -> None:
+    conn.timeout = timeout
+    conn.connect()
+
+
+def _read_idle_records(sock: ssl.SSLSocket) -> bool:
+    """Process TLS records received on an idle connection, e.g. TLS 1.3 session tickets.
+
+    Returns:
+        Whether the connection is still usable, i.e. it wasn't closed and no data was received.
+
+    """
+    timeout = sock.gettimeout()
+    sock.setblocking(False)
+    try:
+        while wait_for_read(sock, timeout=0):
+            try:
+                # Either the end of the stream or data which isn't a response to any request.
+                sock.recv(1)
+                return False
+            except ssl.SSLWantReadError:
+                # Only records handled by the TLS layer itself were read.
+                pass
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(timeout)
+    return True
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """Connection recording the time of opening the TCP connection of a timed request."""
+
+    @property
+    def is_connected(self) -> bool:
+        # TLS 1.3 servers send session tickets after the handshake. On an idle connection they
+        # make the socket readable, which would look like the TV closed the connection.
+        sock = self.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.version() == "TLSv1.3":
+            if not _read_idle_records(sock):
+                return False
+            if isinstance(self.ssl_context, _SessionCachingSSLContext):
+                self.ssl_context.save_session(sock)
+        return super().is_connected
+
+    def _new_conn(self) -> socket.socket:
+        if (recorder := current_recorder()) is None:
+            return super()._new_conn()
+        started = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            recorder.connect += time.perf_counter() - started
+
+
+class _TrackingHTTPSConnectionPool(HTTPSConnectionPool):
+    """Connection pool counting connection reuse and closing connections idle for too long."""
+
+    ConnectionCls = _TimedHTTPSConnection
+    counters = _PoolCounters()
+    keepalive_expiry: float | None = None
+
+    def _get_conn(self, timeout: float | None = None) -> Any:
+        conn: Any = super()._get_conn(timeout)
+        idle_since = getattr(conn, "_philipstv_idle_since", None)
+        if (
+            self.keepalive_expiry is not None
+            and idle_since is not None
+            and conn.sock is not None
+            and time.monotonic() - idle_since > self.keepalive_expiry
+        ):
+            conn.close()
+            self.counters.increment("expired")
+        self.counters.increment("hits" if conn.sock is not None else "misses")
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None:
+            conn._philipstv_idle_since = time.monotonic()
+            if isinstance(conn.sock, ssl.SSLSocket) and isinstance(
+                conn.ssl_context, _SessionCachingSSLContext
+            ):
+                conn.ssl_context.save_session(conn.sock)
+            if self.pool is not None and self.pool.full():
+                self.counters.increment("discarded")
+        super()._put_conn(conn)
+
+
+def create_tracking_pool(
+    host: str,
+    port: int,
+    *,
+    maxsize: int,
+    block: bool,
+    keepalive_expiry: float | None,
+    counters: _PoolCounters,
+    **kwargs: Any,
+) -> _TrackingHTTPSConnectionPool:
+    """Create a standalone HTTPS connection pool for the given host, counting its usage."""
+    pool = _TrackingHTTPSConnectionPool(host, port, maxsize=maxsize, block=block, **kwargs)
+    pool.keepalive_expiry = keepalive_expiry
+    pool.counters = counters
+    return pool
+
+
+class _TrackingPoolManager(PoolManager):
+    def __init__(
+        self, *args: Any, keepalive_expiry: float | None, counters: _PoolCounters, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            **self.pool_classes_by_scheme,
+            "https": _TrackingHTTPSConnectionPool,
+        }
+        self.keepalive_expiry = keepalive_expiry
+        self.counters = counters
+
+    def _new_pool(
+        self, scheme: str, host: str, port: int, request_context: dict[str, Any] | None = None
+    ) -> Any:
+        pool = super()._new_pool(scheme, host, port, request_context)
+        if isinstance(pool, _TrackingHTTPSConnectionPool):
+            pool.keepalive_expiry = self.keepalive_expiry
+            pool.counters = self.counters
+        return pool
+
+
+class PoolingHTTPAdapter(HTTPAdapter):
+    """`requests` adapter using connection pools which track their usage."""
+
+    def __init__(
+        self,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keepalive_expiry: float | None = None,
+    ) -> None:
+        self.keepalive_expiry = keepalive_expiry
+        self.counters = _PoolCounters()
+        self.ssl_context = create_ssl_context(self.counters)
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TrackingPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            keepalive_expiry=self.keepalive_expiry,
+            counters=self.counters,
+            ssl_context=self.ssl_context,
+            **pool_kwargs,
+        )
+
+    def connection_pool(self, url: str) -> Any:
+        """Return the connection pool which will be used for requests to the given URL."""
+        request = Request("GET", url).prepare()
+        if hasattr(self, "get_connection_with_tls_context"):
+            return self.get_connection_with_tls_context(request, verify=False)
+        # `requests` < 2.32.2
+        return self.get_connection(url)
+
+    @property
+    def stats(self) -> PoolStats:
+        return self.counters.snapshot()
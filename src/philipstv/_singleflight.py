@@ -0,0 +1,55 @@
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from .exceptions import PhilipsTVTimeoutError
+from .timeouts import remaining_time
+
+_T = TypeVar("_T")
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: BaseException | None = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls with the same key.
+
+    While a call for the given key is in progress, other threads calling with the same key don't
+    run their function, but wait for the first call to finish and receive its result or exception.
+    Results are not cached: once the call finishes, the next call runs the function again.
+
+    Waiting threads respect their own :func:`~philipstv.timeouts.deadline`. If it expires before
+    the call finishes, they stop waiting and :class:`~philipstv.PhilipsTVTimeoutError` is raised.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, function: Callable[[], _T], method: str, url: str) -> _T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if is_leader:
+            try:
+                call.result = function()
+            except BaseException as exc:
+                call.exception = exc
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        elif not call.done.wait(timeout=remaining_time()):
+            raise PhilipsTVTimeoutError(method, url)
+
+        if call.exception is not None:
+            raise call.exception
+        result: _T = call.result
+        return result
@@ -0,0 +1,145 @@
+import codecs
+import json
+import re
+from collections.abc import Container, Iterable, Iterator
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]}])[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+
+
+class _Reader:
+    """JSON text decoded from chunks of UTF-8 bytes, keeping only the part not read yet."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+        self.reads = 0
+        """Number of chunks read so far."""
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, empty at the end of the text."""
+        while True:
+            self._pos = _WHITESPACE.match(self._text, self._pos).end()  # type: ignore[union-attr]
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Skip the given structural character.
+
+        Raises:
+            ValueError: If the next character is different.
+
+        """
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in the streamed JSON")
+        self._pos += 1
+
+    def separator(self, end: str) -> bool:
+        """Skip the separator following an item, return `False` if the container ends instead.
+
+        Raises:
+            ValueError: If there's neither the separator nor the given end of the container.
+
+        """
+        # Fast path for separators not split between the chunks.
+        if (match := _SEPARATOR.match(self._text, self._pos)) and match[1] in (",", end):
+            self._pos = match.end()
+            return match[1] == ","
+        if (char := self.peek()) not in (",", end):
+            raise ValueError(f"Expected ',' or {end!r} in the streamed JSON")
+        self._pos += 1
+        return char == ","
+
+    def value(self) -> Any:
+        """Decode the next JSON value, reading as many chunks as it spans.
+
+        Raises:
+            ValueError: If the value is malformed.
+
+        """
+        if self._pos == len(self._text) or self._text[self._pos] in _DELIMITERS:
+            self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # Values not followed by a delimiter, e.g. numbers, may continue in the next chunk.
+                if self._eof or (end < len(self._text) and self._text[end] in _DELIMITERS):
+                    self._pos = end
+                    return value
+            # Values are decoded from the start on each attempt, so the text is at least doubled
+            # before the next one to keep values spanning many chunks linear.
+            needed = 2 * (len(self._text) - self._pos)
+            while self._fill() and len(self._text) - self._pos < needed:
+                pass
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        self.reads += 1
+        self._eof = chunk is None
+        self._text = self._text[self._pos :] + self._decoder.decode(chunk or b"", final=self._eof)
+        self._pos = 0
+        return True
+
+
+def iter_array_batches(chunks: Iterable[bytes], keys: Container[str]) -> Iterator[list[Any]]:
+    """Decode the items of an array in a JSON object incrementally, as the chunks are read.
+
+    Items are yielded in batches of those decoded before reading the next chunk, so they can be
+    processed together as soon as they're received. Only the text of the items being decoded is
+    kept in memory, so huge arrays are processed with flat memory usage. The rest of the object
+    after the array isn't read.
+
+    Args:
+        chunks: Consecutive chunks of the UTF-8 encoded JSON object.
+        keys: Accepted keys of the array in the object. The first one found is used.
+
+    Yields:
+        Non-empty lists of consecutive decoded array items.
+
+    Raises:
+        ValueError: If the JSON is malformed or doesn't contain the array.
+
+    """
+    reader = _Reader(chunks)
+    reader.expect("{")
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError("Expected a string key in the streamed JSON object")
+        reader.expect(":")
+        if key in keys:
+            break
+        reader.value()
+        if not reader.separator("}"):
+            raise ValueError("Array not found in the streamed JSON object")
+
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    batch: list[Any] = []
+    reads = reader.reads
+    while True:
+        item = reader.value()
+        if reader.reads != reads:
+            # The item needed the next chunk, so it starts a new batch.
+            if batch:
+                yield batch
+            batch, reads = [], reader.reads
+        batch.append(item)
+        if not reader.separator("]"):
+            yield batch
+            return
@@ -1,8 +1,13 @@
 import hmac
+import json
+import os
 import random
 import string
+import tempfile
 from base64 import b64encode
 from hashlib import sha256
+from pathlib import Path
+from typing import Any
 
 
 def create_device_id() -> str:
@@ -14,3 +19,26 @@ def create_device_id() -> str:
 
 def create_signature(secret: bytes, message: bytes) -> bytes:
     return b64encode(hmac.new(secret, message, sha256).hexdigest().encode())
+
+
+def read_json_object(path: Path) -> dict[str, Any]:
+    """Return the JSON object stored in the file, or an empty dict if there's none."""
+    try:
+        data = json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json_object(path: Path, data: dict[str, Any]) -> None:
+    """Atomically replace the file with the JSON object, creating its directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique name for every writer, so that concurrent writers don't replace each other's file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
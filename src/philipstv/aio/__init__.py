@@ -0,0 +1,11 @@
+"""Asynchronous (`asyncio`) interface to the TV.
+
+Requires optional dependencies, install the package as ``philipstv[async]``.
+"""
+
+from .api import AsyncPhilipsTVAPI
+from .pairing import AsyncPhilipsTVPairer
+from .remote import AsyncPhilipsTVRemote
+from .tv import AsyncPhilipsTV
+
+__all__ = ["AsyncPhilipsTV", "AsyncPhilipsTVAPI", "AsyncPhilipsTVPairer", "AsyncPhilipsTVRemote"]
@@ -0,0 +1,392 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable, Mapping
+from types import TracebackType
+from typing import Any, TypeVar
+
+from ..api import (
+    _dump,
+    _dump_json,
+    _fixed,
+    _Payload,
+    _wrap_unauthorized_exceptions,
+    _wrap_validation_exceptions,
+)
+from ..exceptions import PhilipsError, PhilipsTVAPIMalformedResponseError, PhilipsTVError
+from ..keys import KeyBurst, KeyPress, key_payloads
+from ..model import (
+    AllChannels,
+    AmbilightColors,
+    AmbilightColorSettings,
+    AmbilightMode,
+    AmbilightPower,
+    AmbilightPowerValue,
+    AmbilightTopology,
+    APIObject,
+    Applications,
+    ApplicationShort,
+    CurrentChannel,
+    CurrentSetting,
+    CurrentSettings,
+    CurrentSettingsPayload,
+    CurrentVolume,
+    InputKey,
+    InputKeyValue,
+    NotifyChangePayload,
+    NotifyChangeResponse,
+    PairingGrantPayload,
+    PairingRequestPayload,
+    PairingRequestResponse,
+    PairingResponse,
+    PowerState,
+    PowerStateValue,
+    SetChannel,
+    Volume,
+)
+from ..notify import DEFAULT_WATCHED_NODES, Change, _ChangeTracker
+from ..settings import DEFAULT_SETTINGS_CHUNK_SIZE, settings_by_node, settings_payloads
+from ..snapshot import SNAPSHOT_FIELDS, TVSnapshot, build_snapshot, snapshot_getters
+from ..types import Credentials
+from .tv import AsyncPhilipsTV
+
+_T = TypeVar("_T", bound=APIObject)
+
+
+class AsyncPhilipsTVAPI:
+    """Asynchronous wrapper around Philips TV API.
+
+    This is an `asyncio` counterpart of :class:`~philipstv.PhilipsTVAPI`. Its methods accept and
+    return the same models, but all of them are coroutines, and :func:`changes` is an asynchronous
+    iterator instead of the :func:`~philipstv.PhilipsTVAPI.subscribe` callback.
+
+    Some features are available only in the synchronous API:
+
+    - :func:`~philipstv.PhilipsTVAPI.get_system` and :func:`~philipstv.PhilipsTVAPI.probe`, so the
+      API version has to be set in :attr:`api_version` by hand.
+    - :func:`~philipstv.PhilipsTVAPI.iter_all_channels`.
+    - The ``coalesce``, ``timing_sink``, ``cache`` and ``validation`` options.
+
+    """
+
+    def __init__(self, tv: AsyncPhilipsTV, *, fast_json: bool = False) -> None:
+        """
+        Args:
+            tv: Instance of the :class:`AsyncPhilipsTV` to which the API requests will be sent.
+            fast_json: Validate responses directly from the raw response bytes and send
+                pre-encoded payloads, see :class:`~philipstv.PhilipsTVAPI`.
+
+        """
+        self._tv = tv
+        self._fast_json = fast_json
+        self.api_version = 6
+
+    @property
+    def host(self) -> str:
+        """IP address of the underlying :class:`AsyncPhilipsTV` instance.
+
+        Warning:
+            This value is read-only.
+
+        """
+        return self._tv.host
+
+    @property
+    def auth(self) -> Credentials | None:
+        """Credentials used for authentication in the underlying :class:`AsyncPhilipsTV` instance.
+
+        Hint:
+            This value can be set and changed at any moment during :class:`AsyncPhilipsTVAPI`
+            usage.
+
+        """
+        return self._tv.auth
+
+    @auth.setter
+    def auth(self, auth: Credentials | None) -> None:
+        self._tv.auth = auth
+
+    async def aclose(self) -> None:
+        """Close the underlying :class:`AsyncPhilipsTV` instance."""
+        await self._tv.aclose()
+
+    async def __aenter__(self) -> "AsyncPhilipsTVAPI":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def pair_request(self, payload: PairingRequestPayload) -> PairingRequestResponse:
+        """Send request initiating the pairing process.
+
+        Use :func:`pair_grant` to finalize the pairing using data from response to this request.
+
+        Args:
+            payload: Request payload.
+
+        Returns:
+            The TV response containing authentication details.
+
+        """
+        return await self._api_post_model("pair/request", PairingRequestResponse, payload)
+
+    async def pair_grant(self, payload: PairingGrantPayload) -> PairingResponse:
+        """Send request finalizing the pairing process.
+
+        This requires some data from response to request initiating the pairing:
+        :func:`pair_request`.
+
+        Args:
+            payload: Request payload.
+
+        Returns:
+            The TV response containing pairing confirmation or rejection.
+
+        """
+        return await self._api_post_model("pair/grant", PairingResponse, payload)
+
+    async def get_powerstate(self) -> PowerState:
+        """Send request to get the current power state."""
+        return await self._api_get_model("powerstate", PowerState)
+
+    async def set_powerstate(self, powerstate: PowerState | PowerStateValue) -> None:
+        """Send request to set the power state.
+
+        The value can be given directly, in which case the request body is encoded only once for
+        each value.
+        """
+        await self._api_post("powerstate", _fixed(PowerState, "powerstate", powerstate))
+
+    async def get_volume(self) -> CurrentVolume:
+        """Send request to get the current volume, mute status, and volume limits."""
+        return await self._api_get_model("audio/volume", CurrentVolume)
+
+    async def set_volume(self, volume: Volume) -> None:
+        """Send request to set the volume."""
+        await self._api_post("audio/volume", volume)
+
+    async def get_current_channel(self) -> CurrentChannel:
+        """Send request to get current TV app activity."""
+        return await self._api_get_model("activities/tv", CurrentChannel)
+
+    async def get_all_channels(self) -> AllChannels:
+        """Send request to get all available channels."""
+        return await self._api_get_model("channeldb/tv/channelLists/all", AllChannels)
+
+    async def set_channel(self, channel: SetChannel) -> None:
+        """Send request to set the channel."""
+        await self._api_post("activities/tv", channel)
+
+    async def input_key(self, key: InputKey | InputKeyValue) -> None:
+        """Send request to simulate pressing key on the remote.
+
+        The key value can be given directly, in which case the request body is encoded only once
+        for each key, which makes bursts of key presses cheaper.
+        """
+        await self._api_post("input/key", _fixed(InputKey, "key", key))
+
+    async def input_keys(
+        self, keys: Iterable[InputKey | InputKeyValue], *, interval: float = 0.0
+    ) -> KeyBurst:
+        """Send requests simulating a sequence of key presses, e.g. a channel number and ``OK``.
+
+        See :func:`philipstv.PhilipsTVAPI.input_keys`. The `httpx` client keeps the connection
+        open between the keys, but it isn't opened in advance.
+        """
+        presses: list[KeyPress] = []
+        started = time.perf_counter()
+        for index, (key, payload) in enumerate(key_payloads(keys)):
+            delay = started + index * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            sent_at = time.perf_counter()
+            try:
+                await self._api_post("input/key", payload)
+            except PhilipsError as exc:
+                return KeyBurst(tuple(presses), key, exc)
+            presses.append(KeyPress(key, sent_at - started, time.perf_counter() - sent_at))
+        return KeyBurst(tuple(presses))
+
+    async def get_ambilight_power(self) -> AmbilightPower:
+        """Send request to get Ambilight power state."""
+        return await self._api_get_model("ambilight/power", AmbilightPower)
+
+    async def set_ambilight_power(self, power: AmbilightPower | AmbilightPowerValue) -> None:
+        """Send request to set Ambilight power state.
+
+        The value can be given directly, in which case the request body is encoded only once for
+        each value.
+        """
+        await self._api_post("ambilight/power", _fixed(AmbilightPower, "power", power))
+
+    async def get_ambilight_topology(self) -> AmbilightTopology:
+        """Send request to get Ambilight topology."""
+        return await self._api_get_model("ambilight/topology", AmbilightTopology)
+
+    async def get_ambilight_mode(self) -> AmbilightMode:
+        """Send request to get current Ambilight mode."""
+        return await self._api_get_model("ambilight/mode", AmbilightMode)
+
+    async def set_ambilight_mode(self, mode: AmbilightMode) -> None:
+        """Send request to set ambilight mode."""
+        await self._api_post("ambilight/mode", mode)
+
+    async def get_ambilight_measured(self) -> AmbilightColors:
+        """Send request to get measured color values from Ambilight system.
+
+        See :func:`philipstv.PhilipsTVAPI.get_ambilight_measured`.
+        """
+        return await self._api_get_model("ambilight/measured", AmbilightColors)
+
+    async def get_ambilight_processed(self) -> AmbilightColors:
+        """Send request to get processed color values from Ambilight system.
+
+        See :func:`philipstv.PhilipsTVAPI.get_ambilight_processed`.
+        """
+        return await self._api_get_model("ambilight/processed", AmbilightColors)
+
+    async def get_ambilight_cached(self) -> AmbilightColors:
+        """Send request to get cached color values from Ambilight system.
+
+        See :func:`philipstv.PhilipsTVAPI.get_ambilight_cached`.
+        """
+        return await self._api_get_model("ambilight/cached", AmbilightColors)
+
+    async def set_ambilight_cached(self, colors: AmbilightColorSettings) -> None:
+        """Send request to set cached color values in Ambilight system.
+
+        See :func:`philipstv.PhilipsTVAPI.set_ambilight_cached`.
+        """
+        await self._api_post("ambilight/cached", colors)
+
+    async def get_applications(self) -> Applications:
+        """Send request to get the list of installed applications."""
+        return await self._api_get_model("applications", Applications)
+
+    async def launch_application(self, application: ApplicationShort) -> None:
+        """Send request to launch an application activity.
+
+        See :func:`philipstv.PhilipsTVAPI.launch_application`.
+        """
+        await self._api_post("activities/launch", application)
+
+    async def get_current_settings(self, payload: CurrentSettingsPayload) -> CurrentSettings:
+        """Send request to read the current values of the given menu settings.
+
+        See :func:`philipstv.PhilipsTVAPI.get_current_settings`.
+        """
+        return await self._api_post_model("menuitems/settings/current", CurrentSettings, payload)
+
+    async def get_settings(
+        self, nodes: Iterable[int], *, chunk_size: int = DEFAULT_SETTINGS_CHUNK_SIZE
+    ) -> dict[int, CurrentSetting]:
+        """Read the current values of many menu settings in as few requests as possible.
+
+        See :func:`philipstv.PhilipsTVAPI.get_settings`.
+        """
+        return settings_by_node(
+            [
+                await self.get_current_settings(payload)
+                for payload in settings_payloads(nodes, chunk_size)
+            ]
+        )
+
+    async def get_snapshot(self, fields: Iterable[str] = SNAPSHOT_FIELDS) -> TVSnapshot:
+        """Fetch the current state of the TV, sending the requests concurrently.
+
+        See :func:`philipstv.PhilipsTVAPI.get_snapshot`.
+        """
+        getters = snapshot_getters(fields)
+
+        async def fetch(getter: str) -> APIObject | PhilipsError:
+            try:
+                result: APIObject = await getattr(self, getter)()
+            except PhilipsError as exc:
+                return exc
+            return result
+
+        results = await asyncio.gather(*(fetch(getter) for getter in getters.values()))
+        return build_snapshot(dict(zip(getters, results, strict=True)))
+
+    async def notify_change(self, payload: NotifyChangePayload) -> NotifyChangeResponse:
+        """Send long-poll request waiting until any of the given nodes changes.
+
+        See :func:`philipstv.PhilipsTVAPI.notify_change`.
+        """
+        return await self._api_post_model("notifychange", NotifyChangeResponse, payload)
+
+    async def changes(
+        self,
+        nodes: Mapping[str, type[APIObject]] = DEFAULT_WATCHED_NODES,
+        poll_interval: float = 1.0,
+    ) -> AsyncIterator[Change]:
+        """Iterate over the changes of the watched nodes, forever.
+
+        Counterpart of :func:`philipstv.PhilipsTVAPI.subscribe`, with the same behaviour, but the
+        changes are yielded instead of passed to a callback. Stop iterating to stop watching::
+
+            async for change in api.changes():
+                print(change.node, change.value)
+
+        """
+        tracker = _ChangeTracker(nodes, poll_interval)
+        while True:
+            try:
+                changes = await self._next_changes(tracker)
+            except PhilipsTVError as exc:
+                await asyncio.sleep(tracker.error_delay(exc))
+                continue
+            for change in changes:
+                yield change
+            await asyncio.sleep(tracker.delay(changes))
+
+    async def _next_changes(self, tracker: _ChangeTracker) -> list[Change]:
+        if tracker.polling:
+            values = await asyncio.gather(*(self._api_get_json(node) for node in tracker.nodes))
+            return tracker.update(dict(zip(tracker.nodes, values, strict=True)))
+        try:
+            response = await self.notify_change(tracker.notify_payload())
+        except (PhilipsTVError, PhilipsTVAPIMalformedResponseError) as exc:
+            tracker.handle_notify_error(exc)
+            return []
+        return tracker.update(response.root)
+
+    async def _api_post_model(
+        self, path: str, resp_model: type[_T], payload: APIObject | None = None
+    ) -> _T:
+        raw_response = await self._api_post(path, payload)
+        with _wrap_validation_exceptions("POST", path, raw_response):
+            return self._parse(resp_model, raw_response)
+
+    async def _api_get_model(self, path: str, response_model: type[_T]) -> _T:
+        raw_response = await self._api_get(path)
+        with _wrap_validation_exceptions("GET", path, raw_response):
+            return self._parse(response_model, raw_response)
+
+    async def _api_post(self, path: str, payload: _Payload = None) -> Any:
+        with _wrap_unauthorized_exceptions("POST", path):
+            if self._fast_json:
+                return await self._tv.post_raw(self._api_path(path), _dump_json(payload))
+            return await self._tv.post(self._api_path(path), _dump(payload))
+
+    async def _api_get_json(self, path: str) -> Any:
+        with _wrap_unauthorized_exceptions("GET", path):
+            return await self._tv.get(self._api_path(path))
+
+    async def _api_get(self, path: str) -> Any:
+        with _wrap_unauthorized_exceptions("GET", path):
+            if self._fast_json:
+                return await self._tv.get_raw(self._api_path(path))
+            return await self._tv.get(self._api_path(path))
+
+    def _parse(self, model: type[_T], raw_response: Any) -> _T:
+        if self._fast_json:
+            return model.parse_json(raw_response or b"null")
+        return model.parse(raw_response)
+
+    def _api_path(self, path: str) -> str:
+        return f"{self.api_version}/{path}"
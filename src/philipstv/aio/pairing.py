@@ -0,0 +1,52 @@
+from ..exceptions import PhilipsTVPairingError
+from ..model import DeviceInfo
+from ..pairing import PinCallback, _BasePairer
+from ..types import Credentials
+from .api import AsyncPhilipsTVAPI
+
+
+class AsyncPhilipsTVPairer(_BasePairer):
+    """Asynchronous counterpart of :class:`~philipstv.PhilipsTVPairer`."""
+
+    def __init__(self, api: AsyncPhilipsTVAPI, device_info: DeviceInfo) -> None:
+        """
+        Args:
+            api: :class:`AsyncPhilipsTVAPI` instance with which pairing will be performed.
+            device_info: Informations about the device which requests the pairing.
+                See :class:`~philipstv.PhilipsTVPairer`.
+        """
+        self._api: AsyncPhilipsTVAPI = api
+        self.device_info = device_info
+
+    async def pair(self, pin_callback: PinCallback) -> Credentials:
+        """Perfom the pairing.
+
+        See :func:`philipstv.PhilipsTVPairer.pair`.
+
+        Args:
+            pin_callback: Callback function which should return the PIN displayed on the TV
+                screen as a string.
+
+        Returns:
+            Authentication credentials tuple.
+
+        """
+        self._api.auth = None
+        pair_response = await self._api.pair_request(self._get_request_payload())
+
+        is_success = pair_response.error_id == "SUCCESS"
+        if not (is_success and pair_response.auth_key and pair_response.timestamp):
+            raise PhilipsTVPairingError(pair_response)
+
+        pair_pin = pin_callback()
+
+        self._api.auth = (self.device_info.id, pair_response.auth_key)
+        grant_response = await self._api.pair_grant(
+            self._get_grant_payload(pair_pin, pair_response.timestamp)
+        )
+
+        if grant_response.error_id != "SUCCESS":
+            self._api.auth = None
+            raise PhilipsTVPairingError(grant_response)
+
+        return (self.device_info.id, pair_response.auth_key)
@@ -0,0 +1,351 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from types import TracebackType
+
+from .._channels import DEFAULT_CHANNELS_TTL, ChannelIndex
+from .._utils import create_device_id
+from ..exceptions import PhilipsTVAPIMalformedResponseError, PhilipsTVError, PhilipsTVRemoteError
+from ..model import (
+    AmbilightColor,
+    AmbilightPowerValue,
+    AmbilightTopology,
+    Application,
+    ChannelID,
+    InputKeyValue,
+    PowerStateValue,
+    SetChannel,
+    Volume,
+)
+from ..notify import Change
+from ..pairing import PinCallback
+from ..remote import _create_ambilight_colors, _create_device_info
+from ..snapshot import STATE_FIELDS, TVState, state_from_snapshot, state_snapshot_fields
+from ..types import Credentials
+from .api import AsyncPhilipsTVAPI
+from .pairing import AsyncPhilipsTVPairer
+from .tv import AsyncPhilipsTV
+
+
+class AsyncPhilipsTVRemote:
+    """Asynchronous high level interface to the TV.
+
+    This is an `asyncio` counterpart of :class:`~philipstv.PhilipsTVRemote`. It has the same
+    methods, but all the ones communicating with the TV are coroutines. Caches of channels,
+    applications and Ambilight topology are guarded by locks, so concurrently running coroutines
+    share a single request filling the cache::
+
+        async with AsyncPhilipsTVRemote.new("192.168.0.100", ("id", "key")) as remote:
+            await asyncio.gather(remote.set_volume(10), remote.set_channel("TVN HD"))
+
+    """
+
+    def __init__(
+        self, api: AsyncPhilipsTVAPI, *, channels_ttl: float = DEFAULT_CHANNELS_TTL
+    ) -> None:
+        """
+        Args:
+            api: Instance of an API to be used by the remote.
+            channels_ttl: See :class:`philipstv.PhilipsTVRemote`.
+
+        """
+        self._api = api
+        self._channels_cache: ChannelIndex | None = None
+        self._channels_version: tuple[str, str] | None = None
+        self._channels_ttl = channels_ttl
+        self._channels_checked_at = 0.0
+        self._channels_lock = asyncio.Lock()
+        self._applications_cache: list[Application] = []
+        self._applications_lock = asyncio.Lock()
+        self._ambilight_topology_cache: AmbilightTopology | None = None
+        self._ambilight_topology_lock = asyncio.Lock()
+
+    @property
+    def host(self) -> str:
+        """IP address of the underlying :class:`AsyncPhilipsTVAPI` instance.
+
+        Warning:
+            This value is read-only.
+
+        """
+        return self._api.host
+
+    @property
+    def auth(self) -> Credentials | None:
+        """Credentials used for authentication in the underlying :class:`AsyncPhilipsTVAPI`.
+
+        Hint:
+            This value can be set and changed at any moment during :class:`AsyncPhilipsTVRemote`
+            usage.
+
+        """
+        return self._api.auth
+
+    @auth.setter
+    def auth(self, value: Credentials | None) -> None:
+        self._api.auth = value
+
+    @classmethod
+    def new(
+        cls,
+        host: str,
+        auth: Credentials | None = None,
+        *,
+        channels_ttl: float = DEFAULT_CHANNELS_TTL,
+    ) -> "AsyncPhilipsTVRemote":
+        """Create a new remote for given host without the need to inject
+        :class:`AsyncPhilipsTVAPI` instance.
+
+        Args:
+            host: IP address of the TV.
+            auth: Authentication credentials. If not given, the only feature you will be able to
+                use is pairing: :func:`pair`.
+            channels_ttl: See :class:`philipstv.PhilipsTVRemote`.
+
+        """
+        return cls(
+            AsyncPhilipsTVAPI(AsyncPhilipsTV(host=host, auth=auth)), channels_ttl=channels_ttl
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying :class:`AsyncPhilipsTVAPI` instance."""
+        await self._api.aclose()
+
+    async def __aenter__(self) -> "AsyncPhilipsTVRemote":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def pair(self, pin_callback: PinCallback, id: str | None = None) -> Credentials:
+        """Perform pairing with the TV.
+
+        See :func:`philipstv.PhilipsTVRemote.pair`.
+
+        Args:
+            pin_callback: A function taking no arguments and returning the PIN displayed
+                on TV as a string.
+            id: Device ID to use for pairing.
+
+        Returns:
+            A tuple of acquired authentication credentials.
+
+        """
+        pairer = AsyncPhilipsTVPairer(self._api, _create_device_info(id or create_device_id()))
+        return await pairer.pair(pin_callback)
+
+    async def get_power(self) -> bool:
+        """Return the current power state.
+
+        Returns:
+            A power state. `True` means on, `False` means standby.
+
+        """
+        return (await self._api.get_powerstate()).powerstate == PowerStateValue.ON
+
+    async def set_power(self, power: bool) -> None:
+        """Set current power state.
+
+        Args:
+            power: Power state to set. `True` means on, `False` means standby.
+
+        """
+        value = PowerStateValue.ON if power is True else PowerStateValue.STANDBY
+        await self._api.set_powerstate(value)
+
+    async def get_volume(self) -> int:
+        """Return current volume."""
+        return (await self._api.get_volume()).current
+
+    async def set_volume(self, volume: int) -> None:
+        """Set current volume.
+
+        Args:
+            volume: Volume value to set.
+
+        """
+        await self._api.set_volume(Volume(current=volume))
+
+    async def get_current_channel(self) -> str:
+        """Return current TV channel.
+
+        Returns:
+            Current TV channel name.
+
+        """
+        return (await self._api.get_current_channel()).channel.name
+
+    async def set_channel(self, channel: int | str) -> None:
+        """Change to the given TV channel.
+
+        The channel list is cached, and downloaded again only if its version changes.
+
+        Channels are looked up by number or by name. Names are matched exactly, or ignoring the
+        case if no channel has the exact name.
+
+        Args:
+            channel: Number or name of the channel to change to.
+
+        Raises:
+            PhilipsTVRemoteAmbiguousChannelError: If more than one channel has the given number or
+                name.
+            PhilipsTVRemoteError: If invalid channel number or name is given.
+
+        """
+        found_channel = (await self._get_channels()).find(channel)
+
+        await self._api.set_channel(SetChannel(channel=ChannelID(ccid=found_channel.ccid)))
+
+    async def get_all_channels(self) -> dict[int, str]:
+        """Return all available channels and their numbers.
+
+        The list is downloaded again only if its version changed since the last download.
+
+        Returns:
+            A mapping of channel number to channel name.
+
+        """
+        channels = await self._get_channels()
+        return {int(channel.preset): channel.name for channel in channels.channels}
+
+    async def _get_channels(self) -> ChannelIndex:
+        async with self._channels_lock:
+            if (
+                self._channels_cache
+                and time.monotonic() - self._channels_checked_at < self._channels_ttl
+            ):
+                return self._channels_cache
+            version = await self._current_channels_version()
+            if not self._channels_cache or version is None or version != self._channels_version:
+                all_channels = await self._api.get_all_channels()
+                self._channels_cache = ChannelIndex(all_channels.channel)
+                self._channels_version = version
+            self._channels_checked_at = time.monotonic()
+            return self._channels_cache
+
+    async def _current_channels_version(self) -> tuple[str, str] | None:
+        try:
+            channel_list = (await self._api.get_current_channel()).channel_list
+        except (PhilipsTVError, PhilipsTVAPIMalformedResponseError):
+            return None
+        return channel_list.id, channel_list.version
+
+    async def input_key(self, key: InputKeyValue) -> None:
+        """Emulate pressing a key on the TV remote.
+
+        Args:
+            key: A key value to send to the TV.
+
+        """
+        await self._api.input_key(key)
+
+    async def get_ambilight_power(self) -> bool:
+        """Return current ambilight power state.
+
+        Returns:
+            Ambilight power state. `True` means on, `False` means off.
+
+        """
+        return (await self._api.get_ambilight_power()).power == AmbilightPowerValue.ON
+
+    async def set_ambilight_power(self, power: bool) -> None:
+        """Set ambilight power state.
+
+        Args:
+            power: Ambilight power state to set. `True` means on, `False` means off.
+
+        """
+        value = AmbilightPowerValue.ON if power is True else AmbilightPowerValue.OFF
+        await self._api.set_ambilight_power(value)
+
+    async def set_ambilight_color(
+        self,
+        color: AmbilightColor | None = None,
+        *,
+        left: AmbilightColor | None = None,
+        top: AmbilightColor | None = None,
+        right: AmbilightColor | None = None,
+        bottom: AmbilightColor | None = None,
+    ) -> None:
+        """Set ambilight color.
+
+        See :func:`philipstv.PhilipsTVRemote.set_ambilight_color`.
+
+        Args:
+            color: A color to set on all sides.
+            left: A color to set on the left side.
+            top: A color to set on the top side.
+            right: A color to set on the right side.
+            bottom: A color to set on the bottom side.
+
+        """
+        if color and not any((left, top, right, bottom)):
+            await self._api.set_ambilight_cached(color)
+            return
+
+        async with self._ambilight_topology_lock:
+            if not self._ambilight_topology_cache:
+                self._ambilight_topology_cache = await self._api.get_ambilight_topology()
+
+        colors = _create_ambilight_colors(
+            self._ambilight_topology_cache, color, left, top, right, bottom
+        )
+        await self._api.set_ambilight_cached(colors)
+
+    async def get_applications(self) -> list[str]:
+        """Return a list of available applications.
+
+        Returns:
+            List of application names.
+
+        """
+        async with self._applications_lock:
+            self._applications_cache = (await self._api.get_applications()).applications
+        return [app.label for app in self._applications_cache]
+
+    async def launch_application(self, application: str) -> None:
+        """Launch an application.
+
+        Args:
+            application: An application name.
+
+        Raises:
+            PhilipsTVRemoteError: If invalid application name is given.
+
+        """
+        async with self._applications_lock:
+            if not self._applications_cache:
+                self._applications_cache = (await self._api.get_applications()).applications
+
+        matching = filter(lambda app: app.label == application, self._applications_cache)
+
+        found_application = next(matching, None)
+        if not found_application:
+            raise PhilipsTVRemoteError(f"Application '{application}' not available")
+
+        await self._api.launch_application(found_application)
+
+    async def get_state(self, fields: Iterable[str] = STATE_FIELDS) -> TVState:
+        """Return the current state of the TV, fetching all its parts concurrently.
+
+        See :func:`philipstv.PhilipsTVRemote.get_state`.
+        """
+        return state_from_snapshot(await self._api.get_snapshot(state_snapshot_fields(fields)))
+
+    async def changes(self, poll_interval: float = 1.0) -> AsyncIterator[Change]:
+        """Iterate over the changes of the power state, volume and current channel, forever.
+
+        See :func:`philipstv.PhilipsTVRemote.subscribe` and
+        :func:`AsyncPhilipsTVAPI.changes`.
+
+        Args:
+            poll_interval: Number of seconds between requests when polling or retrying.
+
+        """
+        async for change in self._api.changes(poll_interval=poll_interval):
+            yield change
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from types import TracebackType
+from typing import Any, TypeVar
+from urllib.parse import urljoin
+
+import httpx
+
+from ..circuit import CircuitBreaker
+from ..exceptions import PhilipsTVConnectTimeoutError, PhilipsTVError, PhilipsTVTimeoutError
+from ..ratelimit import RateLimiter
+from ..timeouts import DEFAULT_TIMEOUT, DEFAULT_TIMEOUT_PROFILES, Timeout, timeout_for
+from ..types import Credentials
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@contextmanager
+def _wrap_http_exceptions(method: str, url: str) -> Iterator[None]:
+    try:
+        yield
+    except httpx.ConnectTimeout as exc:
+        raise PhilipsTVConnectTimeoutError(method, url) from exc
+    except (httpx.TimeoutException, asyncio.TimeoutError) as exc:
+        raise PhilipsTVTimeoutError(method, url) from exc
+    except httpx.HTTPStatusError as exc:
+        raise PhilipsTVError(method, url, exc.response.status_code) from exc
+    except httpx.HTTPError as exc:
+        raise PhilipsTVError(method, url) from exc
+
+
+class AsyncPhilipsTV:
+    """Lowest level asynchronous interface with the TV.
+
+    This is an `asyncio` counterpart of :class:`~philipstv.PhilipsTV`. It exposes the same
+    :func:`get` and :func:`post` contract, but both methods are coroutines, so any number of
+    concurrent requests can be served by a single event loop.
+
+    Authentication, exception handling, logging and URL building are handled the same way as in
+    :class:`~philipstv.PhilipsTV`. Underlying connections should be released using :func:`aclose`
+    or by using the instance as an asynchronous context manager::
+
+        async with AsyncPhilipsTV("192.168.0.100", auth=("id", "key")) as tv:
+            await tv.get("6/powerstate")
+
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 1926,
+        auth: Credentials | None = None,
+        *,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        timeout_profiles: Mapping[str, Timeout] = DEFAULT_TIMEOUT_PROFILES,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """
+        Args:
+            host: TV IP address to connect to.
+            port: TV port to connect to.
+            auth: Authentication credentials tuple.
+            timeout: Timeout of requests to paths without a specific profile.
+            timeout_profiles: Timeouts of specific API paths, see
+                :data:`~philipstv.timeouts.DEFAULT_TIMEOUT_PROFILES`.
+            circuit_breaker: Breaker making requests fail fast while the TV is unreachable.
+                ``None`` disables it.
+            rate_limiter: Limiter of the rate of requests sent to the TV. ``None`` disables it.
+
+        """
+        self.host = host
+        self.port = port
+        self.url = f"https://{self.host}:{self.port}"
+        self.timeout = timeout
+        self.timeout_profiles = timeout_profiles
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+
+        self._auth: Credentials | None = None
+        self._client = self._create_client()
+        self.auth = auth
+
+    @property
+    def auth(self) -> Credentials | None:
+        """Credentials used for authentication.
+
+        Hint:
+            This value can be set and changed at any moment during :class:`AsyncPhilipsTV` usage.
+
+        """
+        return self._auth
+
+    @auth.setter
+    def auth(self, value: Credentials | None) -> None:
+        self._client.auth = httpx.DigestAuth(*value) if value else httpx.Auth()
+        self._auth = value
+
+    async def post(self, path: str, payload: Any = None) -> Any:
+        """Send `POST` request.
+
+        Args:
+            path: The path to send the request to.
+            payload: Request payload to send.
+
+        Returns:
+            The TV's JSON response body or ``None``.
+
+        """
+        _LOGGER.debug("Request: POST %s %s", path, payload)
+        return self._decode(await self._request("POST", path, json=payload))
+
+    async def get(self, path: str) -> Any:
+        """Send `GET` request.
+
+        Args:
+            path: The path to send the request to.
+
+        Returns:
+            The TV's JSON response body or ``None``.
+
+        """
+        _LOGGER.debug("Request: GET %s", path)
+        return self._decode(await self._request("GET", path))
+
+    async def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        """Send `POST` request with already encoded JSON body.
+
+        Unlike :func:`post`, the response body is returned as is, without decoding it.
+
+        Args:
+            path: The path to send the request to.
+            body: JSON encoded request payload to send.
+
+        Returns:
+            The TV's raw response body, empty if the response had no body.
+
+        """
+        _LOGGER.debug("Request: POST %s %r", path, body)
+        headers = _JSON_HEADERS if body is not None else None
+        response = await self._request("POST", path, content=body, headers=headers)
+        _LOGGER.debug("Response: %s %r", response.status_code, response.content)
+        return response.content
+
+    async def get_raw(self, path: str) -> bytes:
+        """Send `GET` request.
+
+        Unlike :func:`get`, the response body is returned as is, without decoding it.
+
+        Args:
+            path: The path to send the request to.
+
+        Returns:
+            The TV's raw response body, empty if the response had no body.
+
+        """
+        _LOGGER.debug("Request: GET %s", path)
+        response = await self._request("GET", path)
+        _LOGGER.debug("Response: %s %r", response.status_code, response.content)
+        return response.content
+
+    async def aclose(self) -> None:
+        """Close all underlying connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPhilipsTV":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        url = urljoin(self.url, path)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire(method, url, path)
+        timeout = self._request_timeout(method, url, path)
+        with (
+            self.circuit_breaker.guard(method, url) if self.circuit_breaker else nullcontext(),
+            _wrap_http_exceptions(method, url),
+        ):
+            response = await self._with_deadline(
+                self._client.request(method, url, timeout=self._httpx_timeout(timeout), **kwargs),
+                timeout,
+            )
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        response_body = response.json() if response.content else None
+        _LOGGER.debug("Response: %s %s", response.status_code, response_body)
+        return response_body
+
+    def _request_timeout(self, method: str, url: str, path: str) -> Timeout:
+        timeout = timeout_for(path, self.timeout, self.timeout_profiles)
+        if timeout.total is not None and timeout.total <= 0:
+            raise PhilipsTVTimeoutError(method, url)
+        return timeout
+
+    @staticmethod
+    def _httpx_timeout(timeout: Timeout) -> httpx.Timeout:
+        return httpx.Timeout(timeout.read, connect=timeout.connect)
+
+    @staticmethod
+    async def _with_deadline(awaitable: Awaitable[_T], timeout: Timeout) -> _T:
+        return await asyncio.wait_for(awaitable, timeout.total)
+
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(verify=False)
@@ -1,37 +1,89 @@
-from collections.abc import Iterator
-from contextlib import contextmanager
-from typing import Any, TypeVar
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, closing, contextmanager, nullcontext
+from types import TracebackType
+from typing import Any, TypeVar, cast
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json
 
 from philipstv.exceptions import (
+    PhilipsError,
     PhilipsTVAPIMalformedResponseError,
     PhilipsTVAPIUnauthorizedError,
+    PhilipsTVAPIUnsupportedError,
     PhilipsTVError,
 )
 
+from ._paths import match_profile
+from ._payloads import EncodedPayload, fixed_payload
+from ._singleflight import SingleFlight
+from ._stream import iter_array_batches
+from .cache import ResponseCache
+from .capabilities import PROBED_API_VERSIONS, Capabilities, CapabilityStore
+from .keys import KeyBurst, KeyPress, key_payloads
 from .model import (
     AllChannels,
     AmbilightColors,
     AmbilightColorSettings,
     AmbilightMode,
     AmbilightPower,
+    AmbilightPowerValue,
     AmbilightTopology,
     APIObject,
     Applications,
     ApplicationShort,
+    Channel,
     CurrentChannel,
+    CurrentSetting,
+    CurrentSettings,
+    CurrentSettingsPayload,
     CurrentVolume,
     InputKey,
+    InputKeyValue,
+    NotifyChangePayload,
+    NotifyChangeResponse,
     PairingGrantPayload,
     PairingRequestPayload,
     PairingRequestResponse,
     PairingResponse,
     PowerState,
+    PowerStateValue,
     SetChannel,
-    ValidationError,
+    SystemInfo,
     Volume,
 )
-from .tv import PhilipsTV
+from .notify import (
+    DEFAULT_WATCHED_NODES,
+    Change,
+    ChangeCallback,
+    ChangeSubscription,
+    _ChangeTracker,
+)
+from .settings import DEFAULT_SETTINGS_CHUNK_SIZE, settings_by_node, settings_payloads
+from .snapshot import (
+    SNAPSHOT_FIELDS,
+    TVSnapshot,
+    build_snapshot,
+    snapshot_getters,
+    snapshot_paths,
+)
+from .timing import TimingSink, _Recorder, current_recorder, record
+from .transport import (
+    PhilipsTVPooledTransport,
+    PhilipsTVRawTransport,
+    PhilipsTVStreamTransport,
+    PhilipsTVTransport,
+)
 from .types import Credentials
+from .validation import ValidationLevel
+
+_LOGGER = logging.getLogger(__name__)
 
 _T = TypeVar("_T", bound=APIObject)
 
@@ -50,10 +102,38 @@ def _wrap_unauthorized_exceptions(method: str, path: str) -> Iterator[None]:
 def _wrap_validation_exceptions(method: str, path: str, response: Any) -> Iterator[None]:
     try:
         yield
-    except ValidationError as exc:
+    # `ValidationError` is a `ValueError`, and so are JSON decoding errors of raw responses.
+    except ValueError as exc:
         raise PhilipsTVAPIMalformedResponseError(method, path, response) from exc
 
 
+@functools.cache
+def _list_adapter(model: type[_T]) -> TypeAdapter[list[_T]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+_Payload = APIObject | EncodedPayload | None
+
+
+def _fixed(
+    model: type[APIObject], field: str, value: APIObject | str
+) -> APIObject | EncodedPayload:
+    # Models are sent as they are, bare values use the payloads encoded once for each value.
+    return value if isinstance(value, APIObject) else fixed_payload(model, field, value)
+
+
+def _dump(payload: _Payload) -> Any:
+    if isinstance(payload, EncodedPayload):
+        return payload.data
+    return payload.dump() if payload else None
+
+
+def _dump_json(payload: _Payload) -> bytes | None:
+    if isinstance(payload, EncodedPayload):
+        return payload.body
+    return payload.dump_json() if payload else None
+
+
 class PhilipsTVAPI:
     """Wrapper around Philips TV API.
 
@@ -63,14 +143,59 @@ class PhilipsTVAPI:
 
     """
 
-    def __init__(self, tv: PhilipsTV) -> None:
+    def __init__(
+        self,
+        tv: PhilipsTVTransport,
+        *,
+        fast_json: bool = False,
+        coalesce: bool = False,
+        timing_sink: TimingSink | None = None,
+        cache: ResponseCache | None = None,
+        validation: Mapping[str, ValidationLevel] | None = None,
+    ) -> None:
         """
         Args:
-            tv: Instance of the :class:`PhilipsTV` to which the API requestes will be sent.
+            tv: Instance of the :class:`PhilipsTV` to which the API requestes will be sent. Any
+                other :class:`PhilipsTVTransport` can be used instead.
+            fast_json: If `True`, responses are validated directly from the raw response bytes,
+                and payloads are sent already encoded, skipping the intermediate Python objects.
+                This is considerably faster for big responses like the channel list. Requires
+                the ``tv`` to implement :class:`PhilipsTVRawTransport`.
+            coalesce: If `True`, identical `GET` requests made concurrently from multiple threads
+                share a single request to the TV. Threads calling e.g. :func:`get_volume` while
+                the same call is already in progress wait for it and receive the same result
+                object, so they must not modify it. Useful when many threads poll the same TV,
+                as the TVs handle concurrent requests poorly.
+            timing_sink: Function receiving the :class:`~philipstv.timing.RequestTiming` of every
+                request, including the time of validating the response. The phases measured by
+                the ``tv`` itself are included only if it's a :class:`PhilipsTV` or
+                :class:`Urllib3PhilipsTV`. ``None`` disables measuring the timings.
+            cache: Cache of `GET` responses, invalidated by `POST` requests. Cached responses are
+                shared by all the callers, so they must not be modified. ``None`` disables
+                caching.
+            validation: Mapping of API paths, without the version prefix, to the
+                :class:`~philipstv.validation.ValidationLevel` of their responses, e.g.
+                ``{"ambilight/measured": ValidationLevel.RAW}``. Responses of other paths are
+                fully validated. With ``RAW``, methods of the path return the decoded JSON data
+                instead of the model. :func:`get_snapshot`, :func:`get_settings`,
+                :func:`subscribe` and :class:`PhilipsTVRemote` need the models, so they raise
+                ``ValueError`` if any of the paths they use is ``RAW``.
+
+        Raises:
+            TypeError: If ``fast_json`` is enabled, but ``tv`` doesn't support raw requests.
 
         """
+        if fast_json and not isinstance(tv, PhilipsTVRawTransport):
+            raise TypeError(f"{type(tv).__name__} doesn't support raw requests needed by fast_json")
         self._tv = tv
+        self._raw_tv = tv if fast_json and isinstance(tv, PhilipsTVRawTransport) else None
+        self._stream_tv = tv if isinstance(tv, PhilipsTVStreamTransport) else None
+        self._single_flight = SingleFlight() if coalesce else None
+        self.timing_sink = timing_sink
+        self.cache = cache
+        self.validation = validation or {}
         self.api_version = 6
+        self.capabilities: Capabilities | None = None
 
     @property
     def host(self) -> str:
@@ -96,6 +221,21 @@ class PhilipsTVAPI:
     def auth(self, auth: Credentials | None) -> None:
         self._tv.auth = auth
 
+    def close(self) -> None:
+        """Close the underlying :class:`PhilipsTV` instance."""
+        self._tv.close()
+
+    def __enter__(self) -> "PhilipsTVAPI":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def pair_request(self, payload: PairingRequestPayload) -> PairingRequestResponse:
         """Send request initiating the pairing process.
 
@@ -129,9 +269,13 @@ class PhilipsTVAPI:
         """Send request to get the current power state."""
         return self._api_get_model("powerstate", PowerState)
 
-    def set_powerstate(self, powerstate: PowerState) -> None:
-        """Send request to set the power state."""
-        self._api_post("powerstate", powerstate)
+    def set_powerstate(self, powerstate: PowerState | PowerStateValue) -> None:
+        """Send request to set the power state.
+
+        The value can be given directly, in which case the request body is encoded only once for
+        each value.
+        """
+        self._api_post("powerstate", _fixed(PowerState, "powerstate", powerstate))
 
     def get_volume(self) -> CurrentVolume:
         """Send request to get the current volume, mute status, and volume limits."""
@@ -145,25 +289,111 @@ class PhilipsTVAPI:
         """Send request to get current TV app activity."""
         return self._api_get_model("activities/tv", CurrentChannel)
 
-    def get_all_channels(self) -> AllChannels:
-        """Send request to get all available channels."""
-        return self._api_get_model("channeldb/tv/channelLists/all", AllChannels)
+    def get_all_channels(self, *, fresh: bool = False) -> AllChannels:
+        """Send request to get all available channels.
+
+        Args:
+            fresh: Whether to discard the cached list first, e.g. when it's known to be outdated.
+
+        """
+        path = "channeldb/tv/channelLists/all"
+        if fresh and self.cache is not None:
+            self.cache.invalidate(path)
+        return self._api_get_model(path, AllChannels)
+
+    def iter_all_channels(self) -> Iterator[Channel]:
+        """Send request to get all available channels and yield them as they're received.
+
+        Unlike :func:`get_all_channels`, the list is parsed incrementally, so the first channels
+        are available long before the whole list is received, and it's never kept in memory at
+        once. The list metadata and the response cache are skipped. If the ``tv`` doesn't
+        implement :class:`PhilipsTVStreamTransport`, the whole list is received first.
+
+        Raises:
+            PhilipsTVAPIMalformedResponseError: If the list is malformed. Some of the channels
+                preceding the malformed part may be yielded before.
+
+        """
+        if self._stream_tv is None:
+            yield from self.get_all_channels().channel
+            return
+        yield from self._api_stream_items(
+            self._stream_tv, "channeldb/tv/channelLists/all", ("Channel", "channel"), Channel
+        )
 
     def set_channel(self, channel: SetChannel) -> None:
         """Send request to set the channel."""
         self._api_post("activities/tv", channel)
 
-    def input_key(self, key: InputKey) -> None:
-        """Send request to simulate pressing key on the remote."""
-        self._api_post("input/key", key)
+    def input_key(self, key: InputKey | InputKeyValue) -> None:
+        """Send request to simulate pressing key on the remote.
+
+        The key value can be given directly, in which case the request body is encoded only once
+        for each key, which makes bursts of key presses cheaper.
+        """
+        self._api_post("input/key", _fixed(InputKey, "key", key))
+
+    def input_keys(
+        self, keys: Iterable[InputKey | InputKeyValue], *, interval: float = 0.0
+    ) -> KeyBurst:
+        """Send requests simulating a sequence of key presses, e.g. a channel number and ``OK``.
+
+        All the request bodies are encoded before the first key is sent, and a connection to the
+        TV is opened in advance if the ``tv`` keeps a pool of them, so the keys are sent one right
+        after another over the same connection. The pace is then limited only by the TV's
+        responses and the :class:`~philipstv.RateLimiter` of the ``tv``.
+
+        Sending stops at the first failure, which is returned in the result instead of being
+        raised, together with the keys sent before it::
+
+            burst = api.input_keys([InputKeyValue.DIGIT_4, InputKeyValue.CONFIRM])
+            if not burst.ok:
+                print(f"{burst.failed_key} failed after {len(burst.presses)} keys: {burst.error}")
+
+        Args:
+            keys: Keys to send, in order.
+            interval: Minimal time between sending consecutive keys, in seconds. Keys are
+                scheduled from the start of the burst, so slow responses don't delay the following
+                keys more than needed.
+
+        Returns:
+            The keys accepted by the TV with their latencies, and the failure, if any.
+
+        """
+        payloads = key_payloads(keys)
+        if not payloads:
+            return KeyBurst()
+        if isinstance(self._tv, PhilipsTVPooledTransport):
+            try:
+                self._tv.warm(1)
+            except PhilipsError as exc:
+                return KeyBurst(failed_key=payloads[0][0], error=exc)
+
+        presses: list[KeyPress] = []
+        started = time.perf_counter()
+        for index, (key, payload) in enumerate(payloads):
+            delay = started + index * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            sent_at = time.perf_counter()
+            try:
+                self._api_post("input/key", payload)
+            except PhilipsError as exc:
+                return KeyBurst(tuple(presses), key, exc)
+            presses.append(KeyPress(key, sent_at - started, time.perf_counter() - sent_at))
+        return KeyBurst(tuple(presses))
 
     def get_ambilight_power(self) -> AmbilightPower:
         """Send request to get Ambilight power state."""
         return self._api_get_model("ambilight/power", AmbilightPower)
 
-    def set_ambilight_power(self, power: AmbilightPower) -> None:
-        """Send request to set Ambilight power state."""
-        self._api_post("ambilight/power", power)
+    def set_ambilight_power(self, power: AmbilightPower | AmbilightPowerValue) -> None:
+        """Send request to set Ambilight power state.
+
+        The value can be given directly, in which case the request body is encoded only once for
+        each value.
+        """
+        self._api_post("ambilight/power", _fixed(AmbilightPower, "power", power))
 
     def get_ambilight_topology(self) -> AmbilightTopology:
         """Send request to get Ambilight topology."""
@@ -244,25 +474,351 @@ class PhilipsTVAPI:
         """
         self._api_post("activities/launch", application)
 
+    def get_current_settings(self, payload: CurrentSettingsPayload) -> CurrentSettings:
+        """Send request to read the current values of the given menu settings.
+
+        Use :func:`get_settings` to read any number of settings conveniently.
+        """
+        return self._api_post_model(
+            "menuitems/settings/current", CurrentSettings, payload, invalidate=False
+        )
+
+    def get_settings(
+        self, nodes: Iterable[int], *, chunk_size: int = DEFAULT_SETTINGS_CHUNK_SIZE
+    ) -> dict[int, CurrentSetting]:
+        """Read the current values of many menu settings in as few requests as possible.
+
+        The TV reads all the settings of a request at once, so dozens of them take about as long
+        as a single one. Bigger sets of nodes are split into requests of ``chunk_size`` nodes,
+        sent one after another, so that no single request keeps the TV busy for long::
+
+            settings = api.get_settings([SettingNode.BRIGHTNESS, SettingNode.SOUND_STYLE])
+            settings[SettingNode.BRIGHTNESS].data.value
+
+        Args:
+            nodes: IDs of the setting nodes to read, e.g. :class:`~philipstv.model.SettingNode`.
+            chunk_size: Maximum number of nodes read by a single request.
+
+        Returns:
+            Mapping of node IDs to the settings. Nodes unknown to the TV are missing.
+
+        Raises:
+            ValueError: If ``chunk_size`` isn't positive, or the settings are validated as
+                :attr:`~philipstv.ValidationLevel.RAW`.
+
+        """
+        self._require_models(["menuitems/settings/current"], "get_settings")
+        return settings_by_node(
+            self.get_current_settings(payload) for payload in settings_payloads(nodes, chunk_size)
+        )
+
+    def get_system(self) -> SystemInfo:
+        """Send request to get the system information, e.g. the API version and features."""
+        return self._api_get_model("system", SystemInfo)
+
+    def probe(self, store: CapabilityStore | None = None, *, refresh: bool = False) -> Capabilities:
+        """Detect the API version and features of the TV, and use them from now on.
+
+        The version is read from :func:`get_system`, trying the versions from
+        :data:`~philipstv.capabilities.PROBED_API_VERSIONS` until the TV responds. Afterwards,
+        :attr:`api_version` is set to the detected version, and requests to the endpoints of
+        unsupported features raise :exc:`PhilipsTVAPIUnsupportedError` without reaching the TV.
+
+        The capabilities are loaded from the ``store``, if it has them for the :attr:`host`, so
+        they are detected only once, and later processes don't send any requests::
+
+            api.probe(FileCapabilityStore(Path("capabilities.json")))
+
+        Args:
+            store: Store persisting the capabilities of each host.
+            refresh: Whether to detect the capabilities again, even if they are in the ``store``,
+                e.g. after a software update of the TV.
+
+        Returns:
+            The detected capabilities.
+
+        """
+        capabilities = None if store is None or refresh else store.load(self.host)
+        if capabilities is None:
+            capabilities = self._probe_capabilities()
+            if store is not None:
+                store.save(self.host, capabilities)
+        self.api_version = capabilities.api_version
+        self.capabilities = capabilities
+        return capabilities
+
+    def get_snapshot(self, fields: Iterable[str] = SNAPSHOT_FIELDS) -> TVSnapshot:
+        """Fetch the current state of the TV, sending the requests concurrently.
+
+        Each field is fetched by the corresponding method, e.g. ``volume`` by :func:`get_volume`,
+        but all the requests are sent at once from separate threads, so the whole snapshot takes
+        about as long as the slowest of them. The ``tv`` should keep enough connections open, see
+        ``pool_maxsize`` of :class:`PhilipsTV`.
+
+        A failure of one field doesn't fail the others. Failed fields are ``None`` and their
+        errors are collected in :attr:`~philipstv.snapshot.TVSnapshot.errors`.
+
+        Args:
+            fields: Names of the fields to fetch, see
+                :data:`~philipstv.snapshot.SNAPSHOT_FIELDS`. The others are left empty.
+
+        Returns:
+            The snapshot of the requested fields.
+
+        Raises:
+            ValueError: If any of the fields is unknown, or its path is validated as
+                :attr:`~philipstv.ValidationLevel.RAW`.
+
+        """
+        getters = snapshot_getters(fields)
+        if not getters:
+            return TVSnapshot()
+        self._require_models(snapshot_paths(getters), "get_snapshot")
+
+        def fetch(getter: str) -> APIObject | PhilipsError:
+            try:
+                result: APIObject = getattr(self, getter)()
+            except PhilipsError as exc:
+                return exc
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+            # Each thread runs in a copy of the caller's context, so the deadline applies to it.
+            futures = {
+                name: executor.submit(contextvars.copy_context().run, fetch, getter)
+                for name, getter in getters.items()
+            }
+            return build_snapshot({name: future.result() for name, future in futures.items()})
+
+    def notify_change(self, payload: NotifyChangePayload) -> NotifyChangeResponse:
+        """Send long-poll request waiting until any of the given nodes changes.
+
+        The TV responds as soon as the current value of any node differs from the value in the
+        payload, or when it stops waiting. See :func:`subscribe` for a convenient way to use it.
+
+        Note:
+            Not supported by all the TVs. Those which don't support it respond with an error.
+
+        """
+        return self._api_post_model("notifychange", NotifyChangeResponse, payload, invalidate=False)
+
+    def subscribe(
+        self,
+        callback: ChangeCallback,
+        nodes: Mapping[str, type[APIObject]] = DEFAULT_WATCHED_NODES,
+        poll_interval: float = 1.0,
+    ) -> ChangeSubscription:
+        """Call the callback whenever any of the watched nodes changes.
+
+        The nodes are watched in a background thread, using :func:`notify_change` long-poll, so
+        the TV is asked for changes once instead of polling each node. The long-poll is re-armed
+        after each response and timeout. If the TV doesn't support it, the nodes are polled every
+        ``poll_interval`` seconds instead, and only the changed values are reported.
+
+        The callback is called from the background thread with each
+        :class:`~philipstv.notify.Change`, starting with the current values of all the nodes.
+        Failed requests are retried every ``poll_interval``, but other errors, e.g.
+        :class:`~philipstv.PhilipsTVAPIUnauthorizedError`, stop the subscription.
+
+        Args:
+            callback: Function called with each change.
+            nodes: Mapping of API paths of the watched nodes to models of their values, see
+                :data:`~philipstv.notify.DEFAULT_WATCHED_NODES`.
+            poll_interval: Number of seconds between requests when polling or retrying.
+
+        Returns:
+            The running subscription, which should be stopped when no longer needed.
+
+        Raises:
+            ValueError: If :func:`notify_change` is validated as
+                :attr:`~philipstv.ValidationLevel.RAW`.
+
+        """
+        self._require_models(["notifychange"], "subscribe")
+        tracker = _ChangeTracker(nodes, poll_interval)
+
+        def run(stopped: threading.Event) -> None:
+            while not stopped.is_set():
+                try:
+                    changes = self._next_changes(tracker)
+                except PhilipsTVError as exc:
+                    stopped.wait(tracker.error_delay(exc))
+                    continue
+                except Exception:
+                    _LOGGER.exception("Subscription to changes of %s failed", self.host)
+                    return
+                for change in changes:
+                    if stopped.is_set():
+                        return
+                    try:
+                        callback(change)
+                    except Exception:
+                        _LOGGER.exception("Change callback failed")
+                stopped.wait(tracker.delay(changes))
+
+        return ChangeSubscription(run, f"philipstv-changes-{self.host}")
+
+    def _next_changes(self, tracker: _ChangeTracker) -> list[Change]:
+        if tracker.polling:
+            return tracker.update({node: self._api_get_json(node) for node in tracker.nodes})
+        try:
+            response = self.notify_change(tracker.notify_payload())
+        except (PhilipsTVError, PhilipsTVAPIMalformedResponseError) as exc:
+            tracker.handle_notify_error(exc)
+            return []
+        return tracker.update(response.root)
+
+    def _probe_capabilities(self) -> Capabilities:
+        *versions, last_version = PROBED_API_VERSIONS
+        for version in versions:
+            try:
+                return self._get_capabilities(version)
+            except PhilipsTVError as exc:
+                if exc.status_code != 404:
+                    raise
+                _LOGGER.debug("API version %d not supported, trying older", version)
+        return self._get_capabilities(last_version)
+
+    def _get_capabilities(self, api_version: int) -> Capabilities:
+        previous_version = self.api_version
+        self.api_version = api_version
+        try:
+            return Capabilities.from_system(self.get_system(), api_version)
+        finally:
+            self.api_version = previous_version
+
+    def _check_supported(self, method: str, path: str) -> None:
+        if self.capabilities and (feature := self.capabilities.unsupported_feature(path)):
+            raise PhilipsTVAPIUnsupportedError(method, path, feature)
+
     def _api_post_model(
-        self, path: str, resp_model: type[_T], payload: APIObject | None = None
+        self,
+        path: str,
+        resp_model: type[_T],
+        payload: APIObject | None = None,
+        *,
+        invalidate: bool = True,
     ) -> _T:
-        raw_response = self._api_post(path, payload)
-        with _wrap_validation_exceptions("POST", path, raw_response):
-            return resp_model.parse(raw_response)
+        self._check_supported("POST", path)
+        with self._timing("POST", path) as recorder:
+            raw_response = self._send_post(path, payload, invalidate=invalidate)
+            with _wrap_validation_exceptions("POST", path, raw_response):
+                return self._parse(resp_model, raw_response, recorder, path)
 
     def _api_get_model(self, path: str, response_model: type[_T]) -> _T:
-        raw_response = self._api_get(path)
-        with _wrap_validation_exceptions("GET", path, raw_response):
-            return response_model.parse(raw_response)
-
-    def _api_post(self, path: str, payload: APIObject | None = None) -> Any:
+        self._check_supported("GET", path)
+        if self.cache is None:
+            return self._api_get_model_coalesced(path, response_model)
+        # Responses of different API versions may differ, e.g. before and after `probe`.
+        key = (self.api_version, response_model)
+        cached, generation = self.cache.get(path, key)
+        if cached is not None:
+            return cast(_T, cached)
+        result = self._api_get_model_coalesced(path, response_model)
+        self.cache.put(path, key, result, generation)
+        return result
+
+    def _api_get_model_coalesced(self, path: str, response_model: type[_T]) -> _T:
+        if self._single_flight:
+            return self._single_flight.do(
+                (self._api_path(path), response_model),
+                lambda: self._api_get_model_uncoalesced(path, response_model),
+                "GET",
+                path,
+            )
+        return self._api_get_model_uncoalesced(path, response_model)
+
+    def _api_get_model_uncoalesced(self, path: str, response_model: type[_T]) -> _T:
+        with self._timing("GET", path) as recorder:
+            raw_response = self._api_get(path)
+            with _wrap_validation_exceptions("GET", path, raw_response):
+                return self._parse(response_model, raw_response, recorder, path)
+
+    def _api_stream_items(
+        self,
+        tv: PhilipsTVStreamTransport,
+        path: str,
+        keys: tuple[str, ...],
+        item_model: type[_T],
+    ) -> Iterator[_T]:
+        self._check_supported("GET", path)
+        with (
+            _wrap_unauthorized_exceptions("GET", path),
+            closing(tv.get_stream(self._api_path(path))) as chunks,
+            _wrap_validation_exceptions("GET", path, None),
+        ):
+            adapter = _list_adapter(item_model)
+            for batch in iter_array_batches(chunks, keys):
+                # Validated together, which is much faster than one item at a time.
+                yield from adapter.validate_python(batch)
+
+    def _api_post(self, path: str, payload: _Payload = None) -> Any:
+        self._check_supported("POST", path)
+        with self._timing("POST", path):
+            return self._send_post(path, payload)
+
+    def _send_post(self, path: str, payload: _Payload, *, invalidate: bool = True) -> Any:
+        try:
+            return self._send_post_uncached(path, payload)
+        finally:
+            # Invalidated even if the request fails, because it may have been applied anyway.
+            # Read-only `POST` requests, e.g. long-polls, don't change anything.
+            if invalidate and self.cache is not None:
+                self.cache.invalidate(path)
+
+    def _send_post_uncached(self, path: str, payload: _Payload) -> Any:
         with _wrap_unauthorized_exceptions("POST", path):
-            return self._tv.post(self._api_path(path), payload.dump() if payload else None)
+            if self._raw_tv:
+                return self._raw_tv.post_raw(self._api_path(path), _dump_json(payload))
+            return self._tv.post(self._api_path(path), _dump(payload))
+
+    def _api_get_json(self, path: str) -> Any:
+        with _wrap_unauthorized_exceptions("GET", path):
+            return self._tv.get(self._api_path(path))
 
     def _api_get(self, path: str) -> Any:
         with _wrap_unauthorized_exceptions("GET", path):
+            if self._raw_tv:
+                return self._raw_tv.get_raw(self._api_path(path))
             return self._tv.get(self._api_path(path))
 
+    def _parse(
+        self, model: type[_T], raw_response: Any, recorder: _Recorder | None, path: str
+    ) -> _T:
+        level = self._validation_level(path)
+        if recorder is None:
+            return self._parse_untimed(model, raw_response, level)
+        started = time.perf_counter()
+        try:
+            return self._parse_untimed(model, raw_response, level)
+        finally:
+            recorder.validation += time.perf_counter() - started
+
+    def _parse_untimed(self, model: type[_T], raw_response: Any, level: ValidationLevel) -> _T:
+        if level == ValidationLevel.RAW:
+            return cast(_T, from_json(raw_response or b"null") if self._raw_tv else raw_response)
+        if self._raw_tv:
+            # Empty response is parsed like `None`, the same as without fast_json.
+            return model.parse_json(raw_response or b"null")
+        return model.parse(raw_response)
+
+    def _require_models(self, paths: Iterable[str], consumer: str) -> None:
+        """Raise ``ValueError`` if responses of any of the paths, used by the ``consumer``, aren't
+        validated into models."""
+        raw_paths = [path for path in paths if self._validation_level(path) == ValidationLevel.RAW]
+        if raw_paths:
+            raise ValueError(f"{consumer} needs models of {', '.join(raw_paths)}, but they're RAW")
+
+    def _validation_level(self, path: str) -> ValidationLevel:
+        if not self.validation:
+            return ValidationLevel.FULL
+        profile = match_profile(path, self.validation)
+        return self.validation[profile] if profile is not None else ValidationLevel.FULL
+
+    def _timing(self, method: str, path: str) -> AbstractContextManager[_Recorder | None]:
+        if self.timing_sink is None:
+            return nullcontext(current_recorder())
+        return record(self.timing_sink, method, self._api_path(path))
+
     def _api_path(self, path: str) -> str:
         return f"{self.api_version}/{path}"
@@ -0,0 +1,311 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlparse
+from urllib.request import parse_http_list, parse_keqv_list
+
+import urllib3
+from requests import PreparedRequest, Response
+from requests import Timeout as RequestsTimeout
+from requests.auth import AuthBase
+from requests.cookies import extract_cookies_to_jar
+
+from ._utils import read_json_object, write_json_object
+from .timeouts import remaining_time
+
+_LOGGER = logging.getLogger(__name__)
+
+_DIGEST_PREFIX = re.compile(r"digest ", flags=re.IGNORECASE)
+
+_HASH_FUNCTIONS: dict[str, Callable[[bytes], Any]] = {
+    "MD5": hashlib.md5,
+    "MD5-SESS": hashlib.md5,
+    "SHA": hashlib.sha1,
+    "SHA-256": hashlib.sha256,
+    "SHA-512": hashlib.sha512,
+}
+
+
+@dataclass
+class DigestChallenge:
+    """State of the digest authentication: the last challenge received from the TV.
+
+    Knowing the challenge allows to authenticate requests preemptively, without waiting for the TV
+    to reject them with `401` first.
+    """
+
+    realm: str
+    """Authentication realm."""
+    nonce: str
+    """Server nonce."""
+    qop: str | None = None
+    """Quality of protection."""
+    opaque: str | None = None
+    """Opaque value which has to be sent back to the server."""
+    algorithm: str | None = None
+    """Hash algorithm name."""
+    nonce_count: int = 0
+    """Number of requests already authenticated with the current nonce."""
+
+    @classmethod
+    def from_header(cls, header: str) -> "DigestChallenge | None":
+        """Parse the challenge from `WWW-Authenticate` header value.
+
+        Returns:
+            Parsed challenge or ``None`` if the header doesn't contain a digest challenge.
+
+        """
+        if not header.lower().startswith("digest "):
+            return None
+        values = parse_keqv_list(parse_http_list(_DIGEST_PREFIX.sub("", header, count=1)))
+        if "realm" not in values or not values.get("nonce"):
+            return None
+        return cls(
+            realm=values["realm"],
+            nonce=values["nonce"],
+            qop=values.get("qop"),
+            opaque=values.get("opaque"),
+            algorithm=values.get("algorithm"),
+        )
+
+
+class DigestChallengeStore(Protocol):
+    """Storage of digest authentication state, used to share it between processes.
+
+    The state is saved only when a new challenge is received, not after each request, so the saved
+    :attr:`DigestChallenge.nonce_count` lags behind. If the TV rejects a reused nonce counter, it
+    sends a new challenge and the request is retried with it.
+    """
+
+    def load(self, key: str) -> DigestChallenge | None:
+        """Return the challenge saved under the given key, if any."""
+        ...
+
+    def save(self, key: str, challenge: DigestChallenge) -> None:
+        """Save the challenge under the given key."""
+        ...
+
+
+class FileDigestChallengeStore:
+    """:class:`DigestChallengeStore` keeping the challenges of all hosts in a single JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path: Path of the JSON file. It will be created if it doesn't exist.
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> DigestChallenge | None:
+        with self._lock:
+            raw = read_json_object(self.path).get(key)
+        if not isinstance(raw, dict):
+            return None
+        try:
+            return DigestChallenge(**raw)
+        except TypeError:
+            _LOGGER.debug("Ignoring malformed digest challenge saved for %s", key)
+            return None
+
+    def save(self, key: str, challenge: DigestChallenge) -> None:
+        with self._lock:
+            data = read_json_object(self.path)
+            data[key] = asdict(challenge)
+            write_json_object(self.path, data)
+
+
+class SharedDigestAuth(AuthBase):
+    """HTTP digest authentication sharing its state between threads.
+
+    Unlike :class:`requests.auth.HTTPDigestAuth`, the last challenge and the nonce counter are not
+    kept per thread, so once any thread receives the challenge, all threads authenticate their
+    requests preemptively. The state can be additionally persisted in a
+    :class:`DigestChallengeStore`, in which case it will also be picked up by later processes.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        store: DigestChallengeStore | None = None,
+        key: str = "",
+    ) -> None:
+        """
+        Args:
+            username: Digest username.
+            password: Digest password.
+            store: Store to load the initial state from and to save new challenges into. Errors
+                of the store are logged and otherwise ignored.
+            key: Key under which the state is kept in the ``store``, usually the TV host.
+
+        """
+        self.username = username
+        self.password = password
+        self._store = store
+        self._key = key
+        self._lock = threading.Lock()
+        self._challenge = self._load()
+
+    @property
+    def challenge(self) -> DigestChallenge | None:
+        """Copy of the current challenge, ``None`` if no challenge was received yet."""
+        with self._lock:
+            return replace(self._challenge) if self._challenge else None
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        if header := self.build_header(str(request.method), str(request.url)):
+            request.headers["Authorization"] = header
+
+        body_position = None
+        if (tell := getattr(request.body, "tell", None)) is not None:
+            body_position = tell()
+
+        def handle_401(response: Response, **kwargs: Any) -> Response:
+            return self._handle_401(response, body_position, **kwargs)
+
+        request.register_hook("response", handle_401)  # type: ignore[no-untyped-call]
+        return request
+
+    def build_header(self, method: str, url: str) -> str | None:
+        """Build `Authorization` header value for the given request using the current challenge.
+
+        Returns:
+            The header value or ``None`` if no challenge was received yet.
+
+        """
+        with self._lock:
+            challenge = self._challenge
+            if not challenge:
+                return None
+            challenge.nonce_count += 1
+            return _build_digest_header(self.username, self.password, challenge, method, url)
+
+    def update_challenge(self, header: str) -> bool:
+        """Replace the current challenge with the one from `WWW-Authenticate` header value.
+
+        Returns:
+            Whether the header contained a valid digest challenge.
+
+        """
+        if not (challenge := DigestChallenge.from_header(header)):
+            return False
+        _LOGGER.debug("Received new digest challenge for %s", self._key)
+        with self._lock:
+            self._challenge = challenge
+            self._save(challenge)
+        return True
+
+    def _handle_401(self, response: Response, body_position: int | None, **kwargs: Any) -> Response:
+        if response.status_code != 401:
+            return response
+        if not self.update_challenge(response.headers.get("www-authenticate", "")):
+            return response
+
+        if body_position is not None and (seek := getattr(response.request.body, "seek", None)):
+            seek(body_position)
+
+        # Consume content and release the original connection to reuse it for the retry.
+        _ = response.content
+        response.close()
+        retry = response.request.copy()
+        extract_cookies_to_jar(retry._cookies, response.request, response.raw)  # type: ignore[attr-defined,no-untyped-call]
+        retry.prepare_cookies(retry._cookies)  # type: ignore[attr-defined]
+        if header := self.build_header(str(retry.method), str(retry.url)):
+            retry.headers["Authorization"] = header
+
+        # The retry is a part of the original request, so it only has the time left of it.
+        if (remaining := remaining_time()) is not None:
+            if remaining <= 0:
+                raise RequestsTimeout("Deadline exceeded before the authenticated retry")
+            kwargs["timeout"] = _shorten_timeout(kwargs.get("timeout"), remaining)
+
+        retry_response: Response = response.connection.send(retry, **kwargs)
+        retry_response.history.append(response)
+        retry_response.request = retry
+        return retry_response
+
+    def _load(self) -> DigestChallenge | None:
+        if not self._store:
+            return None
+        try:
+            return self._store.load(self._key)
+        except OSError:
+            _LOGGER.warning("Failed to load digest challenge for %s", self._key, exc_info=True)
+            return None
+
+    def _save(self, challenge: DigestChallenge) -> None:
+        if not self._store:
+            return
+        # The state is only an optimization, failing to persist it mustn't fail the request.
+        try:
+            self._store.save(self._key, replace(challenge))
+        except OSError:
+            _LOGGER.warning("Failed to save digest challenge for %s", self._key, exc_info=True)
+
+
+def _shorten_timeout(timeout: Any, remaining: float) -> Any:
+    if isinstance(timeout, urllib3.Timeout):
+        shortened = timeout.clone()
+        total = timeout.total
+        shortened.total = min(total, remaining) if isinstance(total, int | float) else remaining
+        return shortened
+    if isinstance(timeout, tuple):
+        return tuple(remaining if value is None else min(value, remaining) for value in timeout)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _build_digest_header(
+    username: str, password: str, challenge: DigestChallenge, method: str, url: str
+) -> str | None:
+    algorithm = (challenge.algorithm or "MD5").upper()
+    if not (hash_function := _HASH_FUNCTIONS.get(algorithm)):
+        return None
+
+    def digest(value: str) -> str:
+        return str(hash_function(value.encode()).hexdigest())
+
+    parsed_url = urlparse(url)
+    path = parsed_url.path or "/"
+    if parsed_url.query:
+        path += f"?{parsed_url.query}"
+
+    nonce = challenge.nonce
+    nc_value = f"{challenge.nonce_count:08x}"
+    cnonce = hashlib.sha1(
+        f"{challenge.nonce_count}{nonce}{time.ctime()}".encode() + os.urandom(8),
+        usedforsecurity=False,
+    ).hexdigest()[:16]
+
+    ha1 = digest(f"{username}:{challenge.realm}:{password}")
+    if algorithm == "MD5-SESS":
+        ha1 = digest(f"{ha1}:{nonce}:{cnonce}")
+    ha2 = digest(f"{method}:{path}")
+
+    qop = challenge.qop
+    if not qop:
+        response = digest(f"{ha1}:{nonce}:{ha2}")
+    elif "auth" in qop.split(","):
+        response = digest(f"{ha1}:{nonce}:{nc_value}:{cnonce}:auth:{ha2}")
+    else:
+        return None
+
+    header = (
+        f'username="{username}", realm="{challenge.realm}", nonce="{nonce}", '
+        f'uri="{path}", response="{response}"'
+    )
+    if challenge.opaque:
+        header += f', opaque="{challenge.opaque}"'
+    if challenge.algorithm:
+        header += f', algorithm="{challenge.algorithm}"'
+    if qop:
+        header += f', qop="auth", nc={nc_value}, cnonce="{cnonce}"'
+    return f"Digest {header}"
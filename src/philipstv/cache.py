@@ -0,0 +1,172 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from ._paths import match_profile
+
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    "ambilight/topology": 3600,
+    "channeldb/tv/channelLists/all": 300,
+    "applications": 300,
+    "ambilight/power": 2,
+    "ambilight/mode": 2,
+    "audio/volume": 1,
+    "powerstate": 1,
+    "activities/tv": 1,
+}
+"""Number of seconds for which responses of the endpoints are cached.
+
+Keys are API paths without the version prefix. Responses of other paths are not cached.
+"""
+
+DEFAULT_INVALIDATIONS: Mapping[str, tuple[str, ...]] = {
+    "activities/launch": ("activities/tv",),
+    "ambilight/cached": ("ambilight/mode",),
+    "powerstate": (
+        "audio/volume",
+        "activities/tv",
+        "ambilight/power",
+        "ambilight/mode",
+    ),
+    "input/key": (
+        "powerstate",
+        "audio/volume",
+        "activities/tv",
+        "ambilight/power",
+        "ambilight/mode",
+    ),
+}
+"""Cached paths invalidated by a `POST` request to another path.
+
+A `POST` request always invalidates its own path, these are the additional side effects, e.g. a key
+press can change the volume or the channel, and switching the TV to standby turns off Ambilight.
+"""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the usage counters of a :class:`ResponseCache`."""
+
+    hits: int = 0
+    """Number of responses served from the cache."""
+    misses: int = 0
+    """Number of cacheable requests sent to the TV, because there was no fresh response cached."""
+    evictions: int = 0
+    """Number of responses removed, because the cache was full."""
+    invalidations: int = 0
+    """Number of responses removed, because of a `POST` request which could change them."""
+
+
+class ResponseCache:
+    """Cache of the responses of :class:`~philipstv.PhilipsTVAPI` `GET` requests.
+
+    Many endpoints return the same data for a long time, e.g. the channel list or the Ambilight
+    topology, and the others rarely change within a second. Each endpoint has its own time to live
+    of cached responses, see :data:`DEFAULT_CACHE_TTLS`. The least recently used responses are
+    evicted when the cache is full.
+
+    A `POST` request sent through the API immediately invalidates the responses which it can change:
+    of its own path and the related paths from :data:`DEFAULT_INVALIDATIONS`, so e.g.
+    :func:`~philipstv.PhilipsTVAPI.get_volume` after :func:`~philipstv.PhilipsTVAPI.set_volume`
+    always sends a new request. Changes made by other clients, or using the physical remote, are
+    visible only after the time to live.
+
+    Cached responses are shared by all the callers, so they must not be modified. The cache is
+    thread-safe, but should be used by a single API instance::
+
+        api = PhilipsTVAPI(PhilipsTV("192.168.0.100"), cache=ResponseCache())
+
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_CACHE_TTLS,
+        invalidations: Mapping[str, tuple[str, ...]] = DEFAULT_INVALIDATIONS,
+        maxsize: int = 64,
+    ) -> None:
+        """
+        Args:
+            ttls: Time to live of the responses of each endpoint, in seconds.
+            invalidations: Paths invalidated by `POST` requests to other paths.
+            maxsize: Maximum number of cached responses.
+
+        """
+        self.ttls = ttls
+        self.invalidations = invalidations
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._counts = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def stats(self) -> CacheStats:
+        """Usage counters of the cache."""
+        with self._lock:
+            return CacheStats(**self._counts)
+
+    def clear(self) -> None:
+        """Remove all the cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def get(self, path: str, key: Hashable) -> tuple[Any | None, int]:
+        """Return the fresh cached response of the path and the current cache generation.
+
+        The response is ``None`` if there's none. The generation has to be passed to :func:`put`,
+        so the response isn't stored if it was invalidated in the meantime.
+
+        Args:
+            path: API path without the version prefix.
+            key: Additional key distinguishing responses of the same path, e.g. their API version
+                and model.
+
+        """
+        entry_key = (path, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(entry_key)
+                self._counts["hits"] += 1
+                return entry[1], self._generation
+            if entry is not None:
+                del self._entries[entry_key]
+            if self.ttl(path) is not None:
+                self._counts["misses"] += 1
+            return None, self._generation
+
+    def put(self, path: str, key: Hashable, value: Any, generation: int) -> None:
+        """Store the response of the path, unless anything was invalidated since ``generation``."""
+        if (ttl := self.ttl(path)) is None:
+            return
+        entry_key = (path, key)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[entry_key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def invalidate(self, path: str) -> None:
+        """Remove the responses which may be changed by a `POST` request to the given path."""
+        invalidated = {path: None}
+        if (related := match_profile(path, self.invalidations)) is not None:
+            invalidated.update(dict.fromkeys(self.invalidations[related]))
+        with self._lock:
+            self._generation += 1
+            for entry_key in list(self._entries):
+                if match_profile(entry_key[0], invalidated) is not None:
+                    del self._entries[entry_key]
+                    self._counts["invalidations"] += 1
+
+    def ttl(self, path: str) -> float | None:
+        """Return the time to live of the responses of the path, ``None`` if they aren't cached."""
+        profile = match_profile(path, self.ttls)
+        return self.ttls[profile] if profile is not None else None
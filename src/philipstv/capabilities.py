@@ -0,0 +1,119 @@
+import logging
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+from ._paths import match_profile
+from ._utils import read_json_object, write_json_object
+from .model import SystemInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+PROBED_API_VERSIONS = (6, 5)
+"""API versions tried, in order, when probing a TV which doesn't report its version."""
+
+FEATURE_PATHS: Mapping[str, str] = {
+    "ambilight": "ambilight",
+    "applications": "applications",
+    "activities/launch": "activities",
+    "menuitems": "menuitems",
+}
+"""Mapping of API paths, without the version prefix, to the features they require."""
+
+_UNAVAILABLE = "not_available"
+
+
+@dataclass(frozen=True)
+class Capabilities:
+    """API version and features of a TV, detected by :func:`~philipstv.PhilipsTVAPI.probe`."""
+
+    api_version: int
+    """Version of the API used in request paths."""
+    features: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+    """Mapping of API feature names to their supported variants, as reported by the TV.
+
+    Empty if the TV doesn't report its features.
+    """
+
+    @classmethod
+    def from_system(cls, system: SystemInfo, api_version: int) -> "Capabilities":
+        """Create the capabilities from the system response.
+
+        Args:
+            system: Response of :func:`~philipstv.PhilipsTVAPI.get_system`.
+            api_version: Version used to get the response, if the TV doesn't report its version.
+
+        """
+        features = system.featuring.json_features if system.featuring else {}
+        return cls(
+            api_version=system.api_version.major if system.api_version else api_version,
+            features={name: tuple(variants) for name, variants in features.items()},
+        )
+
+    def supports(self, feature: str) -> bool:
+        """Return whether the TV supports the feature, e.g. ``"ambilight"``.
+
+        TVs which don't report their features are assumed to support all of them.
+        """
+        if not self.features:
+            return True
+        return any(variant != _UNAVAILABLE for variant in self.features.get(feature, ()))
+
+    def unsupported_feature(self, path: str) -> str | None:
+        """Return the feature required by the API path, if the TV doesn't support it."""
+        if (profile := match_profile(path, FEATURE_PATHS)) is None:
+            return None
+        feature = FEATURE_PATHS[profile]
+        return None if self.supports(feature) else feature
+
+
+class CapabilityStore(Protocol):
+    """Storage of detected TV capabilities, used to share them between processes."""
+
+    def load(self, host: str) -> Capabilities | None:
+        """Return the capabilities saved for the given host, if any."""
+        ...
+
+    def save(self, host: str, capabilities: Capabilities) -> None:
+        """Save the capabilities of the given host."""
+        ...
+
+
+class FileCapabilityStore:
+    """:class:`CapabilityStore` keeping the capabilities of all hosts in a single JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path: Path of the JSON file. It will be created if it doesn't exist.
+
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, host: str) -> Capabilities | None:
+        with self._lock:
+            raw = read_json_object(self.path).get(host)
+        if not isinstance(raw, dict):
+            return None
+        try:
+            return Capabilities(
+                api_version=int(raw["api_version"]),
+                features={name: tuple(variants) for name, variants in raw["features"].items()},
+            )
+        except (TypeError, KeyError, ValueError, AttributeError):
+            _LOGGER.debug("Ignoring malformed capabilities saved for %s", host)
+            return None
+
+    def save(self, host: str, capabilities: Capabilities) -> None:
+        with self._lock:
+            data = read_json_object(self.path)
+            data[host] = {
+                "api_version": capabilities.api_version,
+                "features": {
+                    name: list(variants) for name, variants in capabilities.features.items()
+                },
+            }
+            write_json_object(self.path, data)
@@ -0,0 +1,183 @@
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+from .exceptions import (
+    PhilipsTVConnectTimeoutError,
+    PhilipsTVError,
+    PhilipsTVTimeoutError,
+    PhilipsTVUnavailableError,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    """The TV is reachable, requests are sent normally."""
+    OPEN = "open"
+    """The TV is unreachable, requests fail immediately."""
+    HALF_OPEN = "half_open"
+    """The TV was unreachable, but it's time to check it again. A single probe request is sent,
+    others fail immediately until it finishes."""
+
+
+class CircuitBreaker:
+    """Stops sending requests to a TV after repeated connection failures.
+
+    When the TV is turned off or unplugged, every request waits for the connect timeout before
+    failing. Once ``failure_threshold`` consecutive requests fail without reaching the TV, the
+    breaker opens and further requests fail immediately with
+    :class:`~philipstv.PhilipsTVUnavailableError`. After ``reset_timeout`` seconds a single probe
+    request is let through. If it reaches the TV, the breaker closes. Otherwise it opens again, and
+    the time until the next probe is multiplied by ``backoff_factor``, up to ``max_reset_timeout``.
+
+    Only failures to reach the TV count: connection errors and connect timeouts. Error responses
+    and other timeouts, e.g. of a slow response, mean the TV is reachable. They neither count as
+    failures nor close the breaker.
+
+    The breaker is thread-safe, pass the same instance to one :class:`~philipstv.PhilipsTV` shared
+    between threads::
+
+        tv = PhilipsTV("192.168.0.100", circuit_breaker=CircuitBreaker())
+
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 5.0,
+        max_reset_timeout: float = 300.0,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        """
+        Args:
+            failure_threshold: Number of consecutive connection failures after which the breaker
+                opens.
+            reset_timeout: Number of seconds after which the first probe request is allowed.
+            max_reset_timeout: Maximum number of seconds between probe requests.
+            backoff_factor: Multiplier of the time between consecutive failed probes.
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.backoff_factor = backoff_factor
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._current_reset_timeout = reset_timeout
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the breaker."""
+        with self._lock:
+            return self._state()
+
+    @property
+    def retry_in(self) -> float:
+        """Number of seconds until the next probe request is allowed, ``0`` if it's allowed now."""
+        with self._lock:
+            return self._retry_in()
+
+    def reset(self) -> None:
+        """Close the breaker, e.g. after the TV was turned on by other means."""
+        with self._lock:
+            self._close()
+
+    @contextmanager
+    def guard(self, method: str, url: str) -> Iterator[None]:
+        """Guard sending a single request, recording its outcome.
+
+        Args:
+            method: HTTP method of the request.
+            url: URL of the request.
+
+        Raises:
+            PhilipsTVUnavailableError: If the breaker doesn't allow sending the request.
+
+        """
+        self._acquire(method, url)
+        try:
+            yield
+        except PhilipsTVConnectTimeoutError:
+            self._record_failure()
+            raise
+        except PhilipsTVTimeoutError:
+            # The TV was reached, but it's busy or, in case of a long-poll, has nothing to report.
+            self._release_probe()
+            raise
+        except PhilipsTVError as exc:
+            if exc.status_code is None:
+                self._record_failure()
+            else:
+                self._record_success()
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        else:
+            self._record_success()
+
+    def _acquire(self, method: str, url: str) -> None:
+        with self._lock:
+            state = self._state()
+            if state is CircuitState.CLOSED:
+                return
+            if state is CircuitState.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            retry_in = self._retry_in()
+        raise PhilipsTVUnavailableError(method, url, retry_in)
+
+    def _record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                _LOGGER.debug("Circuit closed, the TV is reachable again")
+            self._close()
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            if self._probing:
+                self._probing = False
+                self._current_reset_timeout = min(
+                    self._current_reset_timeout * self.backoff_factor, self.max_reset_timeout
+                )
+                self._open()
+                return
+            self._failures += 1
+            if self._opened_at is None and self._failures >= self.failure_threshold:
+                self._open()
+
+    def _release_probe(self) -> None:
+        with self._lock:
+            self._probing = False
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        _LOGGER.debug("Circuit opened for %s seconds", self._current_reset_timeout)
+
+    def _close(self) -> None:
+        self._failures = 0
+        self._current_reset_timeout = self.reset_timeout
+        self._opened_at = None
+        self._probing = False
+
+    def _state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._retry_in() > 0:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def _retry_in(self) -> float:
+        if self._opened_at is None:
+            return 0
+        return max(self._opened_at + self._current_reset_timeout - time.monotonic(), 0)
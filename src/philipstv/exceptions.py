@@ -34,6 +34,57 @@ class PhilipsTVError(PhilipsError):
         self.status_code = status_code
 
 
+class PhilipsTVTimeoutError(PhilipsTVError):
+    """Raised if the request to the TV didn't finish in time.
+
+    This happens when one of the request timeouts is exceeded, or the request would exceed the
+    current :func:`~philipstv.timeouts.deadline`.
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(method, url)
+        self.message = f"{method} request to {url} timed out"
+
+
+class PhilipsTVConnectTimeoutError(PhilipsTVTimeoutError):
+    """Raised if the connection to the TV couldn't be opened in time.
+
+    Unlike other timeouts, this means the TV wasn't reached at all, e.g. because it's turned off.
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(method, url)
+        self.message = f"{method} request to {url} timed out while connecting"
+
+
+class PhilipsTVUnavailableError(PhilipsTVError):
+    """Raised without sending the request, if the TV is considered unreachable.
+
+    This happens when the :class:`~philipstv.circuit.CircuitBreaker` of the TV is open, because
+    of previous connection failures.
+
+    Attributes:
+        retry_in: Number of seconds after which the next attempt to reach the TV will be allowed.
+
+    """
+
+    def __init__(self, method: str, url: str, retry_in: float) -> None:
+        super().__init__(method, url)
+        self.message = f"{method} request to {url} not sent, the TV is unavailable"
+        self.retry_in = retry_in
+
+
+class PhilipsTVRateLimitError(PhilipsTVError):
+    """Raised without sending the request, if too many requests are already waiting for their turn.
+
+    This happens when the queue of the :class:`~philipstv.ratelimit.RateLimiter` is full.
+    """
+
+    def __init__(self, method: str, url: str) -> None:
+        super().__init__(method, url)
+        self.message = f"{method} request to {url} not sent, too many requests are queued"
+
+
 class PhilipsTVPairingError(PhilipsError):
     """Raised if pairing process failed.
 
@@ -86,9 +137,45 @@ class PhilipsTVAPIMalformedResponseError(PhilipsTVAPIError):
         self.response = response
 
 
+class PhilipsTVAPIUnsupportedError(PhilipsTVAPIError):
+    """Raised without sending the request, if the TV doesn't support the requested feature.
+
+    This happens only after the capabilities of the TV are detected with
+    :func:`~philipstv.PhilipsTVAPI.probe`.
+
+    Attributes:
+        method: HTTP method of the request.
+        path: Path of the request.
+        feature: Name of the unsupported feature, e.g. ``"ambilight"``.
+
+    """
+
+    def __init__(self, method: str, path: str, feature: str) -> None:
+        super().__init__(f"Feature '{feature}' not supported by the TV: {method} {path}")
+        self.method = method
+        self.path = path
+        self.feature = feature
+
+
 class PhilipsTVRemoteError(PhilipsError):
     """Raised if there was some incorrect interaction with :class:`PhilipsTVRemote`.
 
     This can happen e.g. when trying to launch application which is not installed. This exception
     does *NOT* come from the TV. It comes from the :class:`PhilipsTVRemote` class logic.
     """
+
+
+class PhilipsTVRemoteAmbiguousChannelError(PhilipsTVRemoteError):
+    """Raised if the given channel number or name matches more than one channel.
+
+    Attributes:
+        channel: The given channel number or name.
+        matches: Numbers and names of all the matching channels.
+
+    """
+
+    def __init__(self, channel: int | str, matches: list[tuple[str, str]]) -> None:
+        listed = ", ".join(f"{preset} ({name})" for preset, name in matches)
+        super().__init__(f"Channel '{channel}' is ambiguous, matching channels: {listed}")
+        self.channel = channel
+        self.matches = matches
@@ -0,0 +1,50 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ._payloads import EncodedPayload, fixed_payload
+from .exceptions import PhilipsError
+from .model import InputKey, InputKeyValue
+
+
+@dataclass(frozen=True)
+class KeyPress:
+    """A key accepted by the TV during :func:`~philipstv.PhilipsTVAPI.input_keys`."""
+
+    key: InputKeyValue
+    """Value of the key."""
+    sent_at: float
+    """Time from the start of the burst until the key was sent, in seconds."""
+    latency: float
+    """Time from sending the key until the TV responded, in seconds. Includes waiting for the
+    :class:`~philipstv.RateLimiter`."""
+
+
+@dataclass(frozen=True)
+class KeyBurst:
+    """Outcome of :func:`~philipstv.PhilipsTVAPI.input_keys`.
+
+    Keys are sent until the first failure, the keys after the failed one aren't sent.
+    """
+
+    presses: tuple[KeyPress, ...] = ()
+    """Keys accepted by the TV, in the order they were sent."""
+    failed_key: InputKeyValue | None = None
+    """Key which failed to be sent, ``None`` if all the keys were sent."""
+    error: PhilipsError | None = None
+    """Error of the failed key, ``None`` if all the keys were sent."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether all the keys were sent."""
+        return self.error is None
+
+
+def key_payloads(
+    keys: Iterable[InputKey | InputKeyValue],
+) -> list[tuple[InputKeyValue, EncodedPayload]]:
+    """Return the keys paired with their request payloads, encoded once for each key."""
+    payloads = []
+    for key in keys:
+        value = InputKeyValue(key.key if isinstance(key, InputKey) else key)
+        payloads.append((value, fixed_payload(InputKey, "key", value)))
+    return payloads
@@ -28,8 +28,9 @@ from .channels import (
     CurrentChannel,
     SetChannel,
 )
-from .general import PowerState, PowerStateValue
+from .general import APIVersion, PowerState, PowerStateValue, SystemFeaturing, SystemInfo
 from .input import InputKey, InputKeyValue
+from .notify import NotifyChangePayload, NotifyChangeResponse
 from .pairing import (
     DeviceInfo,
     PairingAuthInfo,
@@ -38,9 +39,20 @@ from .pairing import (
     PairingRequestResponse,
     PairingResponse,
 )
+from .settings import (
+    CurrentSetting,
+    CurrentSettings,
+    CurrentSettingsPayload,
+    CurrentSettingsValue,
+    SettingData,
+    SettingNode,
+    SettingNodeID,
+    SettingSlider,
+)
 
 __all__ = [
     "APIObject",
+    "APIVersion",
     "AllChannels",
     "AmbilightColor",
     "AmbilightColorSettings",
@@ -62,10 +74,16 @@ __all__ = [
     "ChannelListID",
     "ChannelShort",
     "CurrentChannel",
+    "CurrentSetting",
+    "CurrentSettings",
+    "CurrentSettingsPayload",
+    "CurrentSettingsValue",
     "CurrentVolume",
     "DeviceInfo",
     "InputKey",
     "InputKeyValue",
+    "NotifyChangePayload",
+    "NotifyChangeResponse",
     "PairingAuthInfo",
     "PairingGrantPayload",
     "PairingRequestPayload",
@@ -74,7 +92,13 @@ __all__ = [
     "PowerState",
     "PowerStateValue",
     "SetChannel",
+    "SettingData",
+    "SettingNode",
+    "SettingNodeID",
+    "SettingSlider",
     "StrEnum",
+    "SystemFeaturing",
+    "SystemInfo",
     "ValidationError",
     "Volume",
 ]
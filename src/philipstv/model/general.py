@@ -1,3 +1,7 @@
+from typing import Any
+
+from pydantic import Field
+
 from .base import APIObject, StrEnum
 
 
@@ -13,3 +17,34 @@ class PowerState(APIObject):
 
     powerstate: PowerStateValue
     """A power state value."""
+
+
+class APIVersion(APIObject):
+    """Model of an API version definition in system response."""
+
+    major: int = Field(alias="Major")
+    """Major version, the one used in API paths."""
+    minor: int = Field(0, alias="Minor")
+    """Minor version."""
+    patch: int = Field(0, alias="Patch")
+    """Patch version."""
+
+
+class SystemFeaturing(APIObject):
+    """Model of a features definition in system response."""
+
+    json_features: dict[str, list[str]] = Field(default_factory=dict, alias="jsonfeatures")
+    """Mapping of API feature names to their supported variants, e.g. ``"ambilight"``."""
+    system_features: dict[str, Any] = Field(default_factory=dict, alias="systemfeatures")
+    """Other features of the TV, e.g. its pairing type."""
+
+
+class SystemInfo(APIObject):
+    """Model of a system response."""
+
+    name: str | None = None
+    """Model name of the TV."""
+    api_version: APIVersion | None = None
+    """Version of the API. Not reported by some older TVs."""
+    featuring: SystemFeaturing | None = None
+    """Features supported by the TV. Not reported by some older TVs."""
@@ -0,0 +1,34 @@
+from typing import Any
+
+from pydantic import RootModel, field_validator
+
+from .base import APIObject
+
+
+class NotifyChangePayload(APIObject):
+    """Model of a notify change request.
+
+    The TV responds once the current value of any of the nodes differs from the given one.
+    """
+
+    notification: dict[str, Any]
+    """Mapping of API paths of the watched nodes to their last known values."""
+
+
+class NotifyChangeResponse(APIObject, RootModel[dict[str, Any]]):
+    """Model of a notify change response.
+
+    Wrapper around a dict of the watched nodes with their current values. It's empty if nothing
+    changed before the TV stopped waiting.
+    """
+
+    root: dict[str, Any]
+    """Mapping of API paths of the nodes to their current values."""
+
+    @field_validator("root", mode="before")
+    @classmethod
+    def _empty_response(cls, value: Any) -> Any:
+        return {} if value is None else value
+
+    def __getitem__(self, item: str) -> Any:
+        return self.root[item]
@@ -0,0 +1,96 @@
+from enum import IntEnum
+
+from pydantic import Field
+
+from .base import APIObject
+
+
+class SettingNode(IntEnum):
+    """IDs of commonly read menu setting nodes.
+
+    The IDs are assigned by the TV software, these are the ones used by Android TVs with API
+    version 6. Other models may use different IDs for the same settings.
+    """
+
+    PICTURE_STYLE = 2131230858
+    COLOUR = 2131230859
+    CONTRAST = 2131230860
+    SHARPNESS = 2131230861
+    BRIGHTNESS = 2131230862
+    SOUND_STYLE = 2131230911
+    HEADPHONES_VOLUME = 2131230913
+    CLEAR_DIALOGUE = 2131230916
+    AUTO_VOLUME_LEVELING = 2131230922
+    AMBILIGHT_BRIGHTNESS = 2131230795
+    AMBILIGHT_SATURATION = 2131230796
+    ENERGY_SAVING = 2131230830
+    SLEEP_TIMER = 2131230855
+
+
+class SettingNodeID(APIObject):
+    """Model of a menu setting node in current settings request."""
+
+    nodeid: int
+    """ID of the setting node."""
+
+
+class CurrentSettingsPayload(APIObject):
+    """Model of a current menu settings request."""
+
+    nodes: list[SettingNodeID]
+    """Setting nodes to read."""
+
+
+class SettingSlider(APIObject):
+    """Model of a single slider value of a multiple slider setting, e.g. the equalizer."""
+
+    slider_id: str
+    """Slider ID."""
+    value: int
+    """Slider value."""
+
+
+class SettingData(APIObject):
+    """Model of a menu setting value. Only the fields matching the setting type are present."""
+
+    value: bool | int | None = None
+    """Value of a slider or switch setting."""
+    selected_item: int | None = None
+    """Selected enum ID of a list setting."""
+    activenode_id: int | None = None
+    """Active child node of a parent setting."""
+    values: list[SettingSlider] | None = None
+    """Values of a multiple slider setting."""
+
+
+class CurrentSetting(APIObject):
+    """Model of a menu setting in current settings response."""
+
+    node_id: int = Field(alias="Nodeid")
+    """ID of the setting node."""
+    controllable: bool = Field(alias="Controllable")
+    """Whether the setting can be changed."""
+    available: bool = Field(alias="Available")
+    """Whether the setting is available in the current context."""
+    string_id: str | None = None
+    """Name of the setting."""
+    data: SettingData = Field(default_factory=SettingData)
+    """Setting value."""
+
+
+class CurrentSettingsValue(APIObject):
+    """Model of a single entry in current settings response."""
+
+    value: CurrentSetting
+    """The setting."""
+    data: SettingData | None = None
+    """Setting value, if the TV sends it next to the setting instead of inside it."""
+
+
+class CurrentSettings(APIObject):
+    """Model of a current menu settings response."""
+
+    values: list[CurrentSettingsValue] = Field(default_factory=list)
+    """Current values of the requested settings. Unknown nodes are missing."""
+    version: int | None = None
+    """Version of the settings."""
@@ -0,0 +1,152 @@
+import logging
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from .exceptions import (
+    PhilipsTVAPIMalformedResponseError,
+    PhilipsTVError,
+    PhilipsTVTimeoutError,
+    PhilipsTVUnavailableError,
+)
+from .model import APIObject, CurrentChannel, CurrentVolume, NotifyChangePayload, PowerState
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WATCHED_NODES: Mapping[str, type[APIObject]] = {
+    "powerstate": PowerState,
+    "audio/volume": CurrentVolume,
+    "activities/tv": CurrentChannel,
+}
+"""Nodes watched by default: power state, volume and current channel.
+
+Keys are API paths without the version prefix, values are the models of their `GET` responses.
+"""
+
+_UNSUPPORTED_STATUS_CODES = {404, 405, 501}
+
+
+@dataclass(frozen=True)
+class Change:
+    """New value of a watched node."""
+
+    node: str
+    """API path of the node, without the version prefix, e.g. ``"audio/volume"``."""
+    value: APIObject
+    """Current value of the node, an instance of the model given for the node."""
+
+
+ChangeCallback = Callable[[Change], None]
+"""Function called with every :class:`Change` of a subscription."""
+
+
+class _ChangeTracker:
+    """State of watching the nodes for changes, shared by the sync and async implementations.
+
+    The first round polls all the nodes to learn their values. Then the ``notifychange``
+    long-poll is used, until the TV turns out not to support it. From then on all the nodes are
+    polled every ``poll_interval`` and compared with the previous values.
+    """
+
+    def __init__(self, nodes: Mapping[str, type[APIObject]], poll_interval: float) -> None:
+        self.nodes = nodes
+        self.poll_interval = poll_interval
+        self.notify_supported = True
+        self._values: dict[str, Any] = {}
+
+    @property
+    def polling(self) -> bool:
+        return not self.notify_supported or len(self._values) < len(self.nodes)
+
+    def notify_payload(self) -> NotifyChangePayload:
+        return NotifyChangePayload(notification=dict(self._values))
+
+    def update(self, raw_values: Mapping[str, Any]) -> list[Change]:
+        """Store the new raw values of the nodes and return the ones which changed."""
+        changes = []
+        for node, model in self.nodes.items():
+            if node not in raw_values or raw_values[node] == self._values.get(node):
+                continue
+            try:
+                value = model.parse(raw_values[node])
+            except ValueError:
+                _LOGGER.debug("Malformed value of %s: %s", node, raw_values[node])
+                continue
+            self._values[node] = raw_values[node]
+            changes.append(Change(node, value))
+        return changes
+
+    def handle_notify_error(self, exc: PhilipsTVError | PhilipsTVAPIMalformedResponseError) -> None:
+        """Handle the error of a ``notifychange`` request, raising it if it's not expected."""
+        if isinstance(exc, PhilipsTVTimeoutError):
+            # Nothing changed before the timeout, the request is simply sent again.
+            return
+        if isinstance(exc, PhilipsTVAPIMalformedResponseError) or (
+            exc.status_code in _UNSUPPORTED_STATUS_CODES
+        ):
+            _LOGGER.debug("notifychange not supported, falling back to polling: %s", exc)
+            self.notify_supported = False
+            return
+        raise exc
+
+    def delay(self, changes: list[Change]) -> float:
+        """Return the number of seconds to wait before the next request."""
+        # Long-poll is sent again right away, unless the TV returned immediately without changes.
+        return self.poll_interval if self.polling or not changes else 0
+
+    def error_delay(self, exc: PhilipsTVError) -> float:
+        """Return the number of seconds to wait before retrying after the error."""
+        _LOGGER.debug("Watching changes failed: %s", exc)
+        if isinstance(exc, PhilipsTVUnavailableError):
+            return max(exc.retry_in, self.poll_interval)
+        return self.poll_interval
+
+
+class ChangeSubscription:
+    """Subscription to changes of the TV state, running in a background thread.
+
+    Created by :func:`~philipstv.PhilipsTVAPI.subscribe`. The thread keeps running until
+    :func:`stop` is called, or the instance used as a context manager exits::
+
+        with api.subscribe(print):
+            time.sleep(60)
+
+    """
+
+    def __init__(self, run: Callable[[threading.Event], None], name: str) -> None:
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=run, args=(self._stopped,), name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        """Whether the subscription is still running."""
+        return self._thread.is_alive()
+
+    def stop(self, timeout: float | None = 0) -> None:
+        """Stop the subscription.
+
+        No callbacks are called after the request in progress finishes, but the long-poll request
+        may take a while.
+
+        Args:
+            timeout: Number of seconds to wait for the thread to finish. ``None`` waits until it
+                finishes.
+
+        """
+        self._stopped.set()
+        if timeout != 0:
+            self._thread.join(timeout)
+
+    def __enter__(self) -> "ChangeSubscription":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
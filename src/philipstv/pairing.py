@@ -18,7 +18,26 @@ _SECRET = b64decode(
 PinCallback = Callable[[], str]
 
 
-class PhilipsTVPairer:
+class _BasePairer:
+    """Common part of synchronous and asynchronous pairers: building the request payloads."""
+
+    device_info: DeviceInfo
+
+    def _get_request_payload(self) -> PairingRequestPayload:
+        return PairingRequestPayload(
+            scope=["read", "write", "control"],
+            device=self.device_info,
+        )
+
+    def _get_grant_payload(self, pin: str, timestamp: int) -> PairingGrantPayload:
+        signature = create_signature(_SECRET, f"{timestamp}{pin}".encode()).decode()
+        return PairingGrantPayload(
+            auth=PairingAuthInfo(pin=pin, auth_timestamp=timestamp, auth_signature=signature),
+            device=self.device_info,
+        )
+
+
+class PhilipsTVPairer(_BasePairer):
     """Encapsulates the pairing process and allows to perform it in a single call."""
 
     def __init__(self, api: PhilipsTVAPI, device_info: DeviceInfo) -> None:
@@ -69,16 +88,3 @@ class PhilipsTVPairer:
             raise PhilipsTVPairingError(grant_response)
 
         return (self.device_info.id, pair_response.auth_key)
-
-    def _get_request_payload(self) -> PairingRequestPayload:
-        return PairingRequestPayload(
-            scope=["read", "write", "control"],
-            device=self.device_info,
-        )
-
-    def _get_grant_payload(self, pin: str, timestamp: int) -> PairingGrantPayload:
-        signature = create_signature(_SECRET, f"{timestamp}{pin}".encode()).decode()
-        return PairingGrantPayload(
-            auth=PairingAuthInfo(pin=pin, auth_timestamp=timestamp, auth_signature=signature),
-            device=self.device_info,
-        )
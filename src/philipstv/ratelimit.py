@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+
+from ._paths import match_profile
+from .exceptions import PhilipsTVRateLimitError, PhilipsTVTimeoutError
+from .timeouts import remaining_time
+
+DEFAULT_CLASS = "default"
+"""Name of the endpoint class of all the paths without a specific limit."""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket limit of requests sent to a single class of endpoints."""
+
+    rate: float
+    """Number of requests per second allowed in the long run."""
+    burst: int = 1
+    """Number of requests which can be sent at once, after a period of inactivity."""
+
+
+DEFAULT_RATE_LIMIT = RateLimit(rate=10, burst=10)
+"""Limit of requests to paths without a specific limit, mostly reads."""
+
+DEFAULT_RATE_LIMITS: Mapping[str, RateLimit] = {
+    "input": RateLimit(rate=5, burst=3),
+    "ambilight": RateLimit(rate=20, burst=5),
+}
+"""Limits of the endpoint classes which the TVs are most sensitive to.
+
+Keys are API paths without the version prefix. A limit applies to the path itself and all paths
+below it, and all of them share a single bucket.
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """Snapshot of the usage counters of a single endpoint class of a :class:`RateLimiter`."""
+
+    requests: int = 0
+    """Number of requests let through."""
+    rejected: int = 0
+    """Number of requests rejected, because the queue was full or they would miss the deadline."""
+    queued: int = 0
+    """Number of requests currently waiting for their turn."""
+    max_queued: int = 0
+    """Maximum number of requests waiting at the same time."""
+    total_wait: float = 0
+    """Total number of seconds the requests waited for their turn."""
+    max_wait: float = 0
+    """Maximum number of seconds a single request waited for its turn."""
+
+
+class _Bucket:
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self.tokens = float(limit.burst)
+        self.updated = time.monotonic()
+        self.stats = RateLimitStats()
+
+    def reserve(self, method: str, url: str, max_queue: int, max_wait: float | None) -> float:
+        """Take a token and return how long to wait until it's actually available."""
+        now = time.monotonic()
+        self.tokens = min(self.limit.burst, self.tokens + (now - self.updated) * self.limit.rate)
+        self.updated = now
+        delay = max((1 - self.tokens) / self.limit.rate, 0)
+
+        if delay > 0 and self.stats.queued >= max_queue:
+            self.stats = replace(self.stats, rejected=self.stats.rejected + 1)
+            raise PhilipsTVRateLimitError(method, url)
+        if delay > 0 and max_wait is not None and delay > max_wait:
+            self.stats = replace(self.stats, rejected=self.stats.rejected + 1)
+            raise PhilipsTVTimeoutError(method, url)
+
+        self.tokens -= 1
+        queued = self.stats.queued + 1 if delay > 0 else self.stats.queued
+        self.stats = replace(
+            self.stats,
+            requests=self.stats.requests + 1,
+            queued=queued,
+            max_queued=max(self.stats.max_queued, queued),
+            total_wait=self.stats.total_wait + delay,
+            max_wait=max(self.stats.max_wait, delay),
+        )
+        return delay
+
+    def release(self) -> None:
+        self.stats = replace(self.stats, queued=self.stats.queued - 1)
+
+
+class RateLimiter:
+    """Limits the rate of requests sent to a TV, queueing requests over the limit.
+
+    The embedded HTTP server of the TV drops requests or stops responding when it receives too many
+    of them at once, e.g. during a burst of key presses. Each endpoint class has a separate token
+    bucket with a given :class:`RateLimit`. Requests over the limit wait for their turn in the order
+    of arrival. If ``max_queue`` requests of the same class are already waiting, the request fails
+    immediately with :class:`~philipstv.PhilipsTVRateLimitError`. The waiting also respects the
+    current :func:`~philipstv.deadline`.
+
+    The limiter is thread-safe and works with both :class:`~philipstv.PhilipsTV` and
+    :class:`~philipstv.aio.AsyncPhilipsTV`, but a single instance should be used only with a
+    single TV::
+
+        tv = PhilipsTV("192.168.0.100", rate_limiter=RateLimiter())
+
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimit] = DEFAULT_RATE_LIMITS,
+        default: RateLimit | None = DEFAULT_RATE_LIMIT,
+        max_queue: int = 32,
+    ) -> None:
+        """
+        Args:
+            limits: Limits of endpoint classes, see :data:`DEFAULT_RATE_LIMITS`.
+            default: Limit of all the other paths. ``None`` means no limit.
+            max_queue: Maximum number of requests of a single class waiting for their turn.
+
+        """
+        self.limits = limits
+        self.default = default
+        self.max_queue = max_queue
+
+        self._lock = threading.Lock()
+        self._buckets = {name: _Bucket(limit) for name, limit in limits.items()}
+        if default is not None:
+            self._buckets[DEFAULT_CLASS] = _Bucket(default)
+
+    @property
+    def stats(self) -> dict[str, RateLimitStats]:
+        """Usage counters of each endpoint class, the key of the other paths is ``"default"``."""
+        with self._lock:
+            return {name: bucket.stats for name, bucket in self._buckets.items()}
+
+    def acquire(self, method: str, url: str, path: str) -> None:
+        """Wait until the request to the given path can be sent.
+
+        Raises:
+            PhilipsTVRateLimitError: If the queue is full.
+            PhilipsTVTimeoutError: If the request would have to wait past the current deadline.
+
+        """
+        if (bucket := self._bucket(path)) is None:
+            return
+        if (delay := self._reserve(bucket, method, url)) > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release(bucket)
+
+    async def aacquire(self, method: str, url: str, path: str) -> None:
+        """Asynchronous version of :func:`acquire`."""
+        if (bucket := self._bucket(path)) is None:
+            return
+        if (delay := self._reserve(bucket, method, url)) > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._release(bucket)
+
+    def _bucket(self, path: str) -> _Bucket | None:
+        return self._buckets.get(match_profile(path, self.limits) or DEFAULT_CLASS)
+
+    def _reserve(self, bucket: _Bucket, method: str, url: str) -> float:
+        max_wait = remaining_time()
+        with self._lock:
+            return bucket.reserve(method, url, self.max_queue, max_wait)
+
+    def _release(self, bucket: _Bucket) -> None:
+        with self._lock:
+            bucket.release()
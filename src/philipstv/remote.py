@@ -1,32 +1,87 @@
 import platform
-
+import time
+from collections.abc import Callable, Iterable, Iterator
+from types import TracebackType
+from typing import Any, TypeVar
+
+from ._channels import DEFAULT_CHANNELS_TTL, ChannelIndex
+from ._mirror import StateMirror
+from ._pool import DEFAULT_POOL_MAXSIZE
 from ._utils import create_device_id
 from .api import PhilipsTVAPI
-from .exceptions import PhilipsTVRemoteError
+from .auth import DigestChallengeStore
+from .exceptions import PhilipsTVAPIMalformedResponseError, PhilipsTVError, PhilipsTVRemoteError
 from .model import (
     AmbilightColor,
     AmbilightColors,
     AmbilightLayer,
-    AmbilightPower,
     AmbilightPowerValue,
     AmbilightTopology,
     Application,
-    Channel,
     ChannelID,
     DeviceInfo,
-    InputKey,
     InputKeyValue,
-    PowerState,
     PowerStateValue,
     SetChannel,
     Volume,
 )
+from .notify import Change, ChangeCallback, ChangeSubscription
 from .pairing import PhilipsTVPairer, PinCallback
+from .snapshot import STATE_FIELDS, TVState, state_from_snapshot, state_snapshot_fields
 from .tv import PhilipsTV
 from .types import Credentials
 
 __all__ = ["AmbilightColor", "InputKeyValue", "PhilipsTVRemote"]
 
+# API paths whose models are used by the remote.
+_MODEL_PATHS = (
+    "powerstate",
+    "audio/volume",
+    "activities/tv",
+    "channeldb/tv/channelLists/all",
+    "ambilight/power",
+    "ambilight/topology",
+    "applications",
+)
+
+_T = TypeVar("_T")
+
+
+def _create_device_info(id: str) -> DeviceInfo:
+    uname_info = platform.uname()
+    return DeviceInfo(
+        id=id,
+        device_name=uname_info.node,
+        device_os=uname_info.system,
+        app_id="69",
+        app_name="philipstv",
+        type="native",
+    )
+
+
+def _create_ambilight_colors(
+    topology: AmbilightTopology,
+    color: AmbilightColor | None,
+    left: AmbilightColor | None,
+    top: AmbilightColor | None,
+    right: AmbilightColor | None,
+    bottom: AmbilightColor | None,
+) -> AmbilightColors:
+    sides = {}
+    if set_left := (left or color):
+        sides["left"] = _create_ambilight_side(set_left, topology.left)
+    if set_top := (top or color):
+        sides["top"] = _create_ambilight_side(set_top, topology.top)
+    if set_right := (right or color):
+        sides["right"] = _create_ambilight_side(set_right, topology.right)
+    if set_bottom := (bottom or color):
+        sides["bottom"] = _create_ambilight_side(set_bottom, topology.bottom)
+    return AmbilightColors({"layer1": AmbilightLayer(**sides)})
+
+
+def _create_ambilight_side(color: AmbilightColor, points: int) -> dict[str, AmbilightColor]:
+    return {str(point): color for point in range(points)}
+
 
 class PhilipsTVRemote:
     """High level interface to the TV.
@@ -42,14 +97,36 @@ class PhilipsTVRemote:
 
     """
 
-    def __init__(self, api: PhilipsTVAPI) -> None:
+    def __init__(
+        self,
+        api: PhilipsTVAPI,
+        *,
+        state_ttl: float = 0,
+        channels_ttl: float = DEFAULT_CHANNELS_TTL,
+    ) -> None:
         """
         Args:
             api: Instance of an API to be used by the remote.
+            state_ttl: Number of seconds for which the power state, volume, channel and Ambilight
+                power, once set or read by this remote, are returned without sending a request.
+                Values set by the remote are assumed to be applied by the TV. Responses of later
+                reads, :func:`get_state` and :func:`subscribe` notifications replace them. ``0``
+                always reads the values from the TV.
+            channels_ttl: Number of seconds for which the downloaded channel list is used without
+                checking whether its version changed. ``0`` checks it on each use.
+
+        Raises:
+            ValueError: If any of the API paths used by the remote is validated as
+                :attr:`~philipstv.ValidationLevel.RAW`.
 
         """
+        api._require_models(_MODEL_PATHS, "PhilipsTVRemote")
         self._api = api
-        self._channels_cache: list[Channel] = []
+        self._mirror = StateMirror(state_ttl) if state_ttl > 0 else None
+        self._channels_cache: ChannelIndex | None = None
+        self._channels_version: tuple[str, str] | None = None
+        self._channels_ttl = channels_ttl
+        self._channels_checked_at = 0.0
         self._applications_cache: list[Application] = []
         self._ambilight_topology_cache: AmbilightTopology | None = None
 
@@ -78,7 +155,18 @@ class PhilipsTVRemote:
         self._api.auth = value
 
     @classmethod
-    def new(cls, host: str, auth: Credentials | None = None) -> "PhilipsTVRemote":
+    def new(
+        cls,
+        host: str,
+        auth: Credentials | None = None,
+        *,
+        digest_store: DigestChallengeStore | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keepalive_expiry: float | None = None,
+        state_ttl: float = 0,
+        channels_ttl: float = DEFAULT_CHANNELS_TTL,
+    ) -> "PhilipsTVRemote":
         """Create a new remote for given host without the need to inject:class:`PhilipsTVAPI`
         instance.
 
@@ -86,9 +174,42 @@ class PhilipsTVRemote:
             host: IP address of the TV.
             auth: Authentication credentials. If not given, the only feature you will be able to
                 use is pairing: :func:`pair`.
+            digest_store: Store persisting the digest authentication state.
+            pool_maxsize: Maximum number of connections kept open for reuse.
+            pool_block: Whether to wait for a free connection when all of them are in use.
+            keepalive_expiry: Number of seconds after which an idle connection is closed.
+            state_ttl: Number of seconds for which the values set or read by the remote are
+                returned without sending a request.
+            channels_ttl: Number of seconds for which the downloaded channel list is used without
+                checking whether its version changed.
+
+        See :class:`PhilipsTV` and :class:`PhilipsTVRemote` for details of the keyword arguments.
 
         """
-        return cls(PhilipsTVAPI(PhilipsTV(host=host, auth=auth)))
+        tv = PhilipsTV(
+            host=host,
+            auth=auth,
+            digest_store=digest_store,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keepalive_expiry=keepalive_expiry,
+        )
+        return cls(PhilipsTVAPI(tv), state_ttl=state_ttl, channels_ttl=channels_ttl)
+
+    def close(self) -> None:
+        """Close the underlying :class:`PhilipsTVAPI` instance."""
+        self._api.close()
+
+    def __enter__(self) -> "PhilipsTVRemote":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def pair(self, pin_callback: PinCallback, id: str | None = None) -> Credentials:
         """Perform pairing with the TV.
@@ -107,17 +228,7 @@ class PhilipsTVRemote:
             A tuple of acquired authentication credentials.
 
         """
-        id = id or create_device_id()
-        uname_info = platform.uname()
-        device_info = DeviceInfo(
-            id=id,
-            device_name=uname_info.node,
-            device_os=uname_info.system,
-            app_id="69",
-            app_name="philipstv",
-            type="native",
-        )
-        pairer = PhilipsTVPairer(self._api, device_info)
+        pairer = PhilipsTVPairer(self._api, _create_device_info(id or create_device_id()))
         return pairer.pair(pin_callback)
 
     def get_power(self) -> bool:
@@ -127,7 +238,9 @@ class PhilipsTVRemote:
             A power state. `True` means on, `False` means standby.
 
         """
-        return self._api.get_powerstate().powerstate == PowerStateValue.ON
+        return self._read(
+            "power", lambda: self._api.get_powerstate().powerstate == PowerStateValue.ON
+        )
 
     def set_power(self, power: bool) -> None:
         """Set current power state.
@@ -137,11 +250,11 @@ class PhilipsTVRemote:
 
         """
         value = PowerStateValue.ON if power is True else PowerStateValue.STANDBY
-        self._api.set_powerstate(PowerState(powerstate=value))
+        self._write("power", power, lambda: self._api.set_powerstate(value))
 
     def get_volume(self) -> int:
         """Return current volume."""
-        return self._api.get_volume().current
+        return self._read("volume", lambda: self._api.get_volume().current)
 
     def set_volume(self, volume: int) -> None:
         """Set current volume.
@@ -150,7 +263,7 @@ class PhilipsTVRemote:
             volume: Volume value to set.
 
         """
-        self._api.set_volume(Volume(current=volume))
+        self._write("volume", volume, lambda: self._api.set_volume(Volume(current=volume)))
 
     def get_current_channel(self) -> str:
         """Return current TV channel.
@@ -162,46 +275,81 @@ class PhilipsTVRemote:
             Current TV channel name.
 
         """
-        return self._api.get_current_channel().channel.name
+        return self._read("channel", lambda: self._api.get_current_channel().channel.name)
 
     def set_channel(self, channel: int | str) -> None:
         """Change to the given TV channel.
 
-        Use :func:`get_all_channels` to find valid values.
+        Use :func:`get_all_channels` to find valid values. The channel list is cached, and
+        downloaded again only if its version changes.
 
         If the TV currently displays something different than television (any app), it will go to
         the television.
 
+        Channels are looked up by number or by name. Names are matched exactly, or ignoring the
+        case if no channel has the exact name.
+
         Args:
             channel: Number or name of the channel to change to.
 
         Raises:
+            PhilipsTVRemoteAmbiguousChannelError: If more than one channel has the given number or
+                name.
             PhilipsTVRemoteError: If invalid channel number or name is given.
 
         """
-        if not self._channels_cache:
-            self._channels_cache = self._api.get_all_channels().channel
+        found_channel = self._get_channels().find(channel)
 
-        if isinstance(channel, str):
-            matching = filter(lambda chan: chan.name == channel, self._channels_cache)
-        elif isinstance(channel, int):
-            matching = filter(lambda chan: chan.preset == str(channel), self._channels_cache)
-
-        found_channel = next(matching, None)
-        if not found_channel:
-            raise PhilipsTVRemoteError(f"Channel '{channel}' not available")
-
-        self._api.set_channel(SetChannel(channel=ChannelID(ccid=found_channel.ccid)))
+        payload = SetChannel(channel=ChannelID(ccid=found_channel.ccid))
+        self._write("channel", found_channel.name, lambda: self._api.set_channel(payload))
 
     def get_all_channels(self) -> dict[int, str]:
         """Return all available channels and their numbers.
 
+        The list is downloaded again only if its version changed since the last download, e.g.
+        after the channels were rescanned.
+
         Returns:
             A mapping of channel number to channel name.
 
         """
-        self._channels_cache = self._api.get_all_channels().channel
-        return {int(channel.preset): channel.name for channel in self._channels_cache}
+        return {int(channel.preset): channel.name for channel in self._get_channels().channels}
+
+    def iter_all_channels(self) -> Iterator[tuple[int, str]]:
+        """Yield all available channels numbers and names, as they're received from the TV.
+
+        Unlike :func:`get_all_channels`, this doesn't wait for the whole list, which takes a while
+        on TVs with many channels. The channels aren't cached for :func:`set_channel`.
+
+        Yields:
+            Tuples of channel number and channel name.
+
+        """
+        for channel in self._api.iter_all_channels():
+            yield int(channel.preset), channel.name
+
+    def _get_channels(self) -> ChannelIndex:
+        if (
+            self._channels_cache
+            and time.monotonic() - self._channels_checked_at < self._channels_ttl
+        ):
+            return self._channels_cache
+        # The full list takes megabytes, the current channel reports its version cheaply.
+        version = self._current_channels_version()
+        if not self._channels_cache or version is None or version != self._channels_version:
+            all_channels = self._api.get_all_channels(fresh=self._channels_cache is not None)
+            self._channels_cache = ChannelIndex(all_channels.channel)
+            self._channels_version = version
+        self._channels_checked_at = time.monotonic()
+        return self._channels_cache
+
+    def _current_channels_version(self) -> tuple[str, str] | None:
+        try:
+            channel_list = self._api.get_current_channel().channel_list
+        except (PhilipsTVError, PhilipsTVAPIMalformedResponseError):
+            # Unknown, so the list is downloaded again to be sure it's up to date.
+            return None
+        return channel_list.id, channel_list.version
 
     def input_key(self, key: InputKeyValue) -> None:
         """Emulate pressing a key on the TV remote.
@@ -210,7 +358,12 @@ class PhilipsTVRemote:
             key: A key value to send to the TV.
 
         """
-        self._api.input_key(InputKey(key=key))
+        try:
+            self._api.input_key(key)
+        finally:
+            # Keys can change any part of the state.
+            if self._mirror:
+                self._mirror.discard()
 
     def get_ambilight_power(self) -> bool:
         """Return current ambilight power state.
@@ -219,7 +372,10 @@ class PhilipsTVRemote:
             Ambilight power state. `True` means on, `False` means off.
 
         """
-        return self._api.get_ambilight_power().power == AmbilightPowerValue.ON
+        return self._read(
+            "ambilight_power",
+            lambda: self._api.get_ambilight_power().power == AmbilightPowerValue.ON,
+        )
 
     def set_ambilight_power(self, power: bool) -> None:
         """Set ambilight power state.
@@ -229,7 +385,11 @@ class PhilipsTVRemote:
 
         """
         value = AmbilightPowerValue.ON if power is True else AmbilightPowerValue.OFF
-        self._api.set_ambilight_power(AmbilightPower(power=value))
+        self._write(
+            "ambilight_power",
+            power,
+            lambda: self._api.set_ambilight_power(value),
+        )
 
     def set_ambilight_color(
         self,
@@ -261,25 +421,11 @@ class PhilipsTVRemote:
         if not self._ambilight_topology_cache:
             self._ambilight_topology_cache = self._api.get_ambilight_topology()
 
-        topology = self._ambilight_topology_cache
-        sides = {}
-        if set_left := (left or color):
-            sides["left"] = self._create_ambilight_side(set_left, topology.left)
-        if set_top := (top or color):
-            sides["top"] = self._create_ambilight_side(set_top, topology.top)
-        if set_right := (right or color):
-            sides["right"] = self._create_ambilight_side(set_right, topology.right)
-        if set_bottom := (bottom or color):
-            sides["bottom"] = self._create_ambilight_side(set_bottom, topology.bottom)
-
-        colors = AmbilightColors({"layer1": AmbilightLayer(**sides)})
+        colors = _create_ambilight_colors(
+            self._ambilight_topology_cache, color, left, top, right, bottom
+        )
         self._api.set_ambilight_cached(colors)
 
-    def _create_ambilight_side(
-        self, color: AmbilightColor, points: int
-    ) -> dict[str, AmbilightColor]:
-        return {str(point): color for point in range(points)}
-
     def get_applications(self) -> list[str]:
         """Return a list of available applications.
 
@@ -312,3 +458,76 @@ class PhilipsTVRemote:
             raise PhilipsTVRemoteError(f"Application '{application}' not available")
 
         self._api.launch_application(found_application)
+
+    def get_state(self, fields: Iterable[str] = STATE_FIELDS) -> TVState:
+        """Return the current state of the TV, fetching all its parts concurrently.
+
+        Takes about as long as a single request. See :func:`PhilipsTVAPI.get_snapshot`.
+
+        Args:
+            fields: Names of the fields to fetch, see :data:`~philipstv.snapshot.STATE_FIELDS`.
+                The others are left empty.
+
+        Returns:
+            The state with the requested fields. Failed fields are ``None``, and their errors are
+            in :attr:`~philipstv.snapshot.TVState.errors`.
+
+        Raises:
+            ValueError: If any of the fields is unknown.
+
+        """
+        version = self._mirror.version if self._mirror else 0
+        state = state_from_snapshot(self._api.get_snapshot(state_snapshot_fields(fields)))
+        if self._mirror:
+            self._mirror.read_state(state, version)
+        return state
+
+    def subscribe(self, callback: ChangeCallback, poll_interval: float = 1.0) -> ChangeSubscription:
+        """Call the callback whenever the power state, volume or current channel changes.
+
+        Uses the ``notifychange`` long-poll if the TV supports it, and polling otherwise. See
+        :func:`PhilipsTVAPI.subscribe` for details::
+
+            with remote.subscribe(lambda change: print(change.node, change.value)):
+                time.sleep(60)
+
+        Args:
+            callback: Function called from a background thread with each change.
+            poll_interval: Number of seconds between requests when polling or retrying.
+
+        Returns:
+            The running subscription, which should be stopped when no longer needed.
+
+        """
+        if self._mirror is None:
+            return self._api.subscribe(callback, poll_interval=poll_interval)
+        mirror = self._mirror
+
+        def update_and_callback(change: Change) -> None:
+            mirror.notify(change)
+            callback(change)
+
+        return self._api.subscribe(update_and_callback, poll_interval=poll_interval)
+
+    def _read(self, field: str, read: Callable[[], _T]) -> _T:
+        if self._mirror is None:
+            return read()
+        value: _T | None = self._mirror.get(field)
+        if value is not None:
+            return value
+        version = self._mirror.version
+        value = read()
+        self._mirror.read(field, value, version)
+        return value
+
+    def _write(self, field: str, value: Any, write: Callable[[], None]) -> None:
+        if self._mirror is None:
+            write()
+            return
+        try:
+            write()
+        except BaseException:
+            # The TV may or may not have applied the value.
+            self._mirror.discard(field)
+            raise
+        self._mirror.write(field, value)
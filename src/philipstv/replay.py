@@ -0,0 +1,325 @@
+import gzip
+import io
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, TypeVar
+
+from .exceptions import PhilipsTVError, PhilipsTVTimeoutError
+from .transport import PhilipsTVRawTransport, PhilipsTVTransport
+from .types import Credentials
+
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """A single recorded request together with its outcome."""
+
+    method: str
+    """HTTP method of the request."""
+    path: str
+    """Requested path, without a leading slash."""
+    payload: Any
+    """Decoded JSON payload of the request, ``None`` if it had none, its text if it wasn't JSON."""
+    response: Any
+    """Decoded JSON body of the response, ``None`` if it had none or the request failed.
+
+    Bodies which aren't valid JSON are kept in :attr:`raw_response` instead.
+    """
+    elapsed: float
+    """Number of seconds the request took."""
+    status_code: int | None = None
+    """Status code of the error response, ``None`` if the request succeeded or got no response."""
+    error: str | None = None
+    """``"timeout"`` or ``"error"`` if the request failed, ``None`` if it succeeded."""
+    raw_response: str | None = None
+    """Text of the response body if it wasn't valid JSON, ``None`` otherwise."""
+
+
+def save_exchanges(exchanges: Iterable[Exchange], path: Path | str) -> None:
+    """Save the exchanges to a JSON lines file, compressed with gzip if its name ends with ``.gz``.
+
+    Args:
+        exchanges: Exchanges to save.
+        path: Path of the file.
+
+    """
+    with _open(Path(path), "wt") as file:
+        for exchange in exchanges:
+            file.write(json.dumps(asdict(exchange), separators=(",", ":")) + "\n")
+
+
+def load_exchanges(path: Path | str) -> list[Exchange]:
+    """Load the exchanges saved by :func:`save_exchanges`.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The exchanges in the recorded order.
+
+    """
+    with _open(Path(path), "rt") as file:
+        return [Exchange(**json.loads(line)) for line in file if line.strip()]
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return io.TextIOWrapper(gzip.GzipFile(path, mode[0]), encoding="utf-8")
+    return path.open(mode[0], encoding="utf-8")
+
+
+def _normalize(path: str) -> str:
+    return path.lstrip("/")
+
+
+def _encode(value: Any) -> bytes:
+    return b"" if value is None else json.dumps(value).encode()
+
+
+def _decode(content: bytes | None) -> Any:
+    return json.loads(content) if content else None
+
+
+def _decode_raw(content: bytes | None) -> tuple[Any, str | None]:
+    """Decode the raw body, falling back to its text if it isn't valid JSON."""
+    try:
+        return _decode(content), None
+    except ValueError:
+        assert content is not None
+        return None, content.decode(errors="replace")
+
+
+def _decode_payload(body: bytes | None) -> Any:
+    payload, text = _decode_raw(body)
+    return payload if text is None else text
+
+
+class RecordingTransport:
+    """Transport recording all the requests sent through another transport.
+
+    Wraps e.g. a :class:`~philipstv.PhilipsTV` talking to a real TV and records every request, its
+    response and how long it took. The recorded :attr:`exchanges` can be saved and served later by
+    :class:`ReplayTransport`, without the TV::
+
+        with RecordingTransport(PhilipsTV("192.168.0.100", auth=("id", "key"))) as tv:
+            PhilipsTVRemote(PhilipsTVAPI(tv)).get_volume()
+        tv.save("session.jsonl.gz")
+
+    """
+
+    def __init__(self, tv: PhilipsTVTransport) -> None:
+        """
+        Args:
+            tv: Transport sending the actual requests.
+
+        """
+        self._tv = tv
+        self._lock = threading.Lock()
+        self._exchanges: list[Exchange] = []
+
+    @property
+    def host(self) -> str:
+        """IP address of the wrapped transport."""
+        return self._tv.host
+
+    @property
+    def auth(self) -> Credentials | None:
+        """Credentials of the wrapped transport."""
+        return self._tv.auth
+
+    @auth.setter
+    def auth(self, value: Credentials | None) -> None:
+        self._tv.auth = value
+
+    @property
+    def exchanges(self) -> list[Exchange]:
+        """Exchanges recorded so far, in order of their completion."""
+        with self._lock:
+            return list(self._exchanges)
+
+    def save(self, path: Path | str) -> None:
+        """Save the recorded exchanges using :func:`save_exchanges`."""
+        save_exchanges(self.exchanges, path)
+
+    def get(self, path: str) -> Any:
+        return self._record("GET", path, None, lambda: self._tv.get(path))
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        return self._record("POST", path, payload, lambda: self._tv.post(path, payload))
+
+    def get_raw(self, path: str) -> bytes:
+        if isinstance(self._tv, PhilipsTVRawTransport):
+            raw_tv = self._tv
+            return self._record("GET", path, None, lambda: raw_tv.get_raw(path), _decode_raw)
+        return _encode(self.get(path))
+
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        if isinstance(self._tv, PhilipsTVRawTransport):
+            raw_tv = self._tv
+            return self._record(
+                "POST",
+                path,
+                _decode_payload(body),
+                lambda: raw_tv.post_raw(path, body),
+                _decode_raw,
+            )
+        return _encode(self.post(path, _decode(body)))
+
+    def close(self) -> None:
+        self._tv.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _record(
+        self,
+        method: str,
+        path: str,
+        payload: Any,
+        send: Callable[[], _R],
+        decode: Callable[[_R], tuple[Any, str | None]] = lambda response: (response, None),
+    ) -> _R:
+        started = time.perf_counter()
+        try:
+            response = send()
+        except PhilipsTVError as exc:
+            error = "timeout" if isinstance(exc, PhilipsTVTimeoutError) else "error"
+            elapsed = time.perf_counter() - started
+            self._append(
+                Exchange(method, _normalize(path), payload, None, elapsed, exc.status_code, error)
+            )
+            raise
+        elapsed = time.perf_counter() - started
+        body, raw_body = decode(response)
+        self._append(
+            Exchange(method, _normalize(path), payload, body, elapsed, raw_response=raw_body)
+        )
+        return response
+
+    def _append(self, exchange: Exchange) -> None:
+        with self._lock:
+            self._exchanges.append(exchange)
+
+
+class ReplayTransport:
+    """Transport serving previously recorded exchanges instead of talking to a TV.
+
+    Implements the same interface as :class:`~philipstv.PhilipsTV`, so higher layers work the same
+    way, but deterministically and without the hardware. Useful for benchmarks and regression
+    tests of whole :class:`~philipstv.PhilipsTVRemote` workflows::
+
+        tv = ReplayTransport.load("session.jsonl.gz", latency=1.0)
+        PhilipsTVRemote(PhilipsTVAPI(tv)).get_volume()
+
+    Requests are matched by method, path and payload. Repeated identical requests receive the
+    recorded responses in the recorded order, and the last one is repeated once they run out.
+    Requests which were never recorded fail with :class:`~philipstv.PhilipsTVError` with status
+    404.
+    """
+
+    def __init__(
+        self, exchanges: Iterable[Exchange], *, host: str = "", latency: float = 0.0
+    ) -> None:
+        """
+        Args:
+            exchanges: Exchanges to serve, e.g. :attr:`RecordingTransport.exchanges`.
+            host: IP address reported by the transport.
+            latency: Multiplier of the recorded time of each request, for which the transport
+                sleeps before responding. ``1.0`` reproduces the original latency, ``0`` responds
+                immediately.
+
+        """
+        self.host = host
+        self.auth: Credentials | None = None
+        self.latency = latency
+
+        self._lock = threading.Lock()
+        self._exchanges: dict[tuple[str, str, str], deque[Exchange]] = {}
+        for exchange in exchanges:
+            key = self._key(exchange.method, exchange.path, exchange.payload)
+            self._exchanges.setdefault(key, deque()).append(exchange)
+
+    @classmethod
+    def load(cls, path: Path | str, *, host: str = "", latency: float = 0.0) -> "ReplayTransport":
+        """Create the transport serving the exchanges saved in the given file.
+
+        Args:
+            path: Path of the file saved by :func:`save_exchanges`.
+            host: See :class:`ReplayTransport`.
+            latency: See :class:`ReplayTransport`.
+
+        """
+        return cls(load_exchanges(path), host=host, latency=latency)
+
+    def get(self, path: str) -> Any:
+        return self._response(self._replay("GET", path, None))
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        return self._response(self._replay("POST", path, payload))
+
+    def get_raw(self, path: str) -> bytes:
+        return self._content(self._replay("GET", path, None))
+
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        return self._content(self._replay("POST", path, _decode_payload(body)))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ReplayTransport":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _replay(self, method: str, path: str, payload: Any) -> Exchange:
+        with self._lock:
+            queue = self._exchanges.get(self._key(method, path, payload))
+            if not queue:
+                raise PhilipsTVError(method, path, 404)
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+
+        if self.latency > 0:
+            time.sleep(exchange.elapsed * self.latency)
+        if exchange.error == "timeout":
+            raise PhilipsTVTimeoutError(method, path)
+        if exchange.error is not None:
+            raise PhilipsTVError(method, path, exchange.status_code)
+        return exchange
+
+    @staticmethod
+    def _response(exchange: Exchange) -> Any:
+        # Fails to decode the invalid body just like the real transport.
+        if exchange.raw_response is not None:
+            return json.loads(exchange.raw_response)
+        return exchange.response
+
+    @staticmethod
+    def _content(exchange: Exchange) -> bytes:
+        if exchange.raw_response is not None:
+            return exchange.raw_response.encode()
+        return _encode(exchange.response)
+
+    @staticmethod
+    def _key(method: str, path: str, payload: Any) -> tuple[str, str, str]:
+        return method, _normalize(path), json.dumps(payload, sort_keys=True)
@@ -0,0 +1,38 @@
+from collections.abc import Iterable
+
+from .model import CurrentSetting, CurrentSettings, CurrentSettingsPayload, SettingNodeID
+
+DEFAULT_SETTINGS_CHUNK_SIZE = 25
+"""Maximum number of setting nodes read by a single request of
+:func:`~philipstv.PhilipsTVAPI.get_settings`."""
+
+
+def settings_payloads(nodes: Iterable[int], chunk_size: int) -> list[CurrentSettingsPayload]:
+    """Split the nodes into requests of at most ``chunk_size`` nodes, skipping duplicates.
+
+    Raises:
+        ValueError: If ``chunk_size`` isn't positive.
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+    unique = list(dict.fromkeys(nodes))
+    return [
+        CurrentSettingsPayload(
+            nodes=[SettingNodeID(nodeid=node) for node in unique[start : start + chunk_size]]
+        )
+        for start in range(0, len(unique), chunk_size)
+    ]
+
+
+def settings_by_node(responses: Iterable[CurrentSettings]) -> dict[int, CurrentSetting]:
+    """Merge the settings from the responses into a mapping of node IDs to the settings."""
+    settings = {}
+    for response in responses:
+        for entry in response.values:
+            setting = entry.value
+            # Some TVs send the value next to the setting instead of inside it.
+            if entry.data is not None:
+                setting = setting.model_copy(update={"data": entry.data})
+            settings[setting.node_id] = setting
+    return settings
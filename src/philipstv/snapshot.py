@@ -0,0 +1,152 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from .exceptions import PhilipsError
+from .model import (
+    AmbilightMode,
+    AmbilightPower,
+    AmbilightPowerValue,
+    APIObject,
+    CurrentChannel,
+    CurrentVolume,
+    PowerState,
+    PowerStateValue,
+)
+
+SNAPSHOT_FIELDS = ("powerstate", "volume", "current_channel", "ambilight_power", "ambilight_mode")
+"""Names of all the fields of :class:`TVSnapshot`, fetched by default."""
+
+STATE_FIELDS = ("power", "volume", "channel", "ambilight_power", "ambilight_mode")
+"""Names of all the fields of :class:`TVState`, fetched by default."""
+
+_SNAPSHOT_GETTERS = {
+    "powerstate": "get_powerstate",
+    "volume": "get_volume",
+    "current_channel": "get_current_channel",
+    "ambilight_power": "get_ambilight_power",
+    "ambilight_mode": "get_ambilight_mode",
+}
+
+_SNAPSHOT_PATHS = {
+    "powerstate": "powerstate",
+    "volume": "audio/volume",
+    "current_channel": "activities/tv",
+    "ambilight_power": "ambilight/power",
+    "ambilight_mode": "ambilight/mode",
+}
+
+_STATE_SNAPSHOT_FIELDS = {
+    "power": "powerstate",
+    "volume": "volume",
+    "channel": "current_channel",
+    "ambilight_power": "ambilight_power",
+    "ambilight_mode": "ambilight_mode",
+}
+
+
+@dataclass(frozen=True)
+class TVSnapshot:
+    """State of the TV fetched at once by :func:`~philipstv.PhilipsTVAPI.get_snapshot`.
+
+    Fields which weren't requested, or failed to be fetched, are ``None``. The error of each failed
+    field is in :attr:`errors`.
+    """
+
+    powerstate: PowerState | None = None
+    """Response of :func:`~philipstv.PhilipsTVAPI.get_powerstate`."""
+    volume: CurrentVolume | None = None
+    """Response of :func:`~philipstv.PhilipsTVAPI.get_volume`."""
+    current_channel: CurrentChannel | None = None
+    """Response of :func:`~philipstv.PhilipsTVAPI.get_current_channel`."""
+    ambilight_power: AmbilightPower | None = None
+    """Response of :func:`~philipstv.PhilipsTVAPI.get_ambilight_power`."""
+    ambilight_mode: AmbilightMode | None = None
+    """Response of :func:`~philipstv.PhilipsTVAPI.get_ambilight_mode`."""
+    errors: Mapping[str, PhilipsError] = field(default_factory=dict)
+    """Mapping of names of the fields which failed to be fetched to their errors."""
+
+
+@dataclass(frozen=True)
+class TVState:
+    """State of the TV fetched at once by :func:`~philipstv.PhilipsTVRemote.get_state`.
+
+    Fields which weren't requested, or failed to be fetched, are ``None``. The error of each failed
+    field is in :attr:`errors`.
+    """
+
+    power: bool | None = None
+    """Power state, see :func:`~philipstv.PhilipsTVRemote.get_power`."""
+    volume: int | None = None
+    """Volume, see :func:`~philipstv.PhilipsTVRemote.get_volume`."""
+    channel: str | None = None
+    """Current channel, see :func:`~philipstv.PhilipsTVRemote.get_current_channel`."""
+    ambilight_power: bool | None = None
+    """Ambilight power state, see :func:`~philipstv.PhilipsTVRemote.get_ambilight_power`."""
+    ambilight_mode: str | None = None
+    """Ambilight mode, e.g. ``"internal"``."""
+    errors: Mapping[str, PhilipsError] = field(default_factory=dict)
+    """Mapping of names of the fields which failed to be fetched to their errors."""
+
+
+def snapshot_getters(fields: Iterable[str]) -> dict[str, str]:
+    """Return the names of API methods fetching the given snapshot fields.
+
+    Raises:
+        ValueError: If any of the fields is unknown.
+
+    """
+    getters = {}
+    for name in fields:
+        if name not in _SNAPSHOT_GETTERS:
+            raise ValueError(f"Unknown snapshot field: {name}")
+        getters[name] = _SNAPSHOT_GETTERS[name]
+    return getters
+
+
+def snapshot_paths(fields: Iterable[str]) -> list[str]:
+    """Return the API paths of the given, already checked, snapshot fields."""
+    return [_SNAPSHOT_PATHS[name] for name in fields]
+
+
+def state_snapshot_fields(fields: Iterable[str]) -> list[str]:
+    """Return the snapshot fields needed to fill the given state fields.
+
+    Raises:
+        ValueError: If any of the fields is unknown.
+
+    """
+    snapshot_fields = []
+    for name in fields:
+        if name not in _STATE_SNAPSHOT_FIELDS:
+            raise ValueError(f"Unknown state field: {name}")
+        snapshot_fields.append(_STATE_SNAPSHOT_FIELDS[name])
+    return snapshot_fields
+
+
+def build_snapshot(results: Mapping[str, APIObject | PhilipsError]) -> TVSnapshot:
+    """Build the snapshot from the results of the getters, which are responses or errors."""
+    values = {name: result for name, result in results.items() if isinstance(result, APIObject)}
+    errors = {name: error for name, error in results.items() if isinstance(error, PhilipsError)}
+    return TVSnapshot(**values, errors=errors)  # type: ignore[arg-type]
+
+
+def state_from_snapshot(snapshot: TVSnapshot) -> TVState:
+    """Convert the snapshot of API responses to the state in simple values."""
+    return TVState(
+        power=(
+            snapshot.powerstate.powerstate == PowerStateValue.ON if snapshot.powerstate else None
+        ),
+        volume=snapshot.volume.current if snapshot.volume else None,
+        channel=snapshot.current_channel.channel.name if snapshot.current_channel else None,
+        ambilight_power=(
+            snapshot.ambilight_power.power == AmbilightPowerValue.ON
+            if snapshot.ambilight_power
+            else None
+        ),
+        ambilight_mode=snapshot.ambilight_mode.current if snapshot.ambilight_mode else None,
+        errors={
+            state_name: snapshot.errors[snapshot_name]
+            for state_name, snapshot_name in _STATE_SNAPSHOT_FIELDS.items()
+            if snapshot_name in snapshot.errors
+        },
+    )
@@ -0,0 +1,106 @@
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+
+from ._paths import match_profile
+
+_deadline: ContextVar[float | None] = ContextVar("philipstv_deadline", default=None)
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Timeouts of a single request, in seconds. ``None`` means no timeout."""
+
+    connect: float | None = None
+    """Maximum time to establish a connection with the TV."""
+    read: float | None = None
+    """Maximum time to wait for the TV between consecutive bytes of the response."""
+    total: float | None = None
+    """Overall time limit of the whole request, including reading the response body and the retry
+    after a digest authentication challenge. The body is checked between consecutive reads, so a
+    body sent slowly can exceed the limit by at most the read timeout."""
+
+
+DEFAULT_TIMEOUT = Timeout(connect=5, read=10, total=20)
+"""Timeout used for paths without a specific profile."""
+
+DEFAULT_TIMEOUT_PROFILES: Mapping[str, Timeout] = {
+    "input/key": Timeout(connect=2, read=3, total=5),
+    "powerstate": Timeout(connect=2, read=3, total=5),
+    "channeldb/tv/channelLists/all": Timeout(connect=5, read=30, total=60),
+    "notifychange": Timeout(connect=5, read=60, total=65),
+}
+"""Timeouts of the endpoints which need a shorter or a longer time than :data:`DEFAULT_TIMEOUT`.
+
+Keys are API paths without the version prefix. A profile applies to the path itself and all paths
+below it.
+"""
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Limit the total time of all requests sent within the context.
+
+    The deadline applies to every request sent to any TV, no matter which layer sends it, so it
+    can bound the time of e.g. whole :class:`~philipstv.PhilipsTVRemote` method call, even if it
+    sends multiple requests::
+
+        with deadline(2.5):
+            remote.set_channel("TVN HD")
+
+    Requests which would exceed the deadline fail with
+    :class:`~philipstv.PhilipsTVTimeoutError`. Nested deadlines can only shorten the outer
+    deadline, never extend it. Works with both threads and `asyncio` tasks.
+
+    Args:
+        seconds: Number of seconds from now, in which all the requests have to finish.
+
+    """
+    new_deadline = time.monotonic() + seconds
+    if (current := _deadline.get()) is not None:
+        new_deadline = min(new_deadline, current)
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Return the number of seconds left until the current :func:`deadline`.
+
+    Returns:
+        Remaining time or ``None`` if there's no active deadline.
+
+    """
+    if (current := _deadline.get()) is None:
+        return None
+    return current - time.monotonic()
+
+
+def timeout_for(
+    path: str, default: Timeout, profiles: Mapping[str, Timeout] = DEFAULT_TIMEOUT_PROFILES
+) -> Timeout:
+    """Resolve the timeout of a request to the given path.
+
+    The timeout of the most specific matching profile is used, or ``default`` if there's no
+    matching profile. The total timeout is then shortened to fit in the current :func:`deadline`.
+
+    Args:
+        path: Request path, with or without the API version prefix.
+        default: Timeout to use if no profile matches the path.
+        profiles: Mapping of API paths to their timeouts.
+
+    Returns:
+        The resolved timeout.
+
+    """
+    profile = match_profile(path, profiles)
+    timeout = profiles[profile] if profile is not None else default
+
+    if (remaining := remaining_time()) is not None:
+        total = remaining if timeout.total is None else min(timeout.total, remaining)
+        timeout = replace(timeout, total=max(total, 0))
+    return timeout
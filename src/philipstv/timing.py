@@ -0,0 +1,132 @@
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from .exceptions import PhilipsTVError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """Timings of the phases of a single request, in seconds, together with its outcome.
+
+    Phases which didn't happen during the request are ``0``, e.g. :attr:`connect` and :attr:`tls`
+    when an already open connection was reused.
+    """
+
+    method: str
+    """HTTP method of the request."""
+    path: str
+    """Requested path, with the API version prefix and a leading slash."""
+    status_code: int | None
+    """Status code of the response, ``None`` if no response was received."""
+    request_size: int
+    """Size of the request body in bytes."""
+    response_size: int
+    """Size of the response body in bytes."""
+    queue_wait: float
+    """Time spent waiting for the :class:`~philipstv.RateLimiter`."""
+    connect: float
+    """Time spent opening a TCP connection."""
+    tls: float
+    """Time spent on the TLS handshake."""
+    ttfb: float
+    """Time from sending the request until the response headers arrived, excluding connecting."""
+    body_read: float
+    """Time spent reading the response body."""
+    json_decode: float
+    """Time spent decoding the JSON response body. With ``fast_json`` the body is decoded during
+    validation, so this is ``0``."""
+    validation: float
+    """Time spent validating the response into a model, only when measured by
+    :class:`~philipstv.PhilipsTVAPI`."""
+    total: float
+    """Total time of the request, including all the phases and the overhead between them."""
+
+
+TimingSink = Callable[[RequestTiming], None]
+"""Function receiving the :class:`RequestTiming` of each finished request."""
+
+
+class _Recorder:
+    """Mutable accumulator of the timings of a request in progress."""
+
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+        self.status_code: int | None = None
+        self.request_size = 0
+        self.response_size = 0
+        self.queue_wait = 0.0
+        self.connect = 0.0
+        self.tls = 0.0
+        self.ttfb = 0.0
+        self.body_read = 0.0
+        self.json_decode = 0.0
+        self.validation = 0.0
+        self.started = time.perf_counter()
+
+    def add_exchange(self, sent_at: float, headers_at: float, finished_at: float) -> None:
+        """Record sending the request and receiving the response, including any connecting."""
+        self.ttfb += headers_at - sent_at
+        self.body_read += finished_at - headers_at
+
+    def result(self) -> RequestTiming:
+        return RequestTiming(
+            method=self.method,
+            path=self.path,
+            status_code=self.status_code,
+            request_size=self.request_size,
+            response_size=self.response_size,
+            queue_wait=self.queue_wait,
+            connect=self.connect,
+            tls=self.tls,
+            # Connections are opened while waiting for the response, so it includes them.
+            ttfb=max(self.ttfb - self.connect - self.tls, 0),
+            body_read=self.body_read,
+            json_decode=self.json_decode,
+            validation=self.validation,
+            total=time.perf_counter() - self.started,
+        )
+
+
+_recorder: ContextVar[_Recorder | None] = ContextVar("philipstv_timing", default=None)
+
+
+def current_recorder() -> _Recorder | None:
+    """Return the recorder of the request in progress, ``None`` if no timings are recorded."""
+    return _recorder.get()
+
+
+@contextmanager
+def record(sink: TimingSink, method: str, path: str, *, shared: bool = True) -> Iterator[_Recorder]:
+    """Record the timings of a request sent within the context and pass them to the sink.
+
+    If the request is already being recorded by a higher layer, its recorder is shared, so the
+    sink receives the timings measured so far. With ``shared`` disabled the request is recorded
+    separately and its recorder isn't made current. This is required in generators, which can't
+    keep a context variable set between the yields.
+    """
+    recorder = _recorder.get() if shared else None
+    token = None
+    if recorder is None:
+        recorder = _Recorder(method, f"/{path.lstrip('/')}")
+        if shared:
+            token = _recorder.set(recorder)
+    try:
+        yield recorder
+    except PhilipsTVError as exc:
+        if recorder.status_code is None:
+            recorder.status_code = exc.status_code
+        raise
+    finally:
+        if token is not None:
+            _recorder.reset(token)
+        try:
+            sink(recorder.result())
+        except Exception:
+            _LOGGER.exception("Timing sink failed")
@@ -0,0 +1,87 @@
+from collections.abc import Generator
+from typing import Any, Protocol, runtime_checkable
+
+from .types import Credentials
+
+
+class PhilipsTVTransport(Protocol):
+    """Interface of the lowest layer, sending raw requests to the TV.
+
+    :class:`~philipstv.PhilipsTVAPI` works with any object implementing this protocol, which allows
+    replacing the HTTP client used to talk to the TV. Two implementations are included:
+    :class:`~philipstv.PhilipsTV` based on `requests` and :class:`~philipstv.Urllib3PhilipsTV` using
+    `urllib3` directly.
+    """
+
+    @property
+    def host(self) -> str:
+        """IP address of the TV."""
+        ...
+
+    @property
+    def auth(self) -> Credentials | None:
+        """Credentials used for authentication. Can be changed at any moment."""
+        ...
+
+    @auth.setter
+    def auth(self, value: Credentials | None) -> None: ...
+
+    def get(self, path: str) -> Any:
+        """Send `GET` request to the given path and return the decoded JSON response body."""
+        ...
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        """Send `POST` request with the JSON payload and return the decoded JSON response body."""
+        ...
+
+    def close(self) -> None:
+        """Release all resources, e.g. open connections."""
+        ...
+
+
+@runtime_checkable
+class PhilipsTVRawTransport(PhilipsTVTransport, Protocol):
+    """Transport which can also send and receive raw JSON bytes, skipping encoding and decoding.
+
+    Required by :class:`~philipstv.PhilipsTVAPI` with ``fast_json`` enabled. Both
+    :class:`~philipstv.PhilipsTV` and :class:`~philipstv.Urllib3PhilipsTV` implement it.
+    """
+
+    def get_raw(self, path: str) -> bytes:
+        """Send `GET` request to the given path and return the raw response body."""
+        ...
+
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        """Send `POST` request with the JSON encoded body and return the raw response body."""
+        ...
+
+
+@runtime_checkable
+class PhilipsTVStreamTransport(PhilipsTVTransport, Protocol):
+    """Transport which can also receive the response body in chunks, as it arrives.
+
+    Used by :class:`~philipstv.PhilipsTVAPI` to parse big responses incrementally, e.g. in
+    :func:`~philipstv.PhilipsTVAPI.iter_all_channels`. Both :class:`~philipstv.PhilipsTV` and
+    :class:`~philipstv.Urllib3PhilipsTV` implement it.
+    """
+
+    def get_stream(self, path: str, chunk_size: int = ...) -> Generator[bytes, None, None]:
+        """Send `GET` request to the given path and yield the raw response body in chunks.
+
+        Closing the generator before the end of the body discards the rest of the response.
+        """
+        ...
+
+
+@runtime_checkable
+class PhilipsTVPooledTransport(PhilipsTVTransport, Protocol):
+    """Transport keeping a pool of connections, which can be opened in advance.
+
+    Used by :class:`~philipstv.PhilipsTVAPI` to have a connection ready before sending a burst of
+    requests, e.g. in :func:`~philipstv.PhilipsTVAPI.input_keys`. Both
+    :class:`~philipstv.PhilipsTV` and :class:`~philipstv.Urllib3PhilipsTV` implement it.
+    """
+
+    def warm(self, connections: int = ...) -> int:
+        """Open connections to the TV in advance and return the number of ready connections."""
+        ...
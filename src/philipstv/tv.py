@@ -1,15 +1,39 @@
+import json
 import logging
-from collections.abc import Iterator
-from contextlib import contextmanager
-from typing import Any
-from urllib.parse import urljoin
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import replace
+from types import TracebackType
+from typing import Any, TypeVar
 
 import urllib3
-from requests import RequestException, Session
-from requests.auth import HTTPDigestAuth
-from urllib3.exceptions import InsecureRequestWarning
+from requests import ConnectTimeout as RequestsConnectTimeout
+from requests import RequestException, Response, Session
+from requests import Timeout as RequestsTimeout
+from urllib3 import HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError as Urllib3ConnectTimeoutError
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.exceptions import InsecureRequestWarning, NewConnectionError
+from urllib3.exceptions import TimeoutError as Urllib3TimeoutError
 
-from .exceptions import PhilipsTVError
+from ._pool import (
+    DEFAULT_POOL_MAXSIZE,
+    PoolingHTTPAdapter,
+    PoolStats,
+    _PoolCounters,
+    _TrackingHTTPSConnectionPool,
+    create_ssl_context,
+    create_tracking_pool,
+    warm_pool,
+)
+from .auth import DigestChallengeStore, SharedDigestAuth
+from .circuit import CircuitBreaker
+from .exceptions import PhilipsTVConnectTimeoutError, PhilipsTVError, PhilipsTVTimeoutError
+from .ratelimit import RateLimiter
+from .timeouts import DEFAULT_TIMEOUT, DEFAULT_TIMEOUT_PROFILES, Timeout, deadline, timeout_for
+from .timing import TimingSink, _Recorder, current_recorder, record
 from .types import Credentials
 
 urllib3.disable_warnings(InsecureRequestWarning)
@@ -17,39 +41,129 @@ urllib3.disable_warnings(InsecureRequestWarning)
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T", bound="_BasePhilipsTV")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+"""Default size of the chunks yielded by :func:`PhilipsTV.get_stream`, in bytes."""
+
 
 @contextmanager
 def _wrap_http_exceptions(method: str, url: str) -> Iterator[None]:
     try:
         yield
+    except RequestsConnectTimeout as exc:
+        raise PhilipsTVConnectTimeoutError(method, url) from exc
+    except RequestsTimeout as exc:
+        raise PhilipsTVTimeoutError(method, url) from exc
     except RequestException as exc:
         status_code = exc.response.status_code if exc.response is not None else None
         raise PhilipsTVError(method, url, status_code) from exc
 
 
-class PhilipsTV:
-    """Lowest level interface with the TV.
+@contextmanager
+def _wrap_urllib3_exceptions(method: str, url: str) -> Iterator[None]:
+    try:
+        yield
+    except NewConnectionError as exc:
+        # Subclass of `ConnectTimeoutError` for backwards compatibility, but it's not a timeout.
+        raise PhilipsTVError(method, url) from exc
+    except Urllib3ConnectTimeoutError as exc:
+        raise PhilipsTVConnectTimeoutError(method, url) from exc
+    except Urllib3TimeoutError as exc:
+        raise PhilipsTVTimeoutError(method, url) from exc
+    except Urllib3HTTPError as exc:
+        raise PhilipsTVError(method, url) from exc
+    # Raised directly only when connecting outside of a request.
+    except TimeoutError as exc:
+        raise PhilipsTVConnectTimeoutError(method, url) from exc
+    except OSError as exc:
+        raise PhilipsTVError(method, url) from exc
 
-    Used to send raw (without using model objects) `GET` and `POST` requests to any API path.
 
-    This handles authentication, exception handling, logging and URL building so higher layers don't
-    have to worry about this.
+def _urllib3_timeout(timeout: Timeout) -> urllib3.Timeout:
+    return urllib3.Timeout(connect=timeout.connect, read=timeout.read, total=timeout.total)
+
+
+def _expiry(timeout: Timeout) -> float | None:
+    """Return the :func:`time.monotonic` time at which the total timeout expires, if any."""
+    return None if timeout.total is None else time.monotonic() + timeout.total
+
+
+def _remaining_timeout(
+    timeout: Timeout, expires_at: float | None, method: str, url: str
+) -> Timeout:
+    """Return the timeout with the total shortened to the time left until ``expires_at``.
+
+    Raises:
+        PhilipsTVTimeoutError: If there's no time left.
+
     """
+    if expires_at is None:
+        return timeout
+    if (remaining := expires_at - time.monotonic()) <= 0:
+        raise PhilipsTVTimeoutError(method, url)
+    return replace(timeout, total=remaining)
 
-    def __init__(self, host: str, port: int = 1926, auth: Credentials | None = None) -> None:
-        """
-        Args:
-            host: TV IP address to connect to.
-            port: TV port to connect to.
-            auth: Authentication credentials tuple.
 
-        """
+def _read_body(
+    response: urllib3.BaseHTTPResponse,
+    chunk_size: int,
+    expires_at: float | None,
+    method: str,
+    url: str,
+) -> Iterator[bytes]:
+    """Yield the response body as it's received, until the total timeout expires.
+
+    Each read returns as soon as any data arrives, so a body sent slowly exceeds the total timeout
+    by at most the read timeout.
+
+    Raises:
+        PhilipsTVTimeoutError: If the total timeout expires before the end of the body.
+
+    """
+    while chunk := response.read1(chunk_size, decode_content=True):
+        if expires_at is not None and time.monotonic() > expires_at:
+            # The rest of the body is unread, so the connection can't be reused.
+            response.close()
+            response.release_conn()
+            raise PhilipsTVTimeoutError(method, url)
+        yield chunk
+
+
+class _BasePhilipsTV(ABC):
+    """Logic shared by all the HTTP backends: URL building, timeouts, logging and JSON handling.
+
+    Backends only have to implement the abstract methods, mainly sending the request in
+    :func:`_send` and :func:`_stream`.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        auth: Credentials | None,
+        *,
+        digest_store: DigestChallengeStore | None,
+        timeout: Timeout,
+        timeout_profiles: Mapping[str, Timeout],
+        circuit_breaker: CircuitBreaker | None,
+        rate_limiter: RateLimiter | None,
+        timing_sink: TimingSink | None,
+    ) -> None:
         self.host = host
         self.port = port
         self.url = f"https://{self.host}:{self.port}"
 
+        self.timeout = timeout
+        self.timeout_profiles = timeout_profiles
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.timing_sink = timing_sink
+
         self._auth: Credentials | None = None
-        self._session = self._create_session()
+        self._digest_store = digest_store
         self.auth = auth
 
     @property
@@ -64,9 +178,72 @@ class PhilipsTV:
 
     @auth.setter
     def auth(self, value: Credentials | None) -> None:
-        self._session.auth = HTTPDigestAuth(*value) if value else None
+        self._set_digest_auth(
+            SharedDigestAuth(*value, store=self._digest_store, key=self.host) if value else None
+        )
         self._auth = value
 
+    @property
+    @abstractmethod
+    def pool_stats(self) -> PoolStats:
+        """Connection pool usage counters.
+
+        Many :attr:`PoolStats.misses` or :attr:`PoolStats.discarded` connections mean that
+        ``pool_maxsize`` is too small for the number of concurrent requests.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close all open connections."""
+
+    def warm(self, connections: int = 1) -> int:
+        """Open connections to the TV in advance and keep them in the pool.
+
+        Opening a connection requires TLS handshake, which takes hundreds of milliseconds on some
+        TVs. Warming the pool e.g. when the user opens a remote control screen makes the following
+        requests fast. Warmed connections count as :attr:`PoolStats.misses`. Connections in use by
+        other requests are already open, so they're counted as ready without waiting for them.
+
+        Connections closed by the TV in the meantime are reopened during the next request, but the
+        TLS session is resumed whenever possible, so this is still faster than the first
+        connection.
+
+        Args:
+            connections: Number of connections to open. Limited by ``pool_maxsize``.
+
+        Returns:
+            Number of connections ready in the pool.
+
+        Raises:
+            PhilipsTVError: If any of the connections can't be opened.
+
+        """
+        timeout = timeout_for("", self.timeout, {})
+        if timeout.total is not None and timeout.total <= 0:
+            raise PhilipsTVTimeoutError("CONNECT", self.url)
+        connect_timeout = min(
+            (value for value in (timeout.connect, timeout.total) if value is not None),
+            default=None,
+        )
+        with (
+            self.circuit_breaker.guard("CONNECT", self.url)
+            if self.circuit_breaker
+            else nullcontext(),
+            _wrap_urllib3_exceptions("CONNECT", self.url),
+        ):
+            return warm_pool(self._connection_pool(), connections, connect_timeout)
+
+    def __enter__(self: _T) -> _T:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
     def post(self, path: str, payload: Any = None) -> Any:
         """Send `POST` request.
 
@@ -79,13 +256,9 @@ class PhilipsTV:
 
         """
         _LOGGER.debug("Request: POST %s %s", path, payload)
-        url = urljoin(self.url, path)
-        with _wrap_http_exceptions("POST", url):
-            response = self._session.post(url, json=payload)
-            response.raise_for_status()
-        response_body = response.json() if response.content else None
-        _LOGGER.debug("Response: %s %s", response.status_code, response_body)
-        return response_body
+        body = None if payload is None else json.dumps(payload, allow_nan=False).encode()
+        with self._timing("POST", path) as recorder:
+            return self._decode(*self._request("POST", path, body, recorder), recorder)
 
     def get(self, path: str) -> Any:
         """Send `GET` request.
@@ -98,16 +271,545 @@ class PhilipsTV:
 
         """
         _LOGGER.debug("Request: GET %s", path)
-        url = urljoin(self.url, path)
-        with _wrap_http_exceptions("GET", url):
-            response = self._session.get(url)
-            response.raise_for_status()
-        response_body = response.json() if response.content else None
-        _LOGGER.debug("Response: %s %s", response.status_code, response_body)
+        with self._timing("GET", path) as recorder:
+            return self._decode(*self._request("GET", path, None, recorder), recorder)
+
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        """Send `POST` request with already encoded JSON body.
+
+        Unlike :func:`post`, the response body is returned as is, without decoding it.
+
+        Args:
+            path: The path to send the request to.
+            body: JSON encoded request payload to send.
+
+        Returns:
+            The TV's raw response body, empty if the response had no body.
+
+        """
+        _LOGGER.debug("Request: POST %s %r", path, body)
+        with self._timing("POST", path) as recorder:
+            status_code, content = self._request("POST", path, body, recorder)
+        _LOGGER.debug("Response: %s %r", status_code, content)
+        return content
+
+    def get_raw(self, path: str) -> bytes:
+        """Send `GET` request.
+
+        Unlike :func:`get`, the response body is returned as is, without decoding it.
+
+        Args:
+            path: The path to send the request to.
+
+        Returns:
+            The TV's raw response body, empty if the response had no body.
+
+        """
+        _LOGGER.debug("Request: GET %s", path)
+        with self._timing("GET", path) as recorder:
+            status_code, content = self._request("GET", path, None, recorder)
+        _LOGGER.debug("Response: %s %r", status_code, content)
+        return content
+
+    def get_stream(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Generator[bytes, None, None]:
+        """Send `GET` request and yield the response body in chunks, as it's received.
+
+        Useful for big responses which can be processed incrementally, without keeping the whole
+        body in memory. The request is sent when the iteration starts. Closing the generator
+        before the end of the body discards the rest of the response and its connection.
+
+        Args:
+            path: The path to send the request to.
+            chunk_size: Maximum size of the yielded chunks in bytes.
+
+        Yields:
+            Consecutive chunks of the TV's raw response body.
+
+        """
+        _LOGGER.debug("Request: GET %s (streamed)", path)
+        # Recorded separately from the higher layers, the caller runs between the chunks.
+        with (
+            record(self.timing_sink, "GET", path, shared=False)
+            if self.timing_sink
+            else nullcontext()
+        ) as recorder:
+            path, url, timeout = self._prepare("GET", path, recorder)
+            with self.circuit_breaker.guard("GET", url) if self.circuit_breaker else nullcontext():
+                yield from self._stream("GET", path, url, timeout, chunk_size, recorder)
+
+    def _timing(self, method: str, path: str) -> AbstractContextManager[_Recorder | None]:
+        if self.timing_sink is None:
+            # Recorded only if a higher layer, e.g. `PhilipsTVAPI`, has its own sink.
+            return nullcontext(current_recorder())
+        return record(self.timing_sink, method, path)
+
+    def _prepare(
+        self, method: str, path: str, recorder: _Recorder | None
+    ) -> tuple[str, str, Timeout]:
+        path = f"/{path.lstrip('/')}"
+        url = f"{self.url}{path}"
+        if self.rate_limiter is not None:
+            if recorder is None:
+                self.rate_limiter.acquire(method, url, path)
+            else:
+                started = time.perf_counter()
+                self.rate_limiter.acquire(method, url, path)
+                recorder.queue_wait += time.perf_counter() - started
+        timeout = timeout_for(path, self.timeout, self.timeout_profiles)
+        if timeout.total is not None and timeout.total <= 0:
+            raise PhilipsTVTimeoutError(method, url)
+        return path, url, timeout
+
+    def _request(
+        self, method: str, path: str, body: bytes | None, recorder: _Recorder | None
+    ) -> tuple[int, bytes]:
+        path, url, timeout = self._prepare(method, path, recorder)
+        if self.circuit_breaker is None:
+            response = self._send(method, path, url, body, timeout, recorder)
+        else:
+            with self.circuit_breaker.guard(method, url):
+                response = self._send(method, path, url, body, timeout, recorder)
+        if recorder is not None:
+            recorder.request_size = len(body) if body is not None else 0
+            recorder.status_code, recorder.response_size = response[0], len(response[1])
+        return response
+
+    @staticmethod
+    def _decode(status_code: int, content: bytes, recorder: _Recorder | None) -> Any:
+        if recorder is None:
+            response_body = json.loads(content) if content else None
+        else:
+            started = time.perf_counter()
+            response_body = json.loads(content) if content else None
+            recorder.json_decode += time.perf_counter() - started
+        _LOGGER.debug("Response: %s %s", status_code, response_body)
         return response_body
 
+    @abstractmethod
+    def _send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        body: bytes | None,
+        timeout: Timeout,
+        recorder: _Recorder | None,
+    ) -> tuple[int, bytes]:
+        """Send the request and return the response status code and body.
+
+        The time of waiting for and reading the response is added to the ``recorder``, if given.
+
+        Raises:
+            PhilipsTVError: If the request fails or the response status code signals an error.
+
+        """
+
+    @abstractmethod
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        timeout: Timeout,
+        chunk_size: int,
+        recorder: _Recorder | None,
+    ) -> Generator[bytes, None, None]:
+        """Send the request and yield the response body in chunks.
+
+        The response status code, size and timings are set on the ``recorder``, if given.
+
+        Raises:
+            PhilipsTVError: If the request fails or the response status code signals an error.
+
+        """
+
+    @abstractmethod
+    def _set_digest_auth(self, auth: SharedDigestAuth | None) -> None:
+        """Use the digest authentication for the following requests, ``None`` disables it."""
+
+    @abstractmethod
+    def _connection_pool(self) -> HTTPSConnectionPool:
+        """Return the pool of connections to the TV."""
+
+
+class PhilipsTV(_BasePhilipsTV):
+    """Lowest level interface with the TV.
+
+    Used to send raw (without using model objects) `GET` and `POST` requests to any API path.
+
+    This handles authentication, exception handling, logging and URL building so higher layers don't
+    have to worry about this.
+
+    Connections to the TV are kept open and reused between requests. They should be released using
+    :func:`close` or by using the instance as a context manager::
+
+        with PhilipsTV("192.168.0.100", auth=("id", "key")) as tv:
+            tv.get("6/powerstate")
+
+    Requests are sent using `requests`. See :class:`Urllib3PhilipsTV` for a lighter alternative.
+
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 1926,
+        auth: Credentials | None = None,
+        *,
+        digest_store: DigestChallengeStore | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keepalive_expiry: float | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        timeout_profiles: Mapping[str, Timeout] = DEFAULT_TIMEOUT_PROFILES,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        timing_sink: TimingSink | None = None,
+    ) -> None:
+        """
+        Args:
+            host: TV IP address to connect to.
+            port: TV port to connect to.
+            auth: Authentication credentials tuple.
+            digest_store: Store in which the digest authentication state is persisted, so other
+                instances and processes can authenticate without waiting for a challenge first.
+            pool_maxsize: Maximum number of connections kept open for reuse. Should be at least
+                the number of threads concurrently sending requests through this instance.
+            pool_block: If `True`, requests wait for a free connection when ``pool_maxsize``
+                connections are in use. Otherwise an additional connection is opened, and closed
+                right after use.
+            keepalive_expiry: Number of seconds after which an idle connection is closed instead
+                of being reused. Useful if the TV silently drops idle connections. ``None`` means
+                no limit.
+            timeout: Timeout of requests to paths without a specific profile.
+            timeout_profiles: Timeouts of specific API paths, see
+                :data:`~philipstv.timeouts.DEFAULT_TIMEOUT_PROFILES`.
+            circuit_breaker: Breaker making requests fail fast while the TV is unreachable.
+                ``None`` disables it.
+            rate_limiter: Limiter of the rate of requests sent to the TV. ``None`` disables it.
+            timing_sink: Function receiving the :class:`~philipstv.timing.RequestTiming` of every
+                request, useful to find out which phase of slow requests takes the time.
+                ``None`` disables measuring the timings.
+
+        """
+        self._adapter = PoolingHTTPAdapter(pool_maxsize, pool_block, keepalive_expiry)
+        self._session = self._create_session(self._adapter)
+        super().__init__(
+            host,
+            port,
+            auth,
+            digest_store=digest_store,
+            timeout=timeout,
+            timeout_profiles=timeout_profiles,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            timing_sink=timing_sink,
+        )
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        return self._adapter.stats
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        body: bytes | None,
+        timeout: Timeout,
+        recorder: _Recorder | None,
+    ) -> tuple[int, bytes]:
+        expires_at = _expiry(timeout)
+        with _wrap_http_exceptions(method, url):
+            sent_at = time.perf_counter() if recorder is not None else 0.0
+            # Streamed, so the body is read separately from waiting for the response.
+            response = self._request_within(
+                expires_at,
+                method,
+                url,
+                data=body,
+                headers=_JSON_HEADERS if body is not None else None,
+                verify=False,
+                # `requests` passes `urllib3.Timeout` as is, even though its stubs don't allow it.
+                timeout=_urllib3_timeout(timeout),
+                stream=True,
+            )
+            headers_at = time.perf_counter() if recorder is not None else 0.0
+            # Read by `urllib3` directly, `requests` reports read timeouts as connection errors.
+            with _wrap_urllib3_exceptions(method, url):
+                content = b"".join(
+                    _read_body(response.raw, DEFAULT_CHUNK_SIZE, expires_at, method, url)
+                )
+            if recorder is not None:
+                recorder.add_exchange(sent_at, headers_at, time.perf_counter())
+            response.raise_for_status()
+        return response.status_code, content
+
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        timeout: Timeout,
+        chunk_size: int,
+        recorder: _Recorder | None,
+    ) -> Generator[bytes, None, None]:
+        expires_at = _expiry(timeout)
+        with _wrap_http_exceptions(method, url):
+            sent_at = time.perf_counter() if recorder is not None else 0.0
+            response = self._request_within(
+                expires_at,
+                method,
+                url,
+                verify=False,
+                timeout=_urllib3_timeout(timeout),
+                stream=True,
+            )
+            # Closes the connection only if the body wasn't read completely.
+            with response:
+                headers_at = time.perf_counter() if recorder is not None else 0.0
+                response.raise_for_status()
+                size = 0
+                with _wrap_urllib3_exceptions(method, url):
+                    for chunk in _read_body(response.raw, chunk_size, expires_at, method, url):
+                        size += len(chunk)
+                        yield chunk
+                if recorder is not None:
+                    recorder.add_exchange(sent_at, headers_at, time.perf_counter())
+                    recorder.status_code, recorder.response_size = response.status_code, size
+
+    def _request_within(
+        self, expires_at: float | None, method: str, url: str, **kwargs: Any
+    ) -> Response:
+        # The retry after a digest challenge is sent by `SharedDigestAuth`, which fits it in the
+        # time left until the deadline.
+        with deadline(expires_at - time.monotonic()) if expires_at is not None else nullcontext():
+            return self._session.request(method, url, **kwargs)
+
+    def _set_digest_auth(self, auth: SharedDigestAuth | None) -> None:
+        self._session.auth = auth
+
+    def _connection_pool(self) -> HTTPSConnectionPool:
+        pool: HTTPSConnectionPool = self._adapter.connection_pool(self.url)
+        return pool
+
     @staticmethod
-    def _create_session() -> Session:
+    def _create_session(adapter: PoolingHTTPAdapter) -> Session:
         session = Session()
         session.verify = False
+        session.mount("https://", adapter)
         return session
+
+
+class Urllib3PhilipsTV(_BasePhilipsTV):
+    """Lowest level interface with the TV, sending requests directly with `urllib3`.
+
+    Drop-in replacement for :class:`PhilipsTV` with the same arguments and behaviour. It skips
+    everything `requests` does on top of `urllib3` which the TV doesn't need: session hooks, cookie
+    handling, redirects, proxy and environment lookups. This makes every request noticeably
+    cheaper in CPU time, which matters when polling many TVs frequently::
+
+        api = PhilipsTVAPI(Urllib3PhilipsTV("192.168.0.100", auth=("id", "key")))
+
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 1926,
+        auth: Credentials | None = None,
+        *,
+        digest_store: DigestChallengeStore | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keepalive_expiry: float | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        timeout_profiles: Mapping[str, Timeout] = DEFAULT_TIMEOUT_PROFILES,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+        timing_sink: TimingSink | None = None,
+    ) -> None:
+        """
+        Args:
+            host: TV IP address to connect to.
+            port: TV port to connect to.
+            auth: Authentication credentials tuple.
+            digest_store: See :class:`PhilipsTV`.
+            pool_maxsize: See :class:`PhilipsTV`.
+            pool_block: See :class:`PhilipsTV`.
+            keepalive_expiry: See :class:`PhilipsTV`.
+            timeout: See :class:`PhilipsTV`.
+            timeout_profiles: See :class:`PhilipsTV`.
+            circuit_breaker: See :class:`PhilipsTV`.
+            rate_limiter: See :class:`PhilipsTV`.
+            timing_sink: See :class:`PhilipsTV`.
+
+        """
+        self._digest_auth: SharedDigestAuth | None = None
+        self._counters = _PoolCounters()
+        self._ssl_context = create_ssl_context(self._counters)
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._keepalive_expiry = keepalive_expiry
+        super().__init__(
+            host,
+            port,
+            auth,
+            digest_store=digest_store,
+            timeout=timeout,
+            timeout_profiles=timeout_profiles,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+            timing_sink=timing_sink,
+        )
+        self._pool = self._create_pool()
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        return self._counters.snapshot()
+
+    def close(self) -> None:
+        # A closed pool can't be used anymore, replace it so the instance stays usable.
+        pool, self._pool = self._pool, self._create_pool()
+        pool.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        body: bytes | None,
+        timeout: Timeout,
+        recorder: _Recorder | None,
+    ) -> tuple[int, bytes]:
+        headers = {"Accept": "application/json"}
+        if body is not None:
+            headers.update(_JSON_HEADERS)
+
+        expires_at = _expiry(timeout)
+        with _wrap_urllib3_exceptions(method, url):
+            response, content = self._urlopen(
+                method, path, url, body, headers, timeout, expires_at, recorder
+            )
+            if (
+                response.status == 401
+                and self._digest_auth
+                and self._digest_auth.update_challenge(response.headers.get("WWW-Authenticate", ""))
+            ):
+                timeout = _remaining_timeout(timeout, expires_at, method, url)
+                response, content = self._urlopen(
+                    method, path, url, body, headers, timeout, expires_at, recorder
+                )
+
+        if response.status >= 400:
+            raise PhilipsTVError(method, url, response.status)
+        return response.status, content
+
+    def _stream(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        timeout: Timeout,
+        chunk_size: int,
+        recorder: _Recorder | None,
+    ) -> Generator[bytes, None, None]:
+        headers = {"Accept": "application/json"}
+
+        expires_at = _expiry(timeout)
+        with _wrap_urllib3_exceptions(method, url):
+            sent_at = time.perf_counter() if recorder is not None else 0.0
+            response = self._open(method, path, url, None, headers, timeout)
+            if (
+                response.status == 401
+                and self._digest_auth
+                and self._digest_auth.update_challenge(response.headers.get("WWW-Authenticate", ""))
+            ):
+                response.read()
+                timeout = _remaining_timeout(timeout, expires_at, method, url)
+                response = self._open(method, path, url, None, headers, timeout)
+            headers_at = time.perf_counter() if recorder is not None else 0.0
+
+            if response.status >= 400:
+                response.read()
+                raise PhilipsTVError(method, url, response.status)
+            try:
+                size = 0
+                for chunk in _read_body(response, chunk_size, expires_at, method, url):
+                    size += len(chunk)
+                    yield chunk
+            finally:
+                # The connection is released back to the pool after reading the whole body.
+                # Otherwise it has unread data, so it's closed before releasing it.
+                response.close()
+                response.release_conn()
+            if recorder is not None:
+                recorder.add_exchange(sent_at, headers_at, time.perf_counter())
+                recorder.status_code, recorder.response_size = response.status, size
+
+    def _urlopen(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: Timeout,
+        expires_at: float | None,
+        recorder: _Recorder | None,
+    ) -> tuple[urllib3.BaseHTTPResponse, bytes]:
+        sent_at = time.perf_counter() if recorder is not None else 0.0
+        response = self._open(method, path, url, body, headers, timeout)
+        headers_at = time.perf_counter() if recorder is not None else 0.0
+        content = b"".join(_read_body(response, DEFAULT_CHUNK_SIZE, expires_at, method, url))
+        if recorder is not None:
+            recorder.add_exchange(sent_at, headers_at, time.perf_counter())
+        return response, content
+
+    def _open(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: Timeout,
+    ) -> urllib3.BaseHTTPResponse:
+        if self._digest_auth and (header := self._digest_auth.build_header(method, url)):
+            headers["Authorization"] = header
+        # Not preloaded, so the body is read separately from waiting for the response.
+        return self._pool.urlopen(
+            method,
+            path,
+            body=body,
+            headers=headers,
+            retries=False,
+            redirect=False,
+            assert_same_host=False,
+            timeout=_urllib3_timeout(timeout),
+            preload_content=False,
+        )
+
+    def _set_digest_auth(self, auth: SharedDigestAuth | None) -> None:
+        self._digest_auth = auth
+
+    def _connection_pool(self) -> HTTPSConnectionPool:
+        return self._pool
+
+    def _create_pool(self) -> _TrackingHTTPSConnectionPool:
+        return create_tracking_pool(
+            self.host,
+            self.port,
+            maxsize=self._pool_maxsize,
+            block=self._pool_block,
+            keepalive_expiry=self._keepalive_expiry,
+            counters=self._counters,
+            ssl_context=self._ssl_context,
+            cert_reqs="CERT_NONE",
+            assert_hostname=False,
+        )
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class ValidationLevel(str, Enum):
+    """How thoroughly :class:`~philipstv.PhilipsTVAPI` checks the responses of an endpoint."""
+
+    FULL = "full"
+    """Responses are validated by `pydantic` into models, and malformed ones are rejected."""
+    RAW = "raw"
+    """No models are created, responses are returned as decoded JSON data. Useful for big or
+    frequently read responses whose values are used directly, e.g. Ambilight colors forwarded to
+    other lights."""
@@ -0,0 +1,11 @@
+from collections.abc import Iterator
+
+import pytest
+
+from tests.server import FakeTVServer, run_server
+
+
+@pytest.fixture
+def tv_server() -> Iterator[FakeTVServer]:
+    with run_server() as server:
+        yield server
@@ -1,5 +1,8 @@
+import json
+from collections.abc import Generator
 from typing import Any
 
+from philipstv.aio import AsyncPhilipsTV
 from philipstv.exceptions import PhilipsTVError
 from philipstv.tv import PhilipsTV
 from philipstv.types import Credentials
@@ -18,6 +21,8 @@ class FakePhilipsTV(PhilipsTV):
 
         self.post_responses = post_responses or {}
         self.get_responses = get_responses or {}
+        self.warmed = 0
+        self.closed = False
 
     @property
     def auth(self) -> Credentials | None:
@@ -41,8 +46,72 @@ class FakePhilipsTV(PhilipsTV):
         except KeyError as err:
             raise PhilipsTVError("GET", path, 404) from err
 
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        return self._encode(self.post(path, json.loads(body) if body else None))
+
+    def get_raw(self, path: str) -> bytes:
+        return self._encode(self.get(path))
+
+    def get_stream(self, path: str, chunk_size: int = 7) -> Generator[bytes, None, None]:
+        content = self.get_raw(path)
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+    def warm(self, connections: int = 1) -> int:
+        self.warmed += connections
+        return connections
+
+    def close(self) -> None:
+        self.closed = True
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return b"" if value is None else json.dumps(value).encode()
+
     @staticmethod
     def _raise_or_return(value: Any) -> Any:
         if isinstance(value, Exception):
             raise value
         return value
+
+
+class FakeAsyncPhilipsTV(AsyncPhilipsTV):
+    def __init__(
+        self,
+        post_responses: dict[str, Any] | None = None,
+        get_responses: dict[str, Any] | None = None,
+    ) -> None:
+        self._fake = FakePhilipsTV(post_responses, get_responses)
+        self.host = ""
+        self.closed = False
+
+    @property
+    def auth(self) -> Credentials | None:
+        return self._fake.auth
+
+    @auth.setter
+    def auth(self, value: Credentials | None) -> None:
+        self._fake.auth = value
+
+    @property
+    def post_requests(self) -> dict[str, Any]:
+        return self._fake.post_requests
+
+    @property
+    def get_requests(self) -> set[str]:
+        return self._fake.get_requests
+
+    async def post(self, path: str, payload: Any = None) -> Any:
+        return self._fake.post(path, payload)
+
+    async def get(self, path: str) -> Any:
+        return self._fake.get(path)
+
+    async def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        return self._fake.post_raw(path, body)
+
+    async def get_raw(self, path: str) -> bytes:
+        return self._fake.get_raw(path)
+
+    async def aclose(self) -> None:
+        self.closed = True
@@ -0,0 +1,111 @@
+import json
+import ssl
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@dataclass
+class RecordedRequest:
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class FakeTVServer:
+    """HTTPS server imitating the TV, for tests which need real connections."""
+
+    host: str = "127.0.0.1"
+    port: int = 0
+    responses: dict[str, Any] = field(default_factory=dict)
+    requests: list[RecordedRequest] = field(default_factory=list)
+    handler: Callable[[RecordedRequest], tuple[int, bytes]] | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+    body_interval: float = 0
+    """Delay before sending each byte of the response body, to imitate a slow TV."""
+
+    def respond(self, request: RecordedRequest) -> tuple[int, bytes]:
+        if self.handler:
+            return self.handler(request)
+        if request.path not in self.responses:
+            return 404, b""
+        body = self.responses[request.path]
+        return 200, b"" if body is None else json.dumps(body).encode()
+
+
+def _create_handler(server: FakeTVServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._handle()
+
+        def do_POST(self) -> None:
+            self._handle()
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _handle(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = RecordedRequest(
+                self.command, self.path, dict(self.headers), self.rfile.read(length)
+            )
+            server.requests.append(request)
+            status, body = server.respond(request)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in server.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            if not server.body_interval:
+                self.wfile.write(body)
+                return
+            try:
+                for byte in body:
+                    time.sleep(server.body_interval)
+                    self.wfile.write(bytes([byte]))
+            except OSError:
+                # The client gave up waiting for the body.
+                self.close_connection = True
+
+    return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Tests often drop connections on purpose, e.g. after a timeout.
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError, ssl.SSLError)):
+            return
+        super().handle_error(request, client_address)
+
+
+@contextmanager
+def run_server() -> Iterator[FakeTVServer]:
+    server = FakeTVServer()
+    httpd = _Server((server.host, 0), _create_handler(server))
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(DATA_DIR / "cert.pem", DATA_DIR / "key.pem")
+    httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+    server.port = httpd.server_address[1]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
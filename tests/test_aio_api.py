@@ -0,0 +1,239 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from philipstv import (
+    PhilipsTVAPIMalformedResponseError,
+    PhilipsTVAPIUnauthorizedError,
+    PhilipsTVError,
+    TVSnapshot,
+)
+from philipstv.aio import AsyncPhilipsTVAPI
+from philipstv.model import (
+    AmbilightColor,
+    AmbilightMode,
+    AmbilightModeValue,
+    AmbilightPower,
+    AmbilightPowerValue,
+    AmbilightTopology,
+    ChannelID,
+    ChannelList,
+    ChannelShort,
+    CurrentChannel,
+    CurrentVolume,
+    InputKey,
+    InputKeyValue,
+    PowerState,
+    PowerStateValue,
+    SetChannel,
+    SettingNode,
+    Volume,
+)
+from tests.fakes import FakeAsyncPhilipsTV
+from tests.test_api import (
+    BRIGHTNESS_SETTING,
+    PICTURE_STYLE_SETTING,
+    KeysFakePhilipsTV,
+    SettingsFakePhilipsTV,
+)
+
+
+def test_host() -> None:
+    expected_host = "192.168.0.66"
+    fake_tv = FakeAsyncPhilipsTV()
+    fake_tv.host = expected_host
+
+    result = AsyncPhilipsTVAPI(fake_tv).host
+
+    assert result == expected_host
+
+
+def test_auth() -> None:
+    expected_auth = ("<id>", "<key>")
+    fake_tv = FakeAsyncPhilipsTV()
+    api = AsyncPhilipsTVAPI(fake_tv)
+
+    api.auth = expected_auth
+
+    assert api.auth == expected_auth
+    assert fake_tv.auth == expected_auth
+
+
+def test_aclose() -> None:
+    fake_tv = FakeAsyncPhilipsTV()
+
+    async def run() -> None:
+        async with AsyncPhilipsTVAPI(fake_tv):
+            pass
+
+    asyncio.run(run())
+
+    assert fake_tv.closed
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, response, expected",
+    [
+        ("get_powerstate", "6/powerstate", {"powerstate": "On"}, PowerState(powerstate="On")),
+        (
+            "get_volume",
+            "6/audio/volume",
+            {"muted": False, "current": 15, "min": 0, "max": 60},
+            CurrentVolume(current=15, muted=False, min=0, max=60),
+        ),
+        (
+            "get_current_channel",
+            "6/activities/tv",
+            {
+                "channel": {"ccid": 35, "preset": "10", "name": "TVN HD"},
+                "channelList": {"id": "list", "version": "7"},
+            },
+            CurrentChannel(
+                channel=ChannelShort(ccid=35, preset="10", name="TVN HD"),
+                channel_list=ChannelList(id="list", version="7"),
+            ),
+        ),
+        (
+            "get_ambilight_power",
+            "6/ambilight/power",
+            {"power": "On"},
+            AmbilightPower(power=AmbilightPowerValue.ON),
+        ),
+        (
+            "get_ambilight_topology",
+            "6/ambilight/topology",
+            {"layers": 1, "left": 3, "top": 7, "right": 3, "bottom": 0},
+            AmbilightTopology(layers=1, left=3, top=7, right=3, bottom=0),
+        ),
+        (
+            "get_ambilight_mode",
+            "6/ambilight/mode",
+            {"current": "internal"},
+            AmbilightMode(current=AmbilightModeValue.INTERNAL),
+        ),
+    ],
+)
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_get(method: str, endpoint: str, response: Any, expected: Any, fast_json: bool) -> None:
+    fake_tv = FakeAsyncPhilipsTV(get_responses={endpoint: response})
+
+    result = asyncio.run(getattr(AsyncPhilipsTVAPI(fake_tv, fast_json=fast_json), method)())
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "method, endpoint, payload, expected",
+    [
+        (
+            "set_powerstate",
+            "6/powerstate",
+            PowerState(powerstate=PowerStateValue.STANDBY),
+            {"powerstate": "Standby"},
+        ),
+        ("set_volume", "6/audio/volume", Volume(current=10), {"muted": False, "current": 10}),
+        (
+            "set_channel",
+            "6/activities/tv",
+            SetChannel(channel=ChannelID(ccid=30)),
+            {"channel": {"ccid": 30}, "channelList": {"id": "allcab"}},
+        ),
+        ("input_key", "6/input/key", InputKey(key=InputKeyValue.STANDBY), {"key": "Standby"}),
+        (
+            "set_ambilight_power",
+            "6/ambilight/power",
+            AmbilightPower(power=AmbilightPowerValue.OFF),
+            {"power": "Off"},
+        ),
+        (
+            "set_ambilight_mode",
+            "6/ambilight/mode",
+            AmbilightMode(current=AmbilightModeValue.MANUAL),
+            {"current": "manual"},
+        ),
+        (
+            "set_ambilight_cached",
+            "6/ambilight/cached",
+            AmbilightColor(r=255, g=255, b=255),
+            {"r": 255, "g": 255, "b": 255},
+        ),
+    ],
+)
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_post(method: str, endpoint: str, payload: Any, expected: Any, fast_json: bool) -> None:
+    fake_tv = FakeAsyncPhilipsTV(post_responses={endpoint: None})
+
+    asyncio.run(getattr(AsyncPhilipsTVAPI(fake_tv, fast_json=fast_json), method)(payload))
+
+    assert fake_tv.post_requests == {endpoint: expected}
+
+
+@pytest.mark.parametrize(
+    "response, expected_exception",
+    [
+        pytest.param(
+            PhilipsTVError("GET", "6/powerstate", 401),
+            PhilipsTVAPIUnauthorizedError,
+            id="unauthorized request error",
+        ),
+        pytest.param(
+            {"foo": "bar"},
+            PhilipsTVAPIMalformedResponseError,
+            id="malformed response error",
+        ),
+        pytest.param(
+            PhilipsTVError("GET", "6/powerstate", 404),
+            PhilipsTVError,
+            id="unhandled error",
+        ),
+    ],
+)
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_api_error(response: Any, expected_exception: type[Exception], fast_json: bool) -> None:
+    fake_tv = FakeAsyncPhilipsTV(get_responses={"6/powerstate": response})
+
+    with pytest.raises(expected_exception):
+        asyncio.run(AsyncPhilipsTVAPI(fake_tv, fast_json=fast_json).get_powerstate())
+
+
+def test_get_snapshot() -> None:
+    fake_tv = FakeAsyncPhilipsTV(
+        get_responses={
+            "6/powerstate": {"powerstate": "On"},
+            "6/audio/volume": PhilipsTVError("GET", "6/audio/volume", 500),
+        }
+    )
+
+    snapshot = asyncio.run(AsyncPhilipsTVAPI(fake_tv).get_snapshot(["powerstate", "volume"]))
+
+    assert snapshot == TVSnapshot(
+        powerstate=PowerState(powerstate=PowerStateValue.ON),
+        errors={"volume": snapshot.errors["volume"]},
+    )
+    assert isinstance(snapshot.errors["volume"], PhilipsTVError)
+
+
+def test_get_settings() -> None:
+    fake_tv = FakeAsyncPhilipsTV()
+    fake_tv._fake = SettingsFakePhilipsTV([BRIGHTNESS_SETTING, PICTURE_STYLE_SETTING])
+    nodes = [SettingNode.BRIGHTNESS, SettingNode.PICTURE_STYLE]
+
+    result = asyncio.run(AsyncPhilipsTVAPI(fake_tv).get_settings(nodes, chunk_size=1))
+
+    assert len(fake_tv._fake.payloads) == 2
+    assert result[SettingNode.BRIGHTNESS].data.value == 50
+    assert result[SettingNode.PICTURE_STYLE].data.selected_item == 23
+
+
+def test_input_keys() -> None:
+    fake_tv = FakeAsyncPhilipsTV()
+    fake_tv._fake = KeysFakePhilipsTV(fail_at=2)
+    keys = [InputKeyValue.DIGIT_1, InputKeyValue.DIGIT_2, InputKeyValue.CONFIRM]
+
+    result = asyncio.run(AsyncPhilipsTVAPI(fake_tv).input_keys(keys, interval=0.01))
+
+    assert fake_tv._fake.keys == ["Digit1", "Digit2"]
+    assert [press.key for press in result.presses] == ["Digit1", "Digit2"]
+    assert result.presses[1].sent_at >= 0.01
+    assert result.failed_key == InputKeyValue.CONFIRM
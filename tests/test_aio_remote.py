@@ -0,0 +1,211 @@
+import asyncio
+from unittest.mock import Mock, create_autospec
+
+import pytest
+from pytest import MonkeyPatch
+
+from philipstv import PhilipsTVRemoteAmbiguousChannelError, PhilipsTVRemoteError
+from philipstv.aio import AsyncPhilipsTVAPI, AsyncPhilipsTVRemote
+from philipstv.model import (
+    AllChannels,
+    AmbilightColor,
+    AmbilightPower,
+    AmbilightPowerValue,
+    AmbilightTopology,
+    ChannelID,
+    ChannelList,
+    CurrentVolume,
+    InputKeyValue,
+    PairingRequestResponse,
+    PairingResponse,
+    PowerState,
+    PowerStateValue,
+    SetChannel,
+    Volume,
+)
+from tests.test_remote import APPLICATION_NETFLIX, APPLICATIONS, CHANNELS, CURRENT_CHANNEL
+
+
+@pytest.fixture
+def api_mock() -> Mock:
+    return create_autospec(AsyncPhilipsTVAPI, spec_set=True, instance=True)  # type: ignore
+
+
+def test_host(api_mock: Mock) -> None:
+    api_mock.host = "192.168.0.66"
+
+    assert AsyncPhilipsTVRemote(api_mock).host == "192.168.0.66"
+
+
+def test_pair(api_mock: Mock) -> None:
+    api_mock.pair_request.return_value = PairingRequestResponse(
+        error_id="SUCCESS", error_text="", auth_key="<key>", timestamp=12345
+    )
+    api_mock.pair_grant.return_value = PairingResponse(error_id="SUCCESS", error_text="")
+
+    result = asyncio.run(AsyncPhilipsTVRemote(api_mock).pair(lambda: "1234", "<id>"))
+
+    assert result == ("<id>", "<key>")
+    assert api_mock.auth == ("<id>", "<key>")
+
+
+def test_get_power(api_mock: Mock) -> None:
+    api_mock.get_powerstate.return_value = PowerState(powerstate=PowerStateValue.ON)
+
+    assert asyncio.run(AsyncPhilipsTVRemote(api_mock).get_power()) is True
+
+
+def test_set_power(api_mock: Mock) -> None:
+    asyncio.run(AsyncPhilipsTVRemote(api_mock).set_power(False))
+
+    api_mock.set_powerstate.assert_awaited_once_with(PowerStateValue.STANDBY)
+
+
+def test_volume(api_mock: Mock) -> None:
+    api_mock.get_volume.return_value = CurrentVolume(muted=False, current=15, min=0, max=60)
+    remote = AsyncPhilipsTVRemote(api_mock)
+
+    assert asyncio.run(remote.get_volume()) == 15
+    asyncio.run(remote.set_volume(20))
+
+    api_mock.set_volume.assert_awaited_once_with(Volume(current=20, muted=False))
+
+
+def test_set_channel_concurrent(api_mock: Mock) -> None:
+    async def slow_get_all_channels() -> AllChannels:
+        await asyncio.sleep(0)
+        return CHANNELS
+
+    api_mock.get_all_channels.side_effect = slow_get_all_channels
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
+    remote = AsyncPhilipsTVRemote(api_mock)
+
+    async def run() -> None:
+        await asyncio.gather(remote.set_channel(1), remote.set_channel("TVN HD"))
+
+    asyncio.run(run())
+
+    api_mock.get_all_channels.assert_awaited_once()
+    api_mock.set_channel.assert_any_await(SetChannel(channel=ChannelID(ccid=35)))
+    api_mock.set_channel.assert_any_await(SetChannel(channel=ChannelID(ccid=40)))
+
+
+def test_set_channel_list_version_changed(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
+    remote = AsyncPhilipsTVRemote(api_mock, channels_ttl=0)
+    asyncio.run(remote.set_channel(1))
+    asyncio.run(remote.set_channel(1))
+
+    api_mock.get_all_channels.return_value = CHANNELS.model_copy(update={"version": 2})
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL.model_copy(
+        update={"channel_list": ChannelList(id="allcab", version="2")}
+    )
+    asyncio.run(remote.get_all_channels())
+    asyncio.run(remote.get_all_channels())
+
+    assert api_mock.get_all_channels.await_count == 2
+
+
+def test_set_channel_list_checked_after_ttl(api_mock: Mock, monkeypatch: MonkeyPatch) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
+    remote = AsyncPhilipsTVRemote(api_mock, channels_ttl=5)
+    now = 100.0
+    monkeypatch.setattr("philipstv.aio.remote.time.monotonic", lambda: now)
+
+    asyncio.run(remote.set_channel(1))
+    asyncio.run(remote.set_channel(3))
+    assert api_mock.get_current_channel.await_count == 1
+
+    now += 5
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL.model_copy(
+        update={"channel_list": ChannelList(id="allsat", version="1")}
+    )
+    asyncio.run(remote.set_channel(1))
+    assert api_mock.get_current_channel.await_count == 2
+    assert api_mock.get_all_channels.await_count == 2
+
+
+def test_set_channel_error(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+
+    with pytest.raises(PhilipsTVRemoteError):
+        asyncio.run(AsyncPhilipsTVRemote(api_mock).set_channel("random channel"))
+
+
+def test_set_channel_ambiguous(api_mock: Mock) -> None:
+    duplicate = CHANNELS.channel[0].model_copy(update={"ccid": 36, "name": "Polsat 2"})
+    api_mock.get_all_channels.return_value = CHANNELS.model_copy(
+        update={"channel": [*CHANNELS.channel, duplicate]}
+    )
+
+    with pytest.raises(PhilipsTVRemoteAmbiguousChannelError) as exc_info:
+        asyncio.run(AsyncPhilipsTVRemote(api_mock).set_channel(1))
+
+    assert exc_info.value.matches == [("1", "Polsat HD"), ("1", "Polsat 2")]
+
+
+def test_get_all_channels(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+
+    result = asyncio.run(AsyncPhilipsTVRemote(api_mock).get_all_channels())
+
+    assert result == {1: "Polsat HD", 3: "TVN HD"}
+
+
+def test_input_key(api_mock: Mock) -> None:
+    asyncio.run(AsyncPhilipsTVRemote(api_mock).input_key(InputKeyValue.HOME))
+
+    api_mock.input_key.assert_awaited_once_with(InputKeyValue.HOME)
+
+
+def test_ambilight_power(api_mock: Mock) -> None:
+    api_mock.get_ambilight_power.return_value = AmbilightPower(power=AmbilightPowerValue.OFF)
+    remote = AsyncPhilipsTVRemote(api_mock)
+
+    assert asyncio.run(remote.get_ambilight_power()) is False
+    asyncio.run(remote.set_ambilight_power(True))
+
+    api_mock.set_ambilight_power.assert_awaited_once_with(AmbilightPowerValue.ON)
+
+
+def test_set_ambilight_color_sides_concurrent(api_mock: Mock) -> None:
+    api_mock.get_ambilight_topology.return_value = AmbilightTopology(
+        layers=1, left=2, top=3, right=2, bottom=3
+    )
+    remote = AsyncPhilipsTVRemote(api_mock)
+    color = AmbilightColor(r=255, g=0, b=0)
+
+    async def run() -> None:
+        await asyncio.gather(
+            remote.set_ambilight_color(left=color), remote.set_ambilight_color(top=color)
+        )
+
+    asyncio.run(run())
+
+    api_mock.get_ambilight_topology.assert_awaited_once()
+    assert api_mock.set_ambilight_cached.await_count == 2
+
+
+def test_applications(api_mock: Mock) -> None:
+    api_mock.get_applications.return_value = APPLICATIONS
+    remote = AsyncPhilipsTVRemote(api_mock)
+
+    async def run() -> None:
+        await asyncio.gather(
+            remote.launch_application("Netflix"), remote.launch_application("Netflix")
+        )
+
+    asyncio.run(run())
+
+    api_mock.get_applications.assert_awaited_once()
+    api_mock.launch_application.assert_awaited_with(APPLICATION_NETFLIX)
+    assert asyncio.run(remote.get_applications()) == ["Spotify", "Netflix"]
+
+
+def test_launch_application_error(api_mock: Mock) -> None:
+    api_mock.get_applications.return_value = APPLICATIONS
+
+    with pytest.raises(PhilipsTVRemoteError):
+        asyncio.run(AsyncPhilipsTVRemote(api_mock).launch_application("whatever"))
@@ -0,0 +1,290 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from pytest import MonkeyPatch
+
+from philipstv import (
+    CircuitBreaker,
+    CircuitState,
+    PhilipsTVConnectTimeoutError,
+    PhilipsTVError,
+    PhilipsTVTimeoutError,
+    PhilipsTVUnavailableError,
+    deadline,
+)
+from philipstv.aio import AsyncPhilipsTV
+
+HOST = "192.168.0.1"
+PORT = 1926
+PAYLOAD = {"<key>": "<value>"}
+
+PATHS = [
+    pytest.param("random/path", f"https://{HOST}:{PORT}/random/path", id="no leading slash"),
+    pytest.param("/random/path", f"https://{HOST}:{PORT}/random/path", id="leading slash present"),
+]
+RESPONSES = [
+    pytest.param({"<resp_key>": "<resp_value>"}, id="response present"),
+    pytest.param(None, id="no response"),
+]
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def requests_log() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def mock_handler(
+    monkeypatch: MonkeyPatch, requests_log: list[httpx.Request]
+) -> Callable[..., None]:
+    def install(handler: Handler) -> None:
+        def logging_handler(request: httpx.Request) -> httpx.Response:
+            request.read()
+            requests_log.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(
+            AsyncPhilipsTV,
+            "_create_client",
+            staticmethod(lambda: httpx.AsyncClient(transport=httpx.MockTransport(logging_handler))),
+        )
+
+    return install
+
+
+def json_response(body: Any, status_code: int = 200) -> httpx.Response:
+    if body is None:
+        return httpx.Response(status_code)
+    return httpx.Response(status_code, json=body)
+
+
+def test_tv_auth() -> None:
+    first_credentials = ("<first key>", "<first secret>")
+    second_credentials = ("<second key>", "<second secret>")
+
+    tv = AsyncPhilipsTV(HOST, PORT, first_credentials)
+    assert tv.auth == first_credentials
+
+    tv.auth = second_credentials
+    assert tv.auth == second_credentials
+
+
+@pytest.mark.parametrize("path, expected_url", PATHS)
+@pytest.mark.parametrize("expected_response", RESPONSES)
+def test_tv_post(
+    path: str,
+    expected_url: str,
+    expected_response: dict[str, Any] | None,
+    mock_handler: Callable[..., None],
+    requests_log: list[httpx.Request],
+) -> None:
+    mock_handler(lambda request: json_response(expected_response))
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            return await tv.post(path, PAYLOAD)
+
+    actual_response = asyncio.run(run())
+
+    assert str(requests_log[-1].url) == expected_url
+    assert requests_log[-1].method == "POST"
+    assert httpx.Response(200, content=requests_log[-1].content).json() == PAYLOAD
+    assert actual_response == expected_response
+
+
+@pytest.mark.parametrize("path, expected_url", PATHS)
+@pytest.mark.parametrize("expected_response", RESPONSES)
+def test_tv_get(
+    path: str,
+    expected_url: str,
+    expected_response: dict[str, Any] | None,
+    mock_handler: Callable[..., None],
+    requests_log: list[httpx.Request],
+) -> None:
+    mock_handler(lambda request: json_response(expected_response))
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            return await tv.get(path)
+
+    actual_response = asyncio.run(run())
+
+    assert str(requests_log[-1].url) == expected_url
+    assert requests_log[-1].method == "GET"
+    assert actual_response == expected_response
+
+
+def test_tv_post_raw(mock_handler: Callable[..., None], requests_log: list[httpx.Request]) -> None:
+    mock_handler(lambda request: httpx.Response(200, content=b'{"powerstate":"On"}'))
+
+    async def run() -> bytes:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            return await tv.post_raw("6/powerstate", b'{"powerstate":"Standby"}')
+
+    actual_response = asyncio.run(run())
+
+    assert requests_log[-1].content == b'{"powerstate":"Standby"}'
+    assert requests_log[-1].headers["Content-Type"] == "application/json"
+    assert actual_response == b'{"powerstate":"On"}'
+
+
+def test_tv_get_raw(mock_handler: Callable[..., None]) -> None:
+    mock_handler(lambda request: httpx.Response(200, content=b'{"powerstate":"On"}'))
+
+    async def run() -> bytes:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            return await tv.get_raw("6/powerstate")
+
+    assert asyncio.run(run()) == b'{"powerstate":"On"}'
+
+
+def test_tv_digest_auth(
+    mock_handler: Callable[..., None], requests_log: list[httpx.Request]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "Authorization" not in request.headers:
+            return httpx.Response(
+                401, headers={"WWW-Authenticate": 'Digest realm="XTV", nonce="abc", qop="auth"'}
+            )
+        return json_response({"powerstate": "On"})
+
+    mock_handler(handler)
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT, ("<id>", "<key>")) as tv:
+            return await tv.get("6/powerstate")
+
+    actual_response = asyncio.run(run())
+
+    assert actual_response == {"powerstate": "On"}
+    assert requests_log[-1].headers["Authorization"].startswith('Digest username="<id>"')
+
+
+@pytest.mark.parametrize("status_code", [401, 404, 500])
+def test_tv_error(status_code: int, mock_handler: Callable[..., None]) -> None:
+    path = "random/path"
+    url = f"https://{HOST}:{PORT}/{path}"
+    expected_message = f"POST request to {url} failed with status {status_code}"
+    mock_handler(lambda request: httpx.Response(status_code))
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            return await tv.post(path)
+
+    with pytest.raises(PhilipsTVError, match=expected_message) as excinfo:
+        asyncio.run(run())
+
+    exception = excinfo.value
+    assert exception.method == "POST"
+    assert exception.url == url
+    assert exception.status_code == status_code
+
+
+def test_tv_connection_error(mock_handler: Callable[..., None]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    mock_handler(handler)
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            return await tv.get("random/path")
+
+    with pytest.raises(PhilipsTVError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.status_code is None
+
+
+def test_tv_circuit_breaker(mock_handler: Callable[..., None]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    mock_handler(handler)
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT, circuit_breaker=breaker) as tv:
+            with pytest.raises(PhilipsTVError):
+                await tv.get("random/path")
+            return await tv.get("random/path")
+
+    with pytest.raises(PhilipsTVUnavailableError):
+        asyncio.run(run())
+
+    assert breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.parametrize("path", ["/6/notifychange", "/6/applications"])
+def test_tv_circuit_breaker_ignores_read_timeouts(
+    path: str, mock_handler: Callable[..., None]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == path:
+            raise httpx.ReadTimeout("Timed out", request=request)
+        return json_response({})
+
+    mock_handler(handler)
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT, circuit_breaker=breaker) as tv:
+            with pytest.raises(PhilipsTVTimeoutError):
+                await tv.post(path, {})
+            return await tv.get("6/powerstate")
+
+    assert asyncio.run(run()) == {}
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_tv_circuit_breaker_counts_connect_timeouts(mock_handler: Callable[..., None]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectTimeout("Timed out", request=request)
+
+    mock_handler(handler)
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async def run() -> None:
+        async with AsyncPhilipsTV(HOST, PORT, circuit_breaker=breaker) as tv:
+            await tv.get("6/powerstate")
+
+    with pytest.raises(PhilipsTVConnectTimeoutError):
+        asyncio.run(run())
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_tv_deadline(mock_handler: Callable[..., None]) -> None:
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return json_response(None)
+
+    mock_handler(slow_handler)
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            with deadline(0.05):
+                return await tv.get("6/powerstate")
+
+    with pytest.raises(PhilipsTVTimeoutError):
+        asyncio.run(run())
+
+
+def test_tv_expired_deadline(
+    mock_handler: Callable[..., None], requests_log: list[httpx.Request]
+) -> None:
+    mock_handler(lambda request: json_response(None))
+
+    async def run() -> Any:
+        async with AsyncPhilipsTV(HOST, PORT) as tv:
+            with deadline(0):
+                return await tv.get("6/powerstate")
+
+    with pytest.raises(PhilipsTVTimeoutError):
+        asyncio.run(run())
+
+    assert requests_log == []
@@ -1,12 +1,22 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
 
 from philipstv import (
+    KeyBurst,
     PhilipsTVAPI,
     PhilipsTVAPIMalformedResponseError,
     PhilipsTVAPIUnauthorizedError,
     PhilipsTVError,
+    PhilipsTVTimeoutError,
+    RecordingTransport,
+    RequestTiming,
+    TVSnapshot,
+    Urllib3PhilipsTV,
 )
 from philipstv.model import (
     AllChannels,
@@ -17,6 +27,7 @@ from philipstv.model import (
     AmbilightPower,
     AmbilightPowerValue,
     AmbilightTopology,
+    APIObject,
     Application,
     ApplicationComponent,
     ApplicationIntent,
@@ -27,6 +38,10 @@ from philipstv.model import (
     ChannelList,
     ChannelShort,
     CurrentChannel,
+    CurrentSetting,
+    CurrentSettings,
+    CurrentSettingsPayload,
+    CurrentSettingsValue,
     CurrentVolume,
     DeviceInfo,
     InputKey,
@@ -39,9 +54,15 @@ from philipstv.model import (
     PowerState,
     PowerStateValue,
     SetChannel,
+    SettingData,
+    SettingNode,
+    SettingNodeID,
     Volume,
 )
+from philipstv.timeouts import deadline
+from philipstv.types import Credentials
 from tests.fakes import FakePhilipsTV
+from tests.server import FakeTVServer
 
 DEVICE_INFO = DeviceInfo(
     id="<device_id>",
@@ -74,6 +95,15 @@ def test_auth() -> None:
     assert fake_tv.auth == expected_auth
 
 
+def test_close() -> None:
+    fake_tv = FakePhilipsTV()
+
+    with PhilipsTVAPI(fake_tv):
+        pass
+
+    assert fake_tv.closed
+
+
 def test_pair_request() -> None:
     fake_tv = FakePhilipsTV(
         post_responses={
@@ -249,6 +279,55 @@ def test_get_all_channels() -> None:
     )
 
 
+CHANNEL_JSON = {
+    "ccid": 35,
+    "preset": "1",
+    "name": "TVPiS 1 HD",
+    "onid": 1537,
+    "tsid": 24,
+    "sid": 2403,
+    "serviceType": "audio_video",
+    "type": "DVB_C",
+    "logoVersion": 33,
+}
+CHANNEL_LIST_JSON = {
+    "version": 1,
+    "id": "all",
+    "listType": "MixedSources",
+    "Channel": [CHANNEL_JSON, {**CHANNEL_JSON, "ccid": 36, "preset": "2", "name": "Żak"}],
+    "medium": "mixed",
+}
+
+
+@pytest.mark.parametrize("streamed", [True, False])
+def test_iter_all_channels(streamed: bool) -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={
+            "6/channeldb/tv/channelLists/all": {
+                **CHANNEL_LIST_JSON,
+                "operator": "OPER",
+                "installCountry": "Poland",
+            }
+        }
+    )
+
+    result = PhilipsTVAPI(fake_tv if streamed else RecordingTransport(fake_tv)).iter_all_channels()
+
+    assert [(channel.ccid, channel.name) for channel in result] == [(35, "TVPiS 1 HD"), (36, "Żak")]
+
+
+@pytest.mark.parametrize(
+    "channels", [[CHANNEL_JSON, {"ccid": 36}], [CHANNEL_JSON, "[1,"]], ids=["invalid", "malformed"]
+)
+def test_iter_all_channels_malformed(channels: list[Any]) -> None:
+    body = json.dumps({**CHANNEL_LIST_JSON, "Channel": channels}).replace('"[1,"', "[1,").encode()
+    fake_tv = FakePhilipsTV()
+    fake_tv.get_raw = lambda path: body  # type: ignore[method-assign]
+
+    with pytest.raises(PhilipsTVAPIMalformedResponseError):
+        list(PhilipsTVAPI(fake_tv).iter_all_channels())
+
+
 def test_input_key() -> None:
     fake_tv = FakePhilipsTV(post_responses={"6/input/key": None})
 
@@ -257,6 +336,128 @@ def test_input_key() -> None:
     assert fake_tv.post_requests == {"6/input/key": {"key": "Standby"}}
 
 
+@pytest.mark.parametrize("fast_json", [False, True])
+@pytest.mark.parametrize(
+    ("method", "path", "value", "model"),
+    [
+        pytest.param(
+            "input_key",
+            "6/input/key",
+            InputKeyValue.VOLUME_UP,
+            InputKey(key=InputKeyValue.VOLUME_UP),
+            id="input_key",
+        ),
+        pytest.param(
+            "set_powerstate",
+            "6/powerstate",
+            PowerStateValue.ON,
+            PowerState(powerstate=PowerStateValue.ON),
+            id="powerstate",
+        ),
+        pytest.param(
+            "set_ambilight_power",
+            "6/ambilight/power",
+            AmbilightPowerValue.OFF,
+            AmbilightPower(power=AmbilightPowerValue.OFF),
+            id="ambilight_power",
+        ),
+    ],
+)
+def test_post_bare_value(
+    fast_json: bool, method: str, path: str, value: Any, model: APIObject
+) -> None:
+    fake_tv = FakePhilipsTV(post_responses={path: None})
+    api = PhilipsTVAPI(fake_tv, fast_json=fast_json)
+
+    getattr(api, method)(value)
+    value_request = fake_tv.post_requests[path]
+    getattr(api, method)(model)
+
+    assert value_request == fake_tv.post_requests[path] == model.dump()
+
+
+class KeysFakePhilipsTV(FakePhilipsTV):
+    def __init__(
+        self, fail_at: int | None = None, warm_error: PhilipsTVError | None = None
+    ) -> None:
+        super().__init__()
+        self.fail_at = fail_at
+        self.warm_error = warm_error
+        self.keys: list[str] = []
+
+    def warm(self, connections: int = 1) -> int:
+        if self.warm_error:
+            raise self.warm_error
+        return super().warm(connections)
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        assert path == "6/input/key"
+        if len(self.keys) == self.fail_at:
+            raise PhilipsTVError("POST", path, 500)
+        self.keys.append(payload["key"])
+        return None
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_input_keys(fast_json: bool) -> None:
+    fake_tv = KeysFakePhilipsTV()
+    keys: list[InputKey | InputKeyValue] = [
+        InputKeyValue.DIGIT_1,
+        InputKey(key=InputKeyValue.DIGIT_2),
+        InputKeyValue.CONFIRM,
+    ]
+
+    result = PhilipsTVAPI(fake_tv, fast_json=fast_json).input_keys(keys)
+
+    assert fake_tv.warmed == 1
+    assert fake_tv.keys == ["Digit1", "Digit2", "Confirm"]
+    assert result.ok
+    assert [press.key for press in result.presses] == ["Digit1", "Digit2", "Confirm"]
+    assert all(press.latency >= 0 for press in result.presses)
+
+
+def test_input_keys_interval() -> None:
+    fake_tv = KeysFakePhilipsTV()
+
+    result = PhilipsTVAPI(fake_tv).input_keys([InputKeyValue.DIGIT_1] * 3, interval=0.05)
+
+    assert [press.sent_at for press in result.presses] == [
+        pytest.approx(0, abs=0.02),
+        pytest.approx(0.05, abs=0.02),
+        pytest.approx(0.1, abs=0.02),
+    ]
+
+
+def test_input_keys_stops_on_failure() -> None:
+    fake_tv = KeysFakePhilipsTV(fail_at=1)
+    keys = [InputKeyValue.DIGIT_1, InputKeyValue.DIGIT_2, InputKeyValue.CONFIRM]
+
+    result = PhilipsTVAPI(fake_tv).input_keys(keys)
+
+    assert fake_tv.keys == ["Digit1"]
+    assert not result.ok
+    assert [press.key for press in result.presses] == ["Digit1"]
+    assert result.failed_key == InputKeyValue.DIGIT_2
+    assert isinstance(result.error, PhilipsTVError)
+
+
+def test_input_keys_warm_failure() -> None:
+    error = PhilipsTVError("CONNECT", "https://192.168.0.100:1926")
+    fake_tv = KeysFakePhilipsTV(warm_error=error)
+
+    result = PhilipsTVAPI(fake_tv).input_keys([InputKeyValue.DIGIT_1])
+
+    assert result == KeyBurst(failed_key=InputKeyValue.DIGIT_1, error=error)
+    assert fake_tv.keys == []
+
+
+def test_input_keys_empty() -> None:
+    fake_tv = KeysFakePhilipsTV()
+
+    assert PhilipsTVAPI(fake_tv).input_keys([]) == KeyBurst()
+    assert fake_tv.warmed == 0
+
+
 def test_get_ambilight_power() -> None:
     fake_tv = FakePhilipsTV(get_responses={"6/ambilight/power": {"power": "On"}})
 
@@ -438,3 +639,331 @@ def test_api_error(response: Any, expected_exception: type[Exception]) -> None:
 
     with pytest.raises(expected_exception):
         PhilipsTVAPI(fake_tv).get_powerstate()
+
+
+def test_fast_json_get() -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={"6/audio/volume": {"muted": False, "current": 15, "min": 0, "max": 60}}
+    )
+
+    result = PhilipsTVAPI(fake_tv, fast_json=True).get_volume()
+
+    assert result == CurrentVolume(current=15, muted=False, min=0, max=60)
+
+
+def test_fast_json_post() -> None:
+    fake_tv = FakePhilipsTV(
+        post_responses={"6/pair/grant": {"error_id": "SUCCESS", "error_text": "Pairing completed"}}
+    )
+
+    result = PhilipsTVAPI(fake_tv, fast_json=True).pair_grant(
+        PairingGrantPayload(
+            auth=PairingAuthInfo(pin="1234", auth_timestamp=12345, auth_signature="<signature>"),
+            device=DEVICE_INFO,
+        )
+    )
+
+    assert fake_tv.post_requests["6/pair/grant"] == {
+        "auth": {"pin": "1234", "auth_timestamp": 12345, "auth_signature": "<signature>"},
+        "device": DEVICE_INFO.dump(),
+    }
+    assert result == PairingResponse(error_id="SUCCESS", error_text="Pairing completed")
+
+
+def test_fast_json_malformed_response() -> None:
+    fake_tv = FakePhilipsTV(get_responses={"6/powerstate": {"foo": "bar"}})
+
+    with pytest.raises(PhilipsTVAPIMalformedResponseError) as exc:
+        PhilipsTVAPI(fake_tv, fast_json=True).get_powerstate()
+
+    assert exc.value.response == b'{"foo": "bar"}'
+
+
+def test_fast_json_unsupported_transport() -> None:
+    class DictOnlyTV:
+        host = ""
+        auth: Credentials | None = None
+
+        def get(self, path: str) -> Any: ...
+
+        def post(self, path: str, payload: Any = None) -> Any: ...
+
+        def close(self) -> None: ...
+
+    with pytest.raises(TypeError, match="DictOnlyTV"):
+        PhilipsTVAPI(DictOnlyTV(), fast_json=True)
+
+
+class BlockingFakePhilipsTV(FakePhilipsTV):
+    """Fake TV which blocks `GET` requests until released."""
+
+    def __init__(self, get_responses: dict[str, Any]) -> None:
+        super().__init__(get_responses=get_responses)
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.get_count = 0
+
+    def get(self, path: str) -> Any:
+        self.get_count += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        return super().get(path)
+
+
+def run_concurrently(count: int, function: Any) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(function) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+def test_coalesce_concurrent_gets() -> None:
+    fake_tv = BlockingFakePhilipsTV(get_responses={"6/powerstate": {"powerstate": "On"}})
+    api = PhilipsTVAPI(fake_tv, coalesce=True)
+
+    threading.Timer(0.1, fake_tv.release.set).start()
+    results = run_concurrently(8, api.get_powerstate)
+
+    assert fake_tv.get_count == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == PowerState(powerstate=PowerStateValue.ON)
+
+
+def test_coalesce_does_not_cache() -> None:
+    fake_tv = BlockingFakePhilipsTV(get_responses={"6/powerstate": {"powerstate": "On"}})
+    fake_tv.release.set()
+    api = PhilipsTVAPI(fake_tv, coalesce=True)
+
+    api.get_powerstate()
+    api.get_powerstate()
+
+    assert fake_tv.get_count == 2
+
+
+def test_coalesce_shares_errors() -> None:
+    fake_tv = BlockingFakePhilipsTV(
+        get_responses={"6/powerstate": PhilipsTVError("GET", "6/powerstate", 401)}
+    )
+    api = PhilipsTVAPI(fake_tv, coalesce=True)
+
+    def get_powerstate_error() -> Exception | None:
+        try:
+            api.get_powerstate()
+        except Exception as exc:
+            return exc
+        return None
+
+    threading.Timer(0.1, fake_tv.release.set).start()
+    errors = run_concurrently(4, get_powerstate_error)
+
+    assert fake_tv.get_count == 1
+    assert all(isinstance(error, PhilipsTVAPIUnauthorizedError) for error in errors)
+
+
+def test_coalesce_waiting_respects_deadline() -> None:
+    fake_tv = BlockingFakePhilipsTV(get_responses={"6/powerstate": {"powerstate": "On"}})
+    api = PhilipsTVAPI(fake_tv, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(api.get_powerstate)
+        fake_tv.started.wait(timeout=5)
+
+        start = time.monotonic()
+        with deadline(0.1), pytest.raises(PhilipsTVTimeoutError):
+            api.get_powerstate()
+        assert time.monotonic() - start < 1
+
+        fake_tv.release.set()
+        assert leader.result() == PowerState(powerstate=PowerStateValue.ON)
+    assert fake_tv.get_count == 1
+
+
+def test_no_coalescing_by_default() -> None:
+    fake_tv = BlockingFakePhilipsTV(get_responses={"6/powerstate": {"powerstate": "On"}})
+    api = PhilipsTVAPI(fake_tv)
+
+    threading.Timer(0.1, fake_tv.release.set).start()
+    run_concurrently(4, api.get_powerstate)
+
+    assert fake_tv.get_count == 4
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_timing_sink(fast_json: bool, tv_server: FakeTVServer) -> None:
+    tv_server.responses = {
+        "/6/audio/volume": {"muted": False, "current": 15, "min": 0, "max": 60},
+    }
+    api_timings: list[RequestTiming] = []
+    tv_timings: list[RequestTiming] = []
+
+    with PhilipsTVAPI(
+        Urllib3PhilipsTV(tv_server.host, tv_server.port, timing_sink=tv_timings.append),
+        fast_json=fast_json,
+        timing_sink=api_timings.append,
+    ) as api:
+        api.get_volume()
+        api.set_volume(Volume(current=10))
+
+    get, post = api_timings
+    assert (get.method, get.path, get.status_code) == ("GET", "/6/audio/volume", 200)
+    assert get.validation > 0
+    assert get.tls > 0
+    assert (get.json_decode > 0) is not fast_json
+    assert (post.method, post.validation) == ("POST", 0)
+    assert post.request_size > 0
+    assert [timing.validation for timing in tv_timings] == [0, 0]
+
+
+def test_timing_sink_fake_transport() -> None:
+    fake_tv = FakePhilipsTV(get_responses={"6/powerstate": {"powerstate": "On"}})
+    timings: list[RequestTiming] = []
+
+    PhilipsTVAPI(fake_tv, timing_sink=timings.append).get_powerstate()
+
+    [timing] = timings
+    assert (timing.method, timing.path, timing.status_code) == ("GET", "/6/powerstate", None)
+    assert timing.validation > 0
+
+
+class SlowFakePhilipsTV(FakePhilipsTV):
+    """Fake TV which takes a while to respond to `GET` requests."""
+
+    def get(self, path: str) -> Any:
+        time.sleep(0.1)
+        return super().get(path)
+
+
+def test_get_snapshot() -> None:
+    fake_tv = SlowFakePhilipsTV(
+        get_responses={
+            "6/powerstate": {"powerstate": "On"},
+            "6/audio/volume": {"muted": False, "current": 15, "min": 0, "max": 60},
+            "6/activities/tv": PhilipsTVTimeoutError("GET", "6/activities/tv"),
+            "6/ambilight/power": {"power": "On"},
+            "6/ambilight/mode": {"current": "internal"},
+        }
+    )
+
+    start = time.monotonic()
+    snapshot = PhilipsTVAPI(fake_tv).get_snapshot()
+
+    assert time.monotonic() - start < 0.3
+    assert snapshot == TVSnapshot(
+        powerstate=PowerState(powerstate=PowerStateValue.ON),
+        volume=CurrentVolume(muted=False, current=15, min=0, max=60),
+        ambilight_power=AmbilightPower(power=AmbilightPowerValue.ON),
+        ambilight_mode=AmbilightMode(current=AmbilightModeValue.INTERNAL),
+        errors={"current_channel": snapshot.errors["current_channel"]},
+    )
+    assert isinstance(snapshot.errors["current_channel"], PhilipsTVTimeoutError)
+
+
+def test_get_snapshot_fields() -> None:
+    fake_tv = FakePhilipsTV(get_responses={"6/powerstate": {"powerstate": "Standby"}})
+
+    snapshot = PhilipsTVAPI(fake_tv).get_snapshot(["powerstate"])
+
+    assert snapshot == TVSnapshot(powerstate=PowerState(powerstate=PowerStateValue.STANDBY))
+    assert fake_tv.get_requests == {"6/powerstate"}
+
+
+def test_get_snapshot_unknown_field() -> None:
+    with pytest.raises(ValueError, match="brightness"):
+        PhilipsTVAPI(FakePhilipsTV()).get_snapshot(["powerstate", "brightness"])
+
+
+BRIGHTNESS_SETTING = {
+    "Nodeid": SettingNode.BRIGHTNESS,
+    "Controllable": True,
+    "Available": True,
+    "string_id": "Brightness",
+    "data": {"value": 50},
+}
+PICTURE_STYLE_SETTING = {
+    "Nodeid": SettingNode.PICTURE_STYLE,
+    "Controllable": True,
+    "Available": True,
+    "string_id": "Picture style",
+    "data": {"selected_item": 23},
+}
+
+
+class SettingsFakePhilipsTV(FakePhilipsTV):
+    def __init__(self, settings: list[dict[str, Any]]) -> None:
+        super().__init__()
+        self.settings = {setting["Nodeid"]: setting for setting in settings}
+        self.payloads: list[Any] = []
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        assert path == "6/menuitems/settings/current"
+        self.payloads.append(payload)
+        nodes = [node["nodeid"] for node in payload["nodes"]]
+        values = [{"value": self.settings[node]} for node in nodes if node in self.settings]
+        return {"values": values, "version": 3}
+
+
+def test_get_current_settings() -> None:
+    fake_tv = SettingsFakePhilipsTV([BRIGHTNESS_SETTING])
+
+    result = PhilipsTVAPI(fake_tv).get_current_settings(
+        CurrentSettingsPayload(nodes=[SettingNodeID(nodeid=SettingNode.BRIGHTNESS)])
+    )
+
+    assert fake_tv.payloads == [{"nodes": [{"nodeid": 2131230862}]}]
+    assert result == CurrentSettings(
+        values=[
+            CurrentSettingsValue(
+                value=CurrentSetting(
+                    node_id=2131230862,
+                    controllable=True,
+                    available=True,
+                    string_id="Brightness",
+                    data=SettingData(value=50),
+                )
+            )
+        ],
+        version=3,
+    )
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_get_settings(fast_json: bool) -> None:
+    fake_tv = SettingsFakePhilipsTV([BRIGHTNESS_SETTING, PICTURE_STYLE_SETTING])
+    nodes = [SettingNode.BRIGHTNESS, 1, SettingNode.PICTURE_STYLE, SettingNode.BRIGHTNESS]
+
+    result = PhilipsTVAPI(fake_tv, fast_json=fast_json).get_settings(nodes, chunk_size=2)
+
+    assert fake_tv.payloads == [
+        {"nodes": [{"nodeid": 2131230862}, {"nodeid": 1}]},
+        {"nodes": [{"nodeid": 2131230858}]},
+    ]
+    assert result.keys() == {SettingNode.BRIGHTNESS, SettingNode.PICTURE_STYLE}
+    assert result[SettingNode.BRIGHTNESS].data.value == 50
+    assert result[SettingNode.PICTURE_STYLE].data.selected_item == 23
+
+
+def test_get_settings_data_next_to_value() -> None:
+    fake_tv = FakePhilipsTV(
+        post_responses={
+            "6/menuitems/settings/current": {
+                "values": [
+                    {
+                        "value": {"Nodeid": 2131230862, "Controllable": True, "Available": True},
+                        "data": {"value": 50},
+                    }
+                ]
+            }
+        }
+    )
+
+    result = PhilipsTVAPI(fake_tv).get_settings([SettingNode.BRIGHTNESS])
+
+    assert result[SettingNode.BRIGHTNESS].data == SettingData(value=50)
+
+
+def test_get_settings_invalid_chunk_size() -> None:
+    fake_tv = SettingsFakePhilipsTV([])
+
+    with pytest.raises(ValueError, match="Chunk size"):
+        PhilipsTVAPI(fake_tv).get_settings([SettingNode.BRIGHTNESS], chunk_size=0)
+
+    assert fake_tv.payloads == []
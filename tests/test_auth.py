@@ -0,0 +1,168 @@
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from requests_mock import Mocker
+
+from philipstv import PhilipsTV
+from philipstv.auth import DigestChallenge, FileDigestChallengeStore, SharedDigestAuth
+
+HOST = "192.168.0.1"
+URL = f"https://{HOST}:1926/6/powerstate"
+CHALLENGE = 'Digest realm="XTV", nonce="<nonce>", qop="auth", opaque="<opaque>"'
+
+
+@pytest.fixture
+def digest_mock(requests_mock: Mocker) -> Mocker:
+    def respond(request: Any, context: Any) -> dict[str, str] | None:
+        if "Authorization" not in request.headers:
+            context.status_code = 401
+            context.headers["WWW-Authenticate"] = CHALLENGE
+            return None
+        return {"powerstate": "On"}
+
+    requests_mock.get(URL, json=respond)
+    return requests_mock
+
+
+def count_challenges(mock: Mocker) -> int:
+    return sum("Authorization" not in request.headers for request in mock.request_history)
+
+
+def test_challenge_from_header() -> None:
+    result = DigestChallenge.from_header(CHALLENGE)
+
+    assert result == DigestChallenge(realm="XTV", nonce="<nonce>", qop="auth", opaque="<opaque>")
+
+
+@pytest.mark.parametrize("header", ["", "Basic realm=XTV", 'Digest qop="auth"'])
+def test_challenge_from_invalid_header(header: str) -> None:
+    assert DigestChallenge.from_header(header) is None
+
+
+def test_build_header() -> None:
+    auth = SharedDigestAuth("<id>", "<key>")
+    assert auth.build_header("GET", URL) is None
+
+    auth.update_challenge(CHALLENGE)
+    first = auth.build_header("GET", URL)
+    second = auth.build_header("GET", URL)
+
+    assert first and first.startswith('Digest username="<id>", realm="XTV", nonce="<nonce>"')
+    assert 'uri="/6/powerstate"' in first
+    assert "nc=00000001" in first
+    assert second and "nc=00000002" in second
+
+
+def test_retries_after_challenge(digest_mock: Mocker) -> None:
+    tv = PhilipsTV(HOST, auth=("<id>", "<key>"))
+
+    assert tv.get("6/powerstate") == {"powerstate": "On"}
+    assert tv.get("6/powerstate") == {"powerstate": "On"}
+
+    assert digest_mock.call_count == 3
+    assert count_challenges(digest_mock) == 1
+
+
+def test_shares_challenge_between_threads(digest_mock: Mocker) -> None:
+    tv = PhilipsTV(HOST, auth=("<id>", "<key>"))
+    tv.get("6/powerstate")
+
+    threads = [threading.Thread(target=tv.get, args=("6/powerstate",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert count_challenges(digest_mock) == 1
+    nonce_counts = {
+        request.headers["Authorization"].split("nc=")[1].split(",")[0]
+        for request in digest_mock.request_history
+        if "Authorization" in request.headers
+    }
+    assert len(nonce_counts) == 6
+
+
+def test_persists_challenge(digest_mock: Mocker, tmp_path: Path) -> None:
+    store = FileDigestChallengeStore(tmp_path / "digest.json")
+
+    PhilipsTV(HOST, auth=("<id>", "<key>"), digest_store=store).get("6/powerstate")
+    PhilipsTV(HOST, auth=("<id>", "<key>"), digest_store=store).get("6/powerstate")
+
+    assert count_challenges(digest_mock) == 1
+    saved = store.load(HOST)
+    assert saved
+    assert saved.nonce == "<nonce>"
+
+
+class CountingStore:
+    def __init__(self, error: OSError | None = None) -> None:
+        self.error = error
+        self.saved: list[DigestChallenge] = []
+
+    def load(self, key: str) -> DigestChallenge | None:
+        if self.error:
+            raise self.error
+        return None
+
+    def save(self, key: str, challenge: DigestChallenge) -> None:
+        if self.error:
+            raise self.error
+        self.saved.append(challenge)
+
+
+def test_persists_only_new_challenges() -> None:
+    store = CountingStore()
+    auth = SharedDigestAuth("<id>", "<key>", store=store, key=HOST)
+
+    auth.update_challenge(CHALLENGE)
+    for _ in range(3):
+        auth.build_header("GET", URL)
+    auth.update_challenge(CHALLENGE.replace("<nonce>", "<new nonce>"))
+
+    assert [challenge.nonce for challenge in store.saved] == ["<nonce>", "<new nonce>"]
+
+
+def test_ignores_store_errors(digest_mock: Mocker) -> None:
+    store = CountingStore(PermissionError("read-only"))
+
+    tv = PhilipsTV(HOST, auth=("<id>", "<key>"), digest_store=store)
+
+    assert tv.get("6/powerstate") == {"powerstate": "On"}
+    assert tv.get("6/powerstate") == {"powerstate": "On"}
+    assert count_challenges(digest_mock) == 1
+
+
+def test_store_concurrent_saves(tmp_path: Path) -> None:
+    path = tmp_path / "digest.json"
+    errors = []
+
+    def save(host: str) -> None:
+        store = FileDigestChallengeStore(path)
+        try:
+            for _ in range(50):
+                store.save(host, DigestChallenge(realm="XTV", nonce="<nonce>"))
+        except OSError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=save, args=(f"host{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_store_ignores_malformed_file(tmp_path: Path) -> None:
+    path = tmp_path / "digest.json"
+    path.write_text("not json")
+    store = FileDigestChallengeStore(path)
+
+    assert store.load(HOST) is None
+
+    store.save(HOST, DigestChallenge(realm="XTV", nonce="<nonce>"))
+
+    assert store.load(HOST) == DigestChallenge(realm="XTV", nonce="<nonce>")
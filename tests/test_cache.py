@@ -0,0 +1,237 @@
+import time
+from typing import Any
+
+import pytest
+
+from philipstv import PhilipsTVAPI, PhilipsTVError, PhilipsTVRemote, ResponseCache
+from philipstv.cache import CacheStats
+from philipstv.model import (
+    AmbilightPower,
+    AmbilightPowerValue,
+    CurrentSettingsPayload,
+    CurrentVolume,
+    InputKey,
+    InputKeyValue,
+    NotifyChangePayload,
+    PowerState,
+    PowerStateValue,
+)
+from tests.fakes import FakePhilipsTV
+
+VOLUME = {"muted": False, "current": 15, "min": 0, "max": 60}
+CURRENT_CHANNEL = {
+    "channel": {"ccid": 35, "preset": "10", "name": "TVN HD"},
+    "channelList": {"id": "list", "version": "7"},
+}
+
+
+class CountingFakePhilipsTV(FakePhilipsTV):
+    """Fake TV counting `GET` requests of each path."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.get_counts: dict[str, int] = {}
+
+    def get(self, path: str) -> Any:
+        self.get_counts[path] = self.get_counts.get(path, 0) + 1
+        return super().get(path)
+
+
+@pytest.fixture
+def fake_tv() -> CountingFakePhilipsTV:
+    return CountingFakePhilipsTV(
+        get_responses={
+            "6/audio/volume": VOLUME,
+            "6/powerstate": {"powerstate": "On"},
+            "6/ambilight/power": {"power": "On"},
+        },
+        post_responses={"6/audio/volume": None, "6/ambilight/power": None, "6/input/key": None},
+    )
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_cache_hit(fast_json: bool, fake_tv: CountingFakePhilipsTV) -> None:
+    cache = ResponseCache()
+    api = PhilipsTVAPI(fake_tv, fast_json=fast_json, cache=cache)
+
+    first = api.get_volume()
+    second = api.get_volume()
+
+    assert second is first
+    assert first == CurrentVolume(current=15, muted=False, min=0, max=60)
+    assert fake_tv.get_counts == {"6/audio/volume": 1}
+    assert cache.stats == CacheStats(hits=1, misses=1)
+
+
+def test_cache_expires(fake_tv: CountingFakePhilipsTV) -> None:
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache(ttls={"audio/volume": 0.05}))
+
+    api.get_volume()
+    time.sleep(0.1)
+    api.get_volume()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 2}
+
+
+def test_cache_skips_uncached_paths(fake_tv: CountingFakePhilipsTV) -> None:
+    cache = ResponseCache(ttls={"audio/volume": 60})
+    api = PhilipsTVAPI(fake_tv, cache=cache)
+
+    api.get_powerstate()
+    api.get_powerstate()
+
+    assert fake_tv.get_counts == {"6/powerstate": 2}
+    assert cache.stats == CacheStats()
+
+
+def test_cache_does_not_store_errors(fake_tv: CountingFakePhilipsTV) -> None:
+    fake_tv.get_responses["6/audio/volume"] = PhilipsTVError("GET", "6/audio/volume", 503)
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache())
+
+    for _ in range(2):
+        with pytest.raises(PhilipsTVError):
+            api.get_volume()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 2}
+
+
+def test_cache_evicts_least_recently_used(fake_tv: CountingFakePhilipsTV) -> None:
+    cache = ResponseCache(maxsize=2)
+    api = PhilipsTVAPI(fake_tv, cache=cache)
+
+    api.get_volume()
+    api.get_powerstate()
+    api.get_volume()
+    api.get_ambilight_power()
+    api.get_volume()
+    api.get_powerstate()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 1, "6/powerstate": 2, "6/ambilight/power": 1}
+    assert cache.stats == CacheStats(hits=2, misses=4, evictions=2)
+
+
+def test_post_invalidates_own_path(fake_tv: CountingFakePhilipsTV) -> None:
+    cache = ResponseCache()
+    remote = PhilipsTVRemote(PhilipsTVAPI(fake_tv, cache=cache))
+
+    remote.get_volume()
+    remote.get_ambilight_power()
+    remote.set_volume(20)
+    remote.get_volume()
+    remote.get_ambilight_power()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 2, "6/ambilight/power": 1}
+    assert cache.stats.invalidations == 1
+
+
+def test_post_invalidates_related_paths(fake_tv: CountingFakePhilipsTV) -> None:
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache())
+
+    api.get_volume()
+    api.get_powerstate()
+    api.input_key(InputKey(key=InputKeyValue.VOLUME_UP))
+    api.get_volume()
+    api.get_powerstate()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 2, "6/powerstate": 2}
+
+
+def test_powerstate_invalidates_related_paths(fake_tv: CountingFakePhilipsTV) -> None:
+    fake_tv.get_responses["6/activities/tv"] = CURRENT_CHANNEL
+    fake_tv.post_responses["6/powerstate"] = None
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache())
+
+    api.get_ambilight_power()
+    api.get_current_channel()
+    api.set_powerstate(PowerState(powerstate=PowerStateValue.STANDBY))
+    api.get_ambilight_power()
+    api.get_current_channel()
+
+    assert fake_tv.get_counts == {"6/ambilight/power": 2, "6/activities/tv": 2}
+
+
+def test_cache_separates_api_versions(fake_tv: CountingFakePhilipsTV) -> None:
+    fake_tv.get_responses["1/audio/volume"] = VOLUME
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache())
+
+    api.get_volume()
+    api.api_version = 1
+    api.get_volume()
+    api.get_volume()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 1, "1/audio/volume": 1}
+
+
+def test_read_only_post_keeps_cache(fake_tv: CountingFakePhilipsTV) -> None:
+    fake_tv.post_responses["6/notifychange"] = {}
+    fake_tv.post_responses["6/menuitems/settings/current"] = {"values": []}
+    cache = ResponseCache()
+    api = PhilipsTVAPI(fake_tv, cache=cache)
+
+    api.get_volume()
+    api.notify_change(NotifyChangePayload(notification={"audio/volume": VOLUME}))
+    api.get_current_settings(CurrentSettingsPayload(nodes=[]))
+    api.get_volume()
+
+    assert fake_tv.get_counts == {"6/audio/volume": 1}
+    assert cache.stats.invalidations == 0
+
+
+def test_fresh_channels_bypass_cache(fake_tv: CountingFakePhilipsTV) -> None:
+    fake_tv.get_responses["6/channeldb/tv/channelLists/all"] = {
+        "version": 1,
+        "id": "all",
+        "listType": "MixedSources",
+        "medium": "mixed",
+        "operator": "OPER",
+        "installCountry": "Poland",
+        "channel": [],
+    }
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache())
+
+    api.get_all_channels()
+    api.get_all_channels()
+    api.get_all_channels(fresh=True)
+
+    assert fake_tv.get_counts == {"6/channeldb/tv/channelLists/all": 2}
+
+
+def test_failed_post_invalidates(fake_tv: CountingFakePhilipsTV) -> None:
+    fake_tv.post_responses["6/ambilight/power"] = PhilipsTVError("POST", "6/ambilight/power", 500)
+    api = PhilipsTVAPI(fake_tv, cache=ResponseCache())
+
+    api.get_ambilight_power()
+    with pytest.raises(PhilipsTVError):
+        api.set_ambilight_power(AmbilightPower(power=AmbilightPowerValue.OFF))
+    api.get_ambilight_power()
+
+    assert fake_tv.get_counts == {"6/ambilight/power": 2}
+
+
+def test_put_skips_stale_responses() -> None:
+    cache = ResponseCache()
+    stale = PowerState(powerstate=PowerStateValue.ON)
+
+    _, generation = cache.get("powerstate", PowerState)
+    cache.invalidate("input/key")
+    cache.put("powerstate", PowerState, stale, generation)
+
+    assert cache.get("powerstate", PowerState)[0] is None
+
+
+def test_clear() -> None:
+    cache = ResponseCache()
+    value = PowerState(powerstate=PowerStateValue.ON)
+    cache.put("powerstate", PowerState, value, cache.get("powerstate", PowerState)[1])
+
+    assert cache.get("powerstate", PowerState)[0] is value
+    cache.clear()
+    assert cache.get("powerstate", PowerState)[0] is None
+
+
+def test_ttl() -> None:
+    cache = ResponseCache()
+
+    assert cache.ttl("ambilight/topology") == 3600
+    assert cache.ttl("channeldb/tv/channelLists/all") == 300
+    assert cache.ttl("ambilight/measured") is None
@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from philipstv import PhilipsTVAPI, PhilipsTVAPIUnsupportedError, PhilipsTVError
+from philipstv.capabilities import Capabilities, FileCapabilityStore
+from philipstv.model import PowerState, PowerStateValue
+from tests.fakes import FakePhilipsTV
+
+SYSTEM = {
+    "menulanguage": "English",
+    "name": "55PUS7304/12",
+    "country": "Poland",
+    "api_version": {"Major": 6, "Minor": 2, "Patch": 0},
+    "featuring": {
+        "jsonfeatures": {
+            "editfavorites": ["TVChannels", "SatChannels"],
+            "ambilight": ["not_available"],
+            "applications": ["TV_Apps", "TV_Games", "TV_Settings"],
+            "pointer": ["not_available"],
+            "inputkey": ["key"],
+            "activities": ["intent"],
+        },
+        "systemfeatures": {"tvtype": "consumer", "pairing_type": "digest_auth_pairing"},
+    },
+    "os_type": "MSAF_2019_P",
+}
+LEGACY_SYSTEM = {"menulanguage": "English", "name": "42PFL6008K/12", "country": "Poland"}
+CAPABILITIES = Capabilities(
+    api_version=6,
+    features={
+        "editfavorites": ("TVChannels", "SatChannels"),
+        "ambilight": ("not_available",),
+        "applications": ("TV_Apps", "TV_Games", "TV_Settings"),
+        "pointer": ("not_available",),
+        "inputkey": ("key",),
+        "activities": ("intent",),
+    },
+)
+
+
+def test_probe() -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={"6/system": SYSTEM, "6/powerstate": {"powerstate": "On"}}
+    )
+    api = PhilipsTVAPI(fake_tv)
+
+    capabilities = api.probe()
+
+    assert capabilities == CAPABILITIES
+    assert api.capabilities == CAPABILITIES
+    assert api.api_version == 6
+    assert capabilities.supports("applications")
+    assert not capabilities.supports("ambilight")
+    assert not capabilities.supports("recordings")
+    assert api.get_powerstate() == PowerState(powerstate=PowerStateValue.ON)
+
+
+def test_probe_older_api_version() -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={"5/system": LEGACY_SYSTEM, "5/powerstate": {"powerstate": "On"}}
+    )
+    api = PhilipsTVAPI(fake_tv)
+
+    assert api.probe() == Capabilities(api_version=5)
+    assert api.get_powerstate() == PowerState(powerstate=PowerStateValue.ON)
+    assert fake_tv.get_requests == {"6/system", "5/system", "5/powerstate"}
+
+
+def test_probe_reported_api_version() -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={"6/system": {**SYSTEM, "api_version": {"Major": 5, "Minor": 1}}}
+    )
+    api = PhilipsTVAPI(fake_tv)
+
+    assert api.probe().api_version == 5
+    assert api.api_version == 5
+
+
+def test_probe_error() -> None:
+    fake_tv = FakePhilipsTV(get_responses={"6/system": PhilipsTVError("GET", "6/system", 503)})
+    api = PhilipsTVAPI(fake_tv)
+
+    with pytest.raises(PhilipsTVError, match="503"):
+        api.probe()
+
+    assert api.api_version == 6
+    assert api.capabilities is None
+
+
+def test_unsupported_feature_not_requested() -> None:
+    fake_tv = FakePhilipsTV(get_responses={"6/system": SYSTEM})
+    api = PhilipsTVAPI(fake_tv)
+    api.probe()
+
+    with pytest.raises(PhilipsTVAPIUnsupportedError, match="ambilight") as exc_info:
+        api.get_ambilight_power()
+
+    assert exc_info.value.feature == "ambilight"
+    assert fake_tv.get_requests == {"6/system"}
+
+
+def test_features_not_reported() -> None:
+    capabilities = Capabilities(api_version=6)
+
+    assert capabilities.supports("ambilight")
+    assert capabilities.unsupported_feature("ambilight/power") is None
+
+
+def test_unsupported_feature() -> None:
+    assert CAPABILITIES.unsupported_feature("6/ambilight/power") == "ambilight"
+    assert CAPABILITIES.unsupported_feature("applications") is None
+    assert CAPABILITIES.unsupported_feature("audio/volume") is None
+
+
+def test_probe_store(tmp_path: Path) -> None:
+    store = FileCapabilityStore(tmp_path / "capabilities.json")
+    PhilipsTVAPI(FakePhilipsTV(get_responses={"6/system": SYSTEM})).probe(store)
+    fake_tv = FakePhilipsTV()
+    api = PhilipsTVAPI(fake_tv)
+
+    assert api.probe(store) == CAPABILITIES
+    assert fake_tv.get_requests == set()
+    with pytest.raises(PhilipsTVError):
+        api.probe(store, refresh=True)
+
+
+def test_file_store_ignores_malformed_data(tmp_path: Path) -> None:
+    path = tmp_path / "capabilities.json"
+    path.write_text(json.dumps({"": {"api_version": "six"}, "other": [1]}))
+    store = FileCapabilityStore(path)
+
+    assert store.load("") is None
+    assert store.load("other") is None
+    store.save("", CAPABILITIES)
+    assert store.load("") == CAPABILITIES
+    assert json.loads(path.read_text())["other"] == [1]
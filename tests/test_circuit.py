@@ -0,0 +1,150 @@
+import time
+from contextlib import suppress
+
+import pytest
+
+from philipstv import (
+    CircuitBreaker,
+    CircuitState,
+    PhilipsTVConnectTimeoutError,
+    PhilipsTVError,
+    PhilipsTVTimeoutError,
+    PhilipsTVUnavailableError,
+)
+
+METHOD = "GET"
+URL = "https://192.168.0.1:1926/6/powerstate"
+
+
+def fail(breaker: CircuitBreaker, error: Exception | None = None) -> None:
+    with suppress(PhilipsTVError), breaker.guard(METHOD, URL):
+        raise error or PhilipsTVError(METHOD, URL)
+
+
+def succeed(breaker: CircuitBreaker) -> None:
+    with breaker.guard(METHOD, URL):
+        pass
+
+
+def test_stays_closed_below_threshold() -> None:
+    breaker = CircuitBreaker(failure_threshold=3)
+
+    fail(breaker)
+    fail(breaker, PhilipsTVConnectTimeoutError(METHOD, URL))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_opens_after_threshold() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+
+    fail(breaker)
+    fail(breaker, PhilipsTVConnectTimeoutError(METHOD, URL))
+    fail(breaker)
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(PhilipsTVUnavailableError, match="not sent") as exc:
+        succeed(breaker)
+    assert 9 < exc.value.retry_in <= 10
+
+
+def test_success_resets_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    fail(breaker)
+    succeed(breaker)
+    fail(breaker)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_error_response_is_not_failure() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    fail(breaker, PhilipsTVError(METHOD, URL, 500))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_after_reset_timeout() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    fail(breaker)
+
+    time.sleep(0.02)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+def test_half_open_allows_single_probe() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    fail(breaker)
+    time.sleep(0.02)
+
+    with breaker.guard(METHOD, URL), pytest.raises(PhilipsTVUnavailableError):
+        succeed(breaker)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_probe_backs_off() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01, backoff_factor=100)
+    fail(breaker)
+    time.sleep(0.02)
+
+    fail(breaker)
+
+    assert breaker.state is CircuitState.OPEN
+    assert 0.5 < breaker.retry_in <= 1
+
+
+def test_backoff_limit() -> None:
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=0.01, backoff_factor=100, max_reset_timeout=0.02
+    )
+    fail(breaker)
+    time.sleep(0.02)
+
+    fail(breaker)
+
+    assert breaker.retry_in <= 0.02
+
+
+def test_interrupted_probe_is_released() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    fail(breaker)
+    time.sleep(0.02)
+
+    with suppress(KeyboardInterrupt), breaker.guard(METHOD, URL):
+        raise KeyboardInterrupt
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    succeed(breaker)
+
+
+def test_reset() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+    fail(breaker)
+
+    breaker.reset()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.retry_in == 0
+
+
+def test_read_timeouts_dont_count() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    fail(breaker, PhilipsTVTimeoutError(METHOD, URL))
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_read_timeout_releases_probe() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    fail(breaker)
+    time.sleep(0.02)
+
+    fail(breaker, PhilipsTVTimeoutError(METHOD, URL))
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    succeed(breaker)
@@ -2,7 +2,7 @@ import json
 import time
 from collections.abc import Callable, Sequence
 from pathlib import Path
-from unittest.mock import Mock, call, create_autospec
+from unittest.mock import ANY, Mock, call, create_autospec
 
 import pytest
 from click.testing import CliRunner, Result
@@ -16,6 +16,7 @@ from philipstv import (
     PhilipsTVRemoteError,
 )
 from philipstv._cli import cli
+from philipstv.auth import FileDigestChallengeStore
 from philipstv.exceptions import PhilipsError, PhilipsTVAPIUnauthorizedError, PhilipsTVError
 from philipstv.model import PairingResponse
 from philipstv.types import Credentials
@@ -123,7 +124,10 @@ def test_reads_saved_data(data_file: Path, remote: Mock) -> None:
 
     run("power", "get")
 
-    remote.new.assert_called_once_with(given_host, (given_id, given_key))
+    remote.new.assert_called_once_with(given_host, (given_id, given_key), digest_store=ANY)
+    digest_store = remote.new.call_args.kwargs["digest_store"]
+    assert isinstance(digest_store, FileDigestChallengeStore)
+    assert digest_store.path == data_file.parent / "digest.json"
 
 
 def test_ignores_malformed_saved_data(data_file: Path, remote: Mock) -> None:
@@ -215,7 +219,7 @@ def test_channel_get(remote: Mock) -> None:
 
 
 def test_channel_list(remote: Mock) -> None:
-    remote.get_all_channels.return_value = {1: "TVP 1 HD", 3: "Polsat HD", 5: "TVN HD"}
+    remote.iter_all_channels.return_value = iter([(1, "TVP 1 HD"), (3, "Polsat HD"), (5, "TVN HD")])
 
     result = run_with_auth("channel", "list")
 
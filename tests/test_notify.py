@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+from philipstv import PhilipsTVAPI, PhilipsTVError, PhilipsTVRemote, PhilipsTVTimeoutError
+from philipstv.aio import AsyncPhilipsTVAPI
+from philipstv.model import CurrentVolume, PowerState, PowerStateValue
+from philipstv.notify import Change
+from tests.fakes import FakeAsyncPhilipsTV, FakePhilipsTV
+
+POWERSTATE = {"powerstate": "On"}
+VOLUME = {"muted": False, "current": 15, "min": 0, "max": 60}
+CHANNEL = {
+    "channel": {"ccid": 35, "preset": "10", "name": "Polsat"},
+    "channelList": {"id": "allcab", "version": "1"},
+}
+NODES = {"6/powerstate": POWERSTATE, "6/audio/volume": VOLUME, "6/activities/tv": CHANNEL}
+
+
+class NotifyingFakePhilipsTV(FakePhilipsTV):
+    """Fake TV responding to `notifychange` with the given responses, then timing out."""
+
+    def __init__(self, notify_responses: list[Any]) -> None:
+        super().__init__(get_responses=dict(NODES))
+        self.notify_responses = notify_responses
+        self.notify_payloads: list[Any] = []
+
+    def post(self, path: str, payload: Any = None) -> Any:
+        if path != "6/notifychange":
+            return super().post(path, payload)
+        self.notify_payloads.append(payload)
+        if self.notify_responses:
+            return self._raise_or_return(self.notify_responses.pop(0))
+        time.sleep(0.01)
+        raise PhilipsTVTimeoutError("POST", path)
+
+
+class ChangeCollector:
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.changes: list[Change] = []
+        self.done = threading.Event()
+
+    def __call__(self, change: Change) -> None:
+        self.changes.append(change)
+        if len(self.changes) >= self.count:
+            self.done.set()
+
+
+def test_subscribe_notify_change() -> None:
+    fake_tv = NotifyingFakePhilipsTV([{}, {"audio/volume": {**VOLUME, "current": 20}}])
+    collector = ChangeCollector(4)
+
+    with PhilipsTVAPI(fake_tv).subscribe(collector, poll_interval=0.01):
+        assert collector.done.wait(timeout=5)
+
+    assert [change.node for change in collector.changes] == [
+        "powerstate",
+        "audio/volume",
+        "activities/tv",
+        "audio/volume",
+    ]
+    assert collector.changes[0].value == PowerState(powerstate=PowerStateValue.ON)
+    assert collector.changes[3].value == CurrentVolume(current=20, muted=False, min=0, max=60)
+    assert fake_tv.notify_payloads[0] == {
+        "notification": {"powerstate": POWERSTATE, "audio/volume": VOLUME, "activities/tv": CHANNEL}
+    }
+    assert fake_tv.get_requests == set(NODES)
+
+
+def test_subscribe_rearms_after_timeout() -> None:
+    fake_tv = NotifyingFakePhilipsTV(
+        [PhilipsTVTimeoutError("POST", "6/notifychange"), {"powerstate": {"powerstate": "Standby"}}]
+    )
+    collector = ChangeCollector(4)
+
+    with PhilipsTVAPI(fake_tv, fast_json=True).subscribe(collector, poll_interval=0.01):
+        assert collector.done.wait(timeout=5)
+
+    assert collector.changes[3].value == PowerState(powerstate=PowerStateValue.STANDBY)
+
+
+def test_subscribe_falls_back_to_polling() -> None:
+    fake_tv = NotifyingFakePhilipsTV([PhilipsTVError("POST", "6/notifychange", 404)])
+    collector = ChangeCollector(4)
+
+    with PhilipsTVRemote(PhilipsTVAPI(fake_tv)).subscribe(collector, poll_interval=0.01):
+        time.sleep(0.05)
+        fake_tv.get_responses["6/audio/volume"] = {**VOLUME, "muted": True}
+        assert collector.done.wait(timeout=5)
+
+    assert collector.changes[3] == Change(
+        "audio/volume", CurrentVolume(current=15, muted=True, min=0, max=60)
+    )
+    assert len(fake_tv.notify_payloads) == 1
+
+
+def test_subscribe_retries_errors() -> None:
+    fake_tv = NotifyingFakePhilipsTV([])
+    fake_tv.get_responses["6/powerstate"] = PhilipsTVError("GET", "6/powerstate")
+    collector = ChangeCollector(3)
+
+    with PhilipsTVAPI(fake_tv).subscribe(collector, poll_interval=0.01):
+        time.sleep(0.05)
+        fake_tv.get_responses["6/powerstate"] = POWERSTATE
+        assert collector.done.wait(timeout=5)
+
+
+def test_subscribe_stops_on_unauthorized() -> None:
+    fake_tv = NotifyingFakePhilipsTV([])
+    fake_tv.get_responses["6/powerstate"] = PhilipsTVError("GET", "6/powerstate", 401)
+
+    subscription = PhilipsTVAPI(fake_tv).subscribe(ChangeCollector(1), poll_interval=0.01)
+    subscription._thread.join(timeout=5)
+
+    assert not subscription.running
+
+
+def test_async_changes_falls_back_to_polling() -> None:
+    fake_tv = FakeAsyncPhilipsTV(get_responses=dict(NODES))
+
+    async def run() -> list[Change]:
+        changes = []
+        async for change in AsyncPhilipsTVAPI(fake_tv).changes(poll_interval=0.01):
+            changes.append(change)
+            if len(changes) == 3:
+                fake_tv._fake.get_responses["6/audio/volume"] = {**VOLUME, "current": 5}
+            if len(changes) == 4:
+                break
+        return changes
+
+    changes = asyncio.run(run())
+
+    assert changes[3] == Change(
+        "audio/volume", CurrentVolume(current=5, muted=False, min=0, max=60)
+    )
+    assert "6/notifychange" in fake_tv.post_requests
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from philipstv import (
+    PhilipsTVRateLimitError,
+    PhilipsTVTimeoutError,
+    RateLimit,
+    RateLimiter,
+    deadline,
+)
+from philipstv.ratelimit import RateLimitStats
+
+METHOD = "POST"
+URL = "https://192.168.0.1:1926/6/input/key"
+
+
+def acquire_times(limiter: RateLimiter, path: str, count: int) -> list[float]:
+    start = time.monotonic()
+    times = []
+    for _ in range(count):
+        limiter.acquire(METHOD, URL, path)
+        times.append(time.monotonic() - start)
+    return times
+
+
+def test_burst_is_not_delayed() -> None:
+    limiter = RateLimiter({"input": RateLimit(rate=1, burst=3)})
+
+    times = acquire_times(limiter, "/6/input/key", 3)
+
+    assert times[-1] < 0.05
+    assert limiter.stats["input"] == RateLimitStats(requests=3)
+
+
+def test_requests_over_limit_wait() -> None:
+    limiter = RateLimiter({"input": RateLimit(rate=20, burst=1)})
+
+    times = acquire_times(limiter, "/6/input/key", 3)
+
+    assert times[1] >= 0.04
+    assert times[2] >= 0.09
+    stats = limiter.stats["input"]
+    assert (stats.requests, stats.queued, stats.max_queued) == (3, 0, 1)
+    assert stats.total_wait == pytest.approx(0.1, abs=0.02)
+    assert stats.max_wait == pytest.approx(0.05, abs=0.01)
+
+
+def test_concurrent_requests_are_queued() -> None:
+    limiter = RateLimiter({"input": RateLimit(rate=50, burst=1)}, max_queue=10)
+
+    threads = [
+        threading.Thread(target=limiter.acquire, args=(METHOD, URL, "6/input/key"))
+        for _ in range(5)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 0.08
+    assert limiter.stats["input"].max_queued == 4
+
+
+def test_full_queue() -> None:
+    limiter = RateLimiter({"input": RateLimit(rate=1, burst=1)}, max_queue=0)
+    limiter.acquire(METHOD, URL, "6/input/key")
+
+    with pytest.raises(PhilipsTVRateLimitError, match="too many requests are queued"):
+        limiter.acquire(METHOD, URL, "6/input/key")
+
+    assert limiter.stats["input"].rejected == 1
+
+
+def test_wait_past_deadline() -> None:
+    limiter = RateLimiter({"input": RateLimit(rate=1, burst=1)})
+    limiter.acquire(METHOD, URL, "6/input/key")
+
+    with deadline(0.1), pytest.raises(PhilipsTVTimeoutError):
+        limiter.acquire(METHOD, URL, "6/input/key")
+
+    assert limiter.stats["input"].rejected == 1
+
+
+def test_endpoint_classes() -> None:
+    limiter = RateLimiter(
+        {"input": RateLimit(rate=1, burst=1), "ambilight": RateLimit(rate=1, burst=1)},
+        default=RateLimit(rate=1, burst=1),
+        max_queue=0,
+    )
+
+    limiter.acquire(METHOD, URL, "6/input/key")
+    limiter.acquire(METHOD, URL, "6/ambilight/cached")
+    limiter.acquire(METHOD, URL, "6/powerstate")
+
+    assert set(limiter.stats) == {"input", "ambilight", "default"}
+    with pytest.raises(PhilipsTVRateLimitError):
+        limiter.acquire(METHOD, URL, "6/audio/volume")
+
+
+def test_no_default_limit() -> None:
+    limiter = RateLimiter({}, default=None, max_queue=0)
+
+    acquire_times(limiter, "6/powerstate", 100)
+
+    assert limiter.stats == {}
+
+
+def test_async_acquire() -> None:
+    limiter = RateLimiter({"input": RateLimit(rate=20, burst=1)})
+
+    async def run() -> float:
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.aacquire(METHOD, URL, "6/input/key") for _ in range(3)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+    assert limiter.stats["input"].queued == 0
@@ -1,14 +1,26 @@
-from unittest.mock import Mock, create_autospec
+from unittest.mock import Mock, call, create_autospec
 
 import pytest
 from pytest import MonkeyPatch
-
-from philipstv import PhilipsTVAPI, PhilipsTVPairer, PhilipsTVRemote, PhilipsTVRemoteError
+from requests_mock import Mocker
+
+from philipstv import (
+    PhilipsTVAPI,
+    PhilipsTVError,
+    PhilipsTVPairer,
+    PhilipsTVRemote,
+    PhilipsTVRemoteAmbiguousChannelError,
+    PhilipsTVRemoteError,
+    TVSnapshot,
+    TVState,
+)
 from philipstv.model import (
     AllChannels,
     AmbilightColor,
     AmbilightColors,
     AmbilightLayer,
+    AmbilightMode,
+    AmbilightModeValue,
     AmbilightPower,
     AmbilightPowerValue,
     AmbilightTopology,
@@ -23,13 +35,13 @@ from philipstv.model import (
     CurrentChannel,
     CurrentVolume,
     DeviceInfo,
-    InputKey,
     InputKeyValue,
     PowerState,
     PowerStateValue,
     SetChannel,
     Volume,
 )
+from philipstv.notify import Change
 
 CHANNELS = AllChannels(
     version=1,
@@ -63,6 +75,10 @@ CHANNELS = AllChannels(
         ),
     ],
 )
+CURRENT_CHANNEL = CurrentChannel(
+    channel=ChannelShort(ccid=40, preset="3", name="TVN HD"),
+    channel_list=ChannelList(id="allcab", version="1"),
+)
 
 APPLICATION_SPOTIFY = Application(
     intent=ApplicationIntent(
@@ -120,6 +136,13 @@ def test_auth(api_mock: PhilipsTVAPI) -> None:
     assert api_mock.auth == expected_credentials
 
 
+def test_close(api_mock: Mock) -> None:
+    with PhilipsTVRemote(api_mock):
+        pass
+
+    api_mock.close.assert_called_once_with()
+
+
 def test_pair(api_mock: Mock, monkeypatch: MonkeyPatch) -> None:
     given_id = "<id>"
     pairer_mock = create_autospec(PhilipsTVPairer)
@@ -161,7 +184,7 @@ def test_get_power(api_mock: Mock) -> None:
 def test_set_power(api_mock: Mock) -> None:
     PhilipsTVRemote(api_mock).set_power(True)
 
-    api_mock.set_powerstate.assert_called_once_with(PowerState(powerstate=PowerStateValue.ON))
+    api_mock.set_powerstate.assert_called_once_with(PowerStateValue.ON)
 
 
 def test_get_volume(api_mock: Mock) -> None:
@@ -196,10 +219,12 @@ def test_get_current_channel(api_mock: Mock) -> None:
         ("Polsat HD", SetChannel(channel=ChannelID(ccid=35))),
         (3, SetChannel(channel=ChannelID(ccid=40))),
         ("TVN HD", SetChannel(channel=ChannelID(ccid=40))),
+        ("tvn hd", SetChannel(channel=ChannelID(ccid=40))),
     ],
 )
 def test_set_channel(api_mock: Mock, input: int | str, expected: SetChannel) -> None:
     api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
     remote = PhilipsTVRemote(api_mock)
 
     remote.set_channel(input)
@@ -209,13 +234,98 @@ def test_set_channel(api_mock: Mock, input: int | str, expected: SetChannel) ->
     api_mock.get_all_channels.assert_called_once()
 
 
+def test_set_channel_list_version_changed(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
+    remote = PhilipsTVRemote(api_mock, channels_ttl=0)
+    remote.set_channel(1)
+
+    rescanned = CHANNELS.model_copy(update={"version": 2, "channel": CHANNELS.channel[1:]})
+    api_mock.get_all_channels.return_value = rescanned
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL.model_copy(
+        update={"channel_list": ChannelList(id="allcab", version="2")}
+    )
+    with pytest.raises(PhilipsTVRemoteError):
+        remote.set_channel(1)
+    remote.set_channel(3)
+
+    assert api_mock.get_all_channels.call_args_list == [call(fresh=False), call(fresh=True)]
+
+
+def test_set_channel_list_id_changed(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
+    remote = PhilipsTVRemote(api_mock, channels_ttl=0)
+    remote.set_channel(1)
+
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL.model_copy(
+        update={"channel_list": ChannelList(id="allsat", version="1")}
+    )
+    remote.set_channel(1)
+
+    assert api_mock.get_all_channels.call_count == 2
+
+
+def test_set_channel_list_checked_after_ttl(api_mock: Mock, monkeypatch: MonkeyPatch) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.return_value = CURRENT_CHANNEL
+    remote = PhilipsTVRemote(api_mock, channels_ttl=5)
+    now = 100.0
+    monkeypatch.setattr("philipstv.remote.time.monotonic", lambda: now)
+
+    remote.set_channel(1)
+    remote.set_channel(3)
+    assert api_mock.get_current_channel.call_count == 1
+
+    now += 5
+    remote.set_channel(1)
+    assert api_mock.get_current_channel.call_count == 2
+    api_mock.get_all_channels.assert_called_once()
+
+
+def test_set_channel_list_version_unknown(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    api_mock.get_current_channel.side_effect = PhilipsTVError("GET", "6/activities/tv", 500)
+    remote = PhilipsTVRemote(api_mock, channels_ttl=0)
+
+    remote.set_channel(1)
+    remote.set_channel(1)
+
+    assert api_mock.get_all_channels.call_count == 2
+
+
 def test_set_channel_error(api_mock: Mock) -> None:
-    api_mock.get_current_channel.return_value = CHANNELS
+    api_mock.get_all_channels.return_value = CHANNELS
 
     with pytest.raises(PhilipsTVRemoteError):
         PhilipsTVRemote(api_mock).set_channel("random channel")
 
 
+@pytest.mark.parametrize(
+    ("input", "matches"),
+    [
+        (3, [("3", "TVN HD"), ("3", "TVN 7")]),
+        ("tvn hd", [("3", "TVN HD"), ("5", "tvn HD")]),
+    ],
+)
+def test_set_channel_ambiguous(
+    api_mock: Mock, input: int | str, matches: list[tuple[str, str]]
+) -> None:
+    duplicates = [
+        CHANNELS.channel[1].model_copy(update={"ccid": 41, "name": "TVN 7"}),
+        CHANNELS.channel[1].model_copy(update={"ccid": 42, "preset": "5", "name": "tvn HD"}),
+    ]
+    api_mock.get_all_channels.return_value = CHANNELS.model_copy(
+        update={"channel": [*CHANNELS.channel, *duplicates]}
+    )
+
+    with pytest.raises(PhilipsTVRemoteAmbiguousChannelError) as exc_info:
+        PhilipsTVRemote(api_mock).set_channel(input)
+
+    assert exc_info.value.matches == matches
+    api_mock.set_channel.assert_not_called()
+
+
 def test_get_all_channels(api_mock: Mock) -> None:
     api_mock.get_all_channels.return_value = CHANNELS
     result = PhilipsTVRemote(api_mock).get_all_channels()
@@ -223,10 +333,17 @@ def test_get_all_channels(api_mock: Mock) -> None:
     assert result == {1: "Polsat HD", 3: "TVN HD"}
 
 
+def test_iter_all_channels(api_mock: Mock) -> None:
+    api_mock.iter_all_channels.return_value = iter(CHANNELS.channel)
+    result = PhilipsTVRemote(api_mock).iter_all_channels()
+
+    assert list(result) == [(1, "Polsat HD"), (3, "TVN HD")]
+
+
 def test_input_key(api_mock: Mock) -> None:
     PhilipsTVRemote(api_mock).input_key(InputKeyValue.STANDBY)
 
-    api_mock.input_key.assert_called_once_with(InputKey(key=InputKeyValue.STANDBY))
+    api_mock.input_key.assert_called_once_with(InputKeyValue.STANDBY)
 
 
 def test_get_ambilight_power(api_mock: Mock) -> None:
@@ -240,9 +357,7 @@ def test_get_ambilight_power(api_mock: Mock) -> None:
 def test_set_ambilight_power(api_mock: Mock) -> None:
     PhilipsTVRemote(api_mock).set_ambilight_power(True)
 
-    api_mock.set_ambilight_power.assert_called_once_with(
-        AmbilightPower(power=AmbilightPowerValue.ON)
-    )
+    api_mock.set_ambilight_power.assert_called_once_with(AmbilightPowerValue.ON)
 
 
 def test_set_ambilight_color(api_mock: Mock) -> None:
@@ -308,3 +423,165 @@ def test_launch_application_error(api_mock: Mock) -> None:
 
     with pytest.raises(PhilipsTVRemoteError):
         PhilipsTVRemote(api_mock).launch_application("whatever")
+
+
+def test_get_state(api_mock: Mock) -> None:
+    error = PhilipsTVError("GET", "6/ambilight/power")
+    api_mock.get_snapshot.return_value = TVSnapshot(
+        powerstate=PowerState(powerstate=PowerStateValue.ON),
+        volume=CurrentVolume(muted=False, current=15, min=0, max=60),
+        current_channel=CurrentChannel(
+            channel=ChannelShort(ccid=35, preset="1", name="Polsat HD"),
+            channel_list=ChannelList(id="allcab", version="1"),
+        ),
+        ambilight_mode=AmbilightMode(current=AmbilightModeValue.INTERNAL),
+        errors={"ambilight_power": error},
+    )
+
+    result = PhilipsTVRemote(api_mock).get_state()
+
+    assert result == TVState(
+        power=True,
+        volume=15,
+        channel="Polsat HD",
+        ambilight_mode="internal",
+        errors={"ambilight_power": error},
+    )
+    api_mock.get_snapshot.assert_called_once_with(
+        ["powerstate", "volume", "current_channel", "ambilight_power", "ambilight_mode"]
+    )
+
+
+def test_get_state_fields(api_mock: Mock) -> None:
+    api_mock.get_snapshot.return_value = TVSnapshot(
+        volume=CurrentVolume(muted=False, current=15, min=0, max=60)
+    )
+
+    assert PhilipsTVRemote(api_mock).get_state(["volume"]) == TVState(volume=15)
+    api_mock.get_snapshot.assert_called_once_with(["volume"])
+
+
+def test_state_ttl_serves_written_values(api_mock: Mock) -> None:
+    api_mock.get_all_channels.return_value = CHANNELS
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+
+    remote.set_power(True)
+    remote.set_volume(20)
+    remote.set_channel("Polsat HD")
+    remote.set_ambilight_power(False)
+    # Checking the channel list version isn't a read of the current channel.
+    api_mock.get_current_channel.reset_mock()
+
+    assert remote.get_power() is True
+    assert remote.get_volume() == 20
+    assert remote.get_current_channel() == "Polsat HD"
+    assert remote.get_ambilight_power() is False
+    api_mock.get_powerstate.assert_not_called()
+    api_mock.get_volume.assert_not_called()
+    api_mock.get_current_channel.assert_not_called()
+    api_mock.get_ambilight_power.assert_not_called()
+
+
+def test_state_ttl_serves_read_values(api_mock: Mock) -> None:
+    api_mock.get_volume.return_value = CurrentVolume(muted=False, current=15, min=0, max=60)
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+
+    assert remote.get_volume() == 15
+    assert remote.get_volume() == 15
+    api_mock.get_volume.assert_called_once_with()
+
+
+def test_state_ttl_expires(api_mock: Mock, monkeypatch: MonkeyPatch) -> None:
+    api_mock.get_volume.return_value = CurrentVolume(muted=False, current=15, min=0, max=60)
+    remote = PhilipsTVRemote(api_mock, state_ttl=2)
+    now = 100.0
+    monkeypatch.setattr("philipstv._mirror.time.monotonic", lambda: now)
+
+    remote.set_volume(20)
+    now += 2
+
+    assert remote.get_volume() == 15
+
+
+def test_state_ttl_new(requests_mock: Mocker) -> None:
+    requests_mock.post("https://192.168.0.1:1926/6/audio/volume")
+
+    with PhilipsTVRemote.new("192.168.0.1", ("<id>", "<key>"), state_ttl=60) as remote:
+        remote.set_volume(20)
+
+        assert remote.get_volume() == 20
+    assert requests_mock.call_count == 1
+
+
+def test_state_ttl_disabled_by_default(api_mock: Mock) -> None:
+    api_mock.get_volume.return_value = CurrentVolume(muted=False, current=15, min=0, max=60)
+    remote = PhilipsTVRemote(api_mock)
+
+    remote.set_volume(20)
+
+    assert remote.get_volume() == 15
+
+
+def test_state_ttl_failed_write(api_mock: Mock) -> None:
+    api_mock.get_volume.return_value = CurrentVolume(muted=False, current=15, min=0, max=60)
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+    remote.get_volume()
+    api_mock.set_volume.side_effect = PhilipsTVError("POST", "6/audio/volume", 500)
+
+    with pytest.raises(PhilipsTVError):
+        remote.set_volume(20)
+
+    assert remote.get_volume() == 15
+    assert api_mock.get_volume.call_count == 2
+
+
+def test_state_ttl_input_key_discards_state(api_mock: Mock) -> None:
+    api_mock.get_volume.return_value = CurrentVolume(muted=False, current=21, min=0, max=60)
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+
+    remote.set_volume(20)
+    remote.input_key(InputKeyValue.VOLUME_UP)
+
+    assert remote.get_volume() == 21
+
+
+def test_state_ttl_reconciled_by_get_state(api_mock: Mock) -> None:
+    api_mock.get_snapshot.return_value = TVSnapshot(
+        volume=CurrentVolume(muted=False, current=18, min=0, max=60)
+    )
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+
+    remote.set_volume(20)
+    remote.get_state(["volume"])
+
+    assert remote.get_volume() == 18
+    api_mock.get_volume.assert_not_called()
+
+
+def test_state_ttl_reconciled_by_notifications(api_mock: Mock) -> None:
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+    changes: list[Change] = []
+
+    remote.set_volume(20)
+    remote.subscribe(changes.append)
+    callback = api_mock.subscribe.call_args.args[0]
+    change = Change("audio/volume", CurrentVolume(muted=False, current=12, min=0, max=60))
+    callback(change)
+
+    assert remote.get_volume() == 12
+    assert changes == [change]
+    api_mock.get_volume.assert_not_called()
+
+
+def test_state_ttl_read_does_not_overwrite_newer_write(api_mock: Mock) -> None:
+    remote = PhilipsTVRemote(api_mock, state_ttl=60)
+
+    def get_volume_while_writing() -> CurrentVolume:
+        remote.set_volume(20)
+        return CurrentVolume(muted=False, current=15, min=0, max=60)
+
+    api_mock.get_volume.side_effect = get_volume_while_writing
+
+    assert remote.get_volume() == 15
+    assert remote.get_volume() == 20
+    api_mock.get_volume.assert_called_once_with()
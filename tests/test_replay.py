@@ -0,0 +1,150 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from philipstv import (
+    PhilipsTVAPI,
+    PhilipsTVError,
+    PhilipsTVRemote,
+    PhilipsTVTimeoutError,
+    RecordingTransport,
+    ReplayTransport,
+)
+from philipstv.replay import Exchange, load_exchanges, save_exchanges
+from tests.fakes import FakePhilipsTV
+
+VOLUME = {"muted": False, "current": 15, "min": 0, "max": 60}
+
+
+@pytest.mark.parametrize("file_name", ["session.jsonl", "session.jsonl.gz"])
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_record_and_replay(file_name: str, fast_json: bool, tmp_path: Path) -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={"6/audio/volume": VOLUME}, post_responses={"6/audio/volume": None}
+    )
+    with RecordingTransport(fake_tv) as recording_tv:
+        remote = PhilipsTVRemote(PhilipsTVAPI(recording_tv, fast_json=fast_json))
+        remote.get_volume()
+        remote.set_volume(20)
+    recording_tv.save(tmp_path / file_name)
+
+    replay_tv = ReplayTransport.load(tmp_path / file_name)
+    remote = PhilipsTVRemote(PhilipsTVAPI(replay_tv, fast_json=not fast_json))
+
+    assert remote.get_volume() == 15
+    remote.set_volume(20)
+    assert fake_tv.closed
+    assert [(exchange.method, exchange.path) for exchange in recording_tv.exchanges] == [
+        ("GET", "6/audio/volume"),
+        ("POST", "6/audio/volume"),
+    ]
+
+
+def test_record_errors() -> None:
+    fake_tv = FakePhilipsTV(
+        get_responses={
+            "6/powerstate": PhilipsTVError("GET", "6/powerstate", 503),
+            "6/audio/volume": PhilipsTVTimeoutError("GET", "6/audio/volume"),
+        }
+    )
+    recording_tv = RecordingTransport(fake_tv)
+
+    for path in ["6/powerstate", "6/audio/volume"]:
+        with pytest.raises(PhilipsTVError):
+            recording_tv.get(path)
+
+    powerstate, volume = recording_tv.exchanges
+    assert (powerstate.status_code, powerstate.error) == (503, "error")
+    assert (volume.status_code, volume.error) == (None, "timeout")
+
+
+class RawFakePhilipsTV(FakePhilipsTV):
+    """Fake TV returning raw bodies which aren't JSON."""
+
+    def __init__(self, raw_responses: dict[str, bytes]) -> None:
+        super().__init__()
+        self.raw_responses = raw_responses
+
+    def get_raw(self, path: str) -> bytes:
+        return self.raw_responses[path]
+
+    def post_raw(self, path: str, body: bytes | None = None) -> bytes:
+        return self.raw_responses[path]
+
+
+def test_record_and_replay_raw_bodies(tmp_path: Path) -> None:
+    fake_tv = RawFakePhilipsTV({"6/system": b"<html>Not Found</html>", "6/input/key": b""})
+    recording_tv = RecordingTransport(fake_tv)
+
+    assert recording_tv.get_raw("6/system") == b"<html>Not Found</html>"
+    assert recording_tv.post_raw("6/input/key", b"Mute") == b""
+    recording_tv.save(tmp_path / "session.jsonl")
+
+    system, key = load_exchanges(tmp_path / "session.jsonl")
+    assert (system.response, system.raw_response) == (None, "<html>Not Found</html>")
+    assert (key.payload, key.response, key.raw_response) == ("Mute", None, None)
+
+    replay_tv = ReplayTransport([system, key])
+    assert replay_tv.get_raw("6/system") == b"<html>Not Found</html>"
+    assert replay_tv.post_raw("6/input/key", b"Mute") == b""
+    with pytest.raises(ValueError):
+        replay_tv.get("6/system")
+
+
+def test_replay_errors() -> None:
+    replay_tv = ReplayTransport(
+        [
+            Exchange("GET", "6/powerstate", None, None, 0.0, 503, "error"),
+            Exchange("GET", "6/audio/volume", None, None, 0.0, None, "timeout"),
+        ]
+    )
+
+    with pytest.raises(PhilipsTVError, match="503"):
+        replay_tv.get("6/powerstate")
+    with pytest.raises(PhilipsTVTimeoutError):
+        replay_tv.get("6/audio/volume")
+    with pytest.raises(PhilipsTVError, match="404"):
+        replay_tv.get("6/unknown")
+
+
+def test_replay_order() -> None:
+    replay_tv = ReplayTransport(
+        [
+            Exchange("GET", "6/audio/volume", None, {"current": 1}, 0.0),
+            Exchange("POST", "6/audio/volume", {"current": 2}, None, 0.0),
+            Exchange("GET", "6/audio/volume", None, {"current": 2}, 0.0),
+        ]
+    )
+
+    assert replay_tv.get("/6/audio/volume") == {"current": 1}
+    assert replay_tv.post("6/audio/volume", {"current": 2}) is None
+    assert replay_tv.get("6/audio/volume") == {"current": 2}
+    assert replay_tv.get("6/audio/volume") == {"current": 2}
+    with pytest.raises(PhilipsTVError, match="404"):
+        replay_tv.post("6/audio/volume", {"current": 3})
+
+
+def test_replay_latency() -> None:
+    exchanges = [Exchange("GET", "6/powerstate", None, {"powerstate": "On"}, 0.1)]
+
+    start = time.monotonic()
+    ReplayTransport(exchanges).get("6/powerstate")
+    no_latency = time.monotonic() - start
+    start = time.monotonic()
+    ReplayTransport(exchanges, latency=1.0).get("6/powerstate")
+    latency = time.monotonic() - start
+
+    assert no_latency < 0.05
+    assert latency >= 0.1
+
+
+def test_save_and_load_exchanges(tmp_path: Path) -> None:
+    exchanges = [
+        Exchange("POST", "6/input/key", {"key": "Mute"}, None, 0.05),
+        Exchange("GET", "6/powerstate", None, None, 1.5, 503, "error"),
+    ]
+
+    save_exchanges(exchanges, tmp_path / "session.jsonl")
+
+    assert load_exchanges(tmp_path / "session.jsonl") == exchanges
@@ -0,0 +1,66 @@
+import time
+
+import pytest
+
+from philipstv.timeouts import Timeout, deadline, remaining_time, timeout_for
+
+DEFAULT = Timeout(connect=1, read=2, total=3)
+PROFILES = {
+    "input/key": Timeout(connect=0.5, read=0.5, total=1),
+    "channeldb/tv": Timeout(connect=5, read=10, total=20),
+    "channeldb/tv/channelLists/all": Timeout(connect=5, read=30, total=60),
+}
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        pytest.param("6/input/key", PROFILES["input/key"], id="versioned path"),
+        pytest.param("/6/input/key", PROFILES["input/key"], id="leading slash"),
+        pytest.param("input/key", PROFILES["input/key"], id="unversioned path"),
+        pytest.param("6/input/keys", DEFAULT, id="no partial segment match"),
+        pytest.param("6/channeldb/tv/channelLists", PROFILES["channeldb/tv"], id="prefix"),
+        pytest.param(
+            "6/channeldb/tv/channelLists/all",
+            PROFILES["channeldb/tv/channelLists/all"],
+            id="most specific profile",
+        ),
+        pytest.param("6/audio/volume", DEFAULT, id="default"),
+    ],
+)
+def test_timeout_for(path: str, expected: Timeout) -> None:
+    assert timeout_for(path, DEFAULT, PROFILES) == expected
+
+
+def test_timeout_for_deadline() -> None:
+    with deadline(0.5):
+        result = timeout_for("6/audio/volume", DEFAULT, PROFILES)
+
+    assert result.connect == DEFAULT.connect
+    assert result.read == DEFAULT.read
+    assert result.total is not None
+    assert 0.4 < result.total <= 0.5
+
+
+def test_timeout_for_expired_deadline() -> None:
+    with deadline(0):
+        time.sleep(0.001)
+        result = timeout_for("6/audio/volume", Timeout(), PROFILES)
+
+    assert result.total == 0
+
+
+def test_deadline_nesting() -> None:
+    assert remaining_time() is None
+
+    with deadline(10):
+        with deadline(20):
+            inner = remaining_time()
+        with deadline(1):
+            shorter = remaining_time()
+        outer = remaining_time()
+
+    assert remaining_time() is None
+    assert inner is not None and 9 < inner <= 10
+    assert shorter is not None and 0.9 < shorter <= 1
+    assert outer is not None and 9 < outer <= 10
@@ -1,9 +1,31 @@
+import json
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
+from requests import ConnectTimeout
 from requests_mock import Mocker
 
-from philipstv import PhilipsTV, PhilipsTVError
+from philipstv import (
+    CircuitBreaker,
+    CircuitState,
+    PhilipsTV,
+    PhilipsTVConnectTimeoutError,
+    PhilipsTVError,
+    PhilipsTVTimeoutError,
+    PhilipsTVUnavailableError,
+    PoolStats,
+    RateLimit,
+    RateLimiter,
+    RequestTiming,
+    Timeout,
+    Urllib3PhilipsTV,
+    deadline,
+)
+from philipstv.tv import _BasePhilipsTV
+from tests.server import FakeTVServer, RecordedRequest
 
 HOST = "192.168.0.1"
 PORT = 1926
@@ -19,6 +41,15 @@ RESPONSES = [
 ]
 
 
+def test_tv_incomplete_backend() -> None:
+    class IncompletePhilipsTV(_BasePhilipsTV):
+        def close(self) -> None:
+            pass
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompletePhilipsTV(HOST, PORT, None)  # type: ignore[abstract, call-arg]
+
+
 def test_tv_auth() -> None:
     first_credentials = ("<first key>", "<first secret>")
     second_credentials = ("<second key>", "<second secret>")
@@ -75,3 +106,528 @@ def test_tv_error(status_code: int, requests_mock: Mocker) -> None:
     assert exception.method == "POST"
     assert exception.url == url
     assert exception.status_code == status_code
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_raw_requests(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.handler = lambda request: (200, b'{"powerstate": "On"}' if request.body else b"")
+
+    with backend(tv_server.host, tv_server.port) as tv:
+        assert tv.get_raw("6/powerstate") == b""
+        assert tv.post_raw("6/powerstate", b'{"powerstate":"On"}') == b'{"powerstate": "On"}'
+
+    get_request, post_request = tv_server.requests
+    assert get_request.body == b""
+    assert post_request.body == b'{"powerstate":"On"}'
+    assert post_request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_get_stream(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.handler = lambda request: (200, bytes(range(256)) * 40)
+    timings: list[RequestTiming] = []
+
+    with backend(tv_server.host, tv_server.port, timing_sink=timings.append) as tv:
+        chunks = list(tv.get_stream("6/channeldb/tv/channelLists/all", chunk_size=4096))
+        # Closed early, so the connection can't be reused.
+        next(tv.get_stream("/6/channeldb/tv/channelLists/all", chunk_size=10))
+        tv.get_raw("6/powerstate")
+
+        assert tv.pool_stats.hits == 1
+
+    assert max(len(chunk) for chunk in chunks) <= 4096
+    assert b"".join(chunks) == bytes(range(256)) * 40
+    assert [(timing.path, timing.status_code) for timing in timings] == [
+        ("/6/channeldb/tv/channelLists/all", 200),
+        ("/6/channeldb/tv/channelLists/all", None),
+        ("/6/powerstate", 200),
+    ]
+    assert timings[0].response_size == 10240
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_get_stream_error(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    with (
+        backend(tv_server.host, tv_server.port) as tv,
+        pytest.raises(PhilipsTVError, match="404") as exc,
+    ):
+        list(tv.get_stream("6/unknown"))
+
+    assert exc.value.status_code == 404
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_get_stream_read_timeout(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/applications": {"applications": []}}
+    tv_server.body_interval = 0.3
+
+    with (
+        backend(tv_server.host, tv_server.port, timeout=Timeout(read=0.1)) as tv,
+        pytest.raises(PhilipsTVTimeoutError),
+    ):
+        list(tv.get_stream("6/applications"))
+
+
+def test_urllib3_tv_get_stream_digest_auth(tv_server: FakeTVServer) -> None:
+    def require_auth(request: RecordedRequest) -> tuple[int, bytes]:
+        if "Authorization" not in request.headers:
+            return 401, b"unauthorized"
+        return 200, b'{"Channel": []}'
+
+    tv_server.handler = require_auth
+    tv_server.headers = {"WWW-Authenticate": 'Digest realm="XTV", nonce="abc", qop="auth"'}
+
+    with Urllib3PhilipsTV(tv_server.host, tv_server.port, ("<user>", "<pass>")) as tv:
+        assert list(tv.get_stream("6/channeldb/tv/channelLists/all")) == [b'{"Channel": []}']
+
+        assert tv.pool_stats == PoolStats(hits=1, misses=1)
+
+
+def test_tv_reuses_connections(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with PhilipsTV(tv_server.host, tv_server.port) as tv:
+        for _ in range(3):
+            assert tv.get("6/powerstate") == {"powerstate": "On"}
+
+        assert tv.pool_stats == PoolStats(hits=2, misses=1)
+
+
+def test_tv_discards_connections_over_pool_size(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with PhilipsTV(tv_server.host, tv_server.port, pool_maxsize=1) as tv:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: tv.get("6/powerstate"), range(8)))
+
+        stats = tv.pool_stats
+
+    assert stats.hits + stats.misses == 8
+    assert stats.discarded == stats.misses - 1
+
+
+def test_tv_blocking_pool(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with PhilipsTV(tv_server.host, tv_server.port, pool_maxsize=1, pool_block=True) as tv:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: tv.get("6/powerstate"), range(8)))
+
+        assert tv.pool_stats == PoolStats(hits=7, misses=1)
+
+
+def test_tv_keepalive_expiry(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with PhilipsTV(tv_server.host, tv_server.port, keepalive_expiry=0) as tv:
+        tv.get("6/powerstate")
+        time.sleep(0.01)
+        tv.get("6/powerstate")
+
+        assert tv.pool_stats == PoolStats(hits=0, misses=2, expired=1, resumed=1)
+
+
+def test_tv_close(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+    tv = PhilipsTV(tv_server.host, tv_server.port)
+    tv.get("6/powerstate")
+
+    tv.close()
+    tv.get("6/powerstate")
+
+    assert tv.pool_stats.misses == 2
+
+
+def test_tv_read_timeout(tv_server: FakeTVServer) -> None:
+    def slow_response(request: RecordedRequest) -> tuple[int, bytes]:
+        time.sleep(0.5)
+        return 200, b""
+
+    tv_server.handler = slow_response
+
+    tv = PhilipsTV(tv_server.host, tv_server.port, timeout=Timeout(read=0.1))
+
+    with pytest.raises(PhilipsTVTimeoutError):
+        tv.get("6/audio/volume")
+
+
+def test_tv_body_read_timeout(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/applications": {"applications": []}}
+    tv_server.body_interval = 0.3
+
+    with (
+        PhilipsTV(tv_server.host, tv_server.port, timeout=Timeout(read=0.1)) as tv,
+        pytest.raises(PhilipsTVTimeoutError),
+    ):
+        tv.get("6/applications")
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+@pytest.mark.parametrize("method", ["get_raw", "get_stream"])
+def test_tv_total_timeout_slow_body(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], method: str, tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/applications": {"applications": []}}
+    tv_server.body_interval = 0.2
+    timeout = Timeout(connect=1, read=0.5, total=0.5)
+
+    started = time.monotonic()
+    with (
+        backend(tv_server.host, tv_server.port, timeout=timeout) as tv,
+        pytest.raises(PhilipsTVTimeoutError),
+    ):
+        list(getattr(tv, method)("6/applications"))
+
+    assert time.monotonic() - started < 1.5
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_total_timeout_digest_retry(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    def slow_auth(request: RecordedRequest) -> tuple[int, bytes]:
+        time.sleep(0.4)
+        if "Authorization" not in request.headers:
+            return 401, b"unauthorized"
+        return 200, b"{}"
+
+    tv_server.handler = slow_auth
+    tv_server.headers = {"WWW-Authenticate": 'Digest realm="XTV", nonce="abc", qop="auth"'}
+    timeout = Timeout(connect=1, read=1, total=0.6)
+
+    with (
+        backend(tv_server.host, tv_server.port, ("<user>", "<pass>"), timeout=timeout) as tv,
+        pytest.raises(PhilipsTVTimeoutError),
+    ):
+        tv.get("6/applications")
+
+    assert len(tv_server.requests) == 2
+
+
+def test_tv_timeout_profile(tv_server: FakeTVServer) -> None:
+    def slow_response(request: RecordedRequest) -> tuple[int, bytes]:
+        time.sleep(0.2)
+        return 200, b""
+
+    tv_server.handler = slow_response
+    profiles = {"input/key": Timeout(read=0.05)}
+
+    with PhilipsTV(tv_server.host, tv_server.port, timeout_profiles=profiles) as tv:
+        tv.post("6/audio/volume")
+        with pytest.raises(PhilipsTVTimeoutError):
+            tv.post("6/input/key")
+
+
+def test_tv_expired_deadline(tv_server: FakeTVServer) -> None:
+    tv = PhilipsTV(tv_server.host, tv_server.port)
+
+    with deadline(0), pytest.raises(PhilipsTVTimeoutError, match="timed out"):
+        tv.get("6/powerstate")
+
+    assert tv_server.requests == []
+
+
+@pytest.mark.parametrize("path", ["6/audio/volume", "/6/audio/volume"])
+@pytest.mark.parametrize("expected_response", RESPONSES)
+def test_urllib3_tv_post(
+    path: str, expected_response: dict[str, Any] | None, tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/audio/volume": expected_response}
+
+    with Urllib3PhilipsTV(tv_server.host, tv_server.port) as tv:
+        actual_response = tv.post(path, PAYLOAD)
+
+    assert actual_response == expected_response
+    request = tv_server.requests[0]
+    assert (request.method, request.path) == ("POST", "/6/audio/volume")
+    assert json.loads(request.body) == PAYLOAD
+    assert request.headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize("path", ["6/powerstate", "/6/powerstate"])
+@pytest.mark.parametrize("expected_response", RESPONSES)
+def test_urllib3_tv_get(
+    path: str, expected_response: dict[str, Any] | None, tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/powerstate": expected_response}
+
+    with Urllib3PhilipsTV(tv_server.host, tv_server.port) as tv:
+        actual_response = tv.get(path)
+
+    assert actual_response == expected_response
+    request = tv_server.requests[0]
+    assert (request.method, request.path, request.body) == ("GET", "/6/powerstate", b"")
+
+
+def test_urllib3_tv_error(tv_server: FakeTVServer) -> None:
+    url = f"https://{tv_server.host}:{tv_server.port}/6/unknown"
+
+    with (
+        Urllib3PhilipsTV(tv_server.host, tv_server.port) as tv,
+        pytest.raises(PhilipsTVError, match=f"GET request to {url} failed with status 404") as exc,
+    ):
+        tv.get("6/unknown")
+
+    assert exc.value.status_code == 404
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+def test_urllib3_tv_connection_error() -> None:
+    tv = Urllib3PhilipsTV("127.0.0.1", unused_port())
+
+    with pytest.raises(PhilipsTVError) as exc:
+        tv.get("6/powerstate")
+
+    assert not isinstance(exc.value, PhilipsTVTimeoutError)
+    assert exc.value.status_code is None
+
+
+def test_urllib3_tv_digest_auth(tv_server: FakeTVServer) -> None:
+    def require_auth(request: RecordedRequest) -> tuple[int, bytes]:
+        if "Authorization" not in request.headers:
+            return 401, b""
+        return 200, b'{"powerstate": "On"}'
+
+    tv_server.handler = require_auth
+    tv_server.headers = {"WWW-Authenticate": 'Digest realm="XTV", nonce="abc", qop="auth"'}
+
+    with Urllib3PhilipsTV(tv_server.host, tv_server.port, ("<user>", "<pass>")) as tv:
+        assert tv.get("6/powerstate") == {"powerstate": "On"}
+        assert tv.get("6/powerstate") == {"powerstate": "On"}
+
+    authorizations = [request.headers.get("Authorization") for request in tv_server.requests]
+    assert authorizations[0] is None
+    assert all('username="<user>"' in str(header) for header in authorizations[1:])
+    assert len(authorizations) == 3
+
+
+def test_urllib3_tv_reuses_connections(tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with Urllib3PhilipsTV(tv_server.host, tv_server.port) as tv:
+        for _ in range(3):
+            tv.get("6/powerstate")
+        tv.close()
+        tv.get("6/powerstate")
+
+        assert tv.pool_stats == PoolStats(hits=2, misses=2, resumed=1)
+
+
+def test_urllib3_tv_read_timeout(tv_server: FakeTVServer) -> None:
+    def slow_response(request: RecordedRequest) -> tuple[int, bytes]:
+        time.sleep(0.5)
+        return 200, b""
+
+    tv_server.handler = slow_response
+
+    with (
+        Urllib3PhilipsTV(tv_server.host, tv_server.port, timeout=Timeout(read=0.1)) as tv,
+        pytest.raises(PhilipsTVTimeoutError),
+    ):
+        tv.get("6/audio/volume")
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_circuit_breaker(backend: type[PhilipsTV | Urllib3PhilipsTV]) -> None:
+    breaker = CircuitBreaker(failure_threshold=2)
+    tv = backend("127.0.0.1", unused_port(), circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(PhilipsTVError) as exc:
+            tv.get("6/powerstate")
+        assert not isinstance(exc.value, PhilipsTVUnavailableError)
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(PhilipsTVUnavailableError):
+        tv.get("6/powerstate")
+
+
+def test_tv_circuit_breaker_counts_connect_timeouts(requests_mock: Mocker) -> None:
+    requests_mock.get(f"https://{HOST}:{PORT}/6/powerstate", exc=ConnectTimeout)
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with pytest.raises(PhilipsTVConnectTimeoutError):
+        PhilipsTV(HOST, circuit_breaker=breaker).get("6/powerstate")
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_tv_circuit_breaker_ignores_error_responses(tv_server: FakeTVServer) -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    with (
+        PhilipsTV(tv_server.host, tv_server.port, circuit_breaker=breaker) as tv,
+        pytest.raises(PhilipsTVError, match="404"),
+    ):
+        tv.get("6/unknown")
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+@pytest.mark.parametrize("path", ["notifychange", "applications"])
+def test_tv_circuit_breaker_ignores_read_timeouts(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], path: str, tv_server: FakeTVServer
+) -> None:
+    def slow_response(request: RecordedRequest) -> tuple[int, bytes]:
+        if request.path == f"/6/{path}":
+            time.sleep(0.3)
+        return 200, b"{}"
+
+    tv_server.handler = slow_response
+    breaker = CircuitBreaker(failure_threshold=1)
+    profiles = {path: Timeout(read=0.1)}
+
+    with backend(
+        tv_server.host, tv_server.port, timeout_profiles=profiles, circuit_breaker=breaker
+    ) as tv:
+        for _ in range(2):
+            with pytest.raises(PhilipsTVTimeoutError):
+                tv.post(f"6/{path}", {})
+
+        assert breaker.state is CircuitState.CLOSED
+        assert tv.get("6/powerstate") == {}
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_rate_limiter(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/input/key": None}
+    limiter = RateLimiter({"input": RateLimit(rate=20, burst=1)})
+
+    with backend(tv_server.host, tv_server.port, rate_limiter=limiter) as tv:
+        start = time.monotonic()
+        for _ in range(3):
+            tv.post("6/input/key", {"key": "VolumeUp"})
+
+    assert time.monotonic() - start >= 0.09
+    assert limiter.stats["input"].requests == 3
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_warm(backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with backend(tv_server.host, tv_server.port, pool_maxsize=3, pool_block=True) as tv:
+        assert tv.warm(5) == 3
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: tv.get("6/powerstate"), range(3)))
+
+        stats = tv.pool_stats
+
+    assert (stats.misses, stats.hits) == (3, 3)
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_warm_busy_pool(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    with backend(tv_server.host, tv_server.port, pool_maxsize=1, pool_block=True) as tv:
+        pool = tv._connection_pool()
+        conn = pool._get_conn()
+        try:
+            start = time.monotonic()
+            assert tv.warm() == 1
+            assert time.monotonic() - start < 0.5
+        finally:
+            pool._put_conn(conn)
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_warm_idle_connection(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with backend(tv_server.host, tv_server.port) as tv:
+        tv.warm()
+        # Session tickets of TLS 1.3 arrive on the idle connection in the meantime.
+        time.sleep(0.2)
+        tv.get("6/powerstate")
+
+        stats = tv.pool_stats
+
+    assert (stats.misses, stats.hits) == (1, 1)
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_resumes_tls_session(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with backend(tv_server.host, tv_server.port) as tv:
+        tv.get("6/powerstate")
+        tv.close()
+        tv.get("6/powerstate")
+        tv.close()
+        tv.warm()
+
+        assert tv.pool_stats.resumed == 2
+
+
+def test_tv_warm_error() -> None:
+    tv = Urllib3PhilipsTV("127.0.0.1", unused_port())
+
+    with pytest.raises(PhilipsTVError, match=r"CONNECT request to .* failed"):
+        tv.warm()
+
+
+@pytest.mark.parametrize("backend", [PhilipsTV, Urllib3PhilipsTV])
+def test_tv_timing_sink(
+    backend: type[PhilipsTV | Urllib3PhilipsTV], tv_server: FakeTVServer
+) -> None:
+    tv_server.responses = {"/6/audio/volume": {"current": 15}}
+    timings: list[RequestTiming] = []
+
+    with backend(tv_server.host, tv_server.port, timing_sink=timings.append) as tv:
+        tv.post("6/audio/volume", {"current": 15})
+        tv.get_raw("/6/audio/volume")
+
+    first, second = timings
+    assert (first.method, first.path, first.status_code) == ("POST", "/6/audio/volume", 200)
+    assert (first.request_size, first.response_size) == (15, 15)
+    assert first.connect > 0
+    assert first.tls > 0
+    assert first.ttfb > 0
+    assert first.json_decode > 0
+    assert first.total >= first.connect + first.tls + first.ttfb + first.body_read
+    assert (second.method, second.path, second.request_size) == ("GET", "/6/audio/volume", 0)
+    assert second.connect == second.tls == second.json_decode == 0
+
+
+def test_tv_timing_sink_error(tv_server: FakeTVServer) -> None:
+    timings: list[RequestTiming] = []
+
+    with (
+        Urllib3PhilipsTV(tv_server.host, tv_server.port, timing_sink=timings.append) as tv,
+        pytest.raises(PhilipsTVError),
+    ):
+        tv.get("6/unknown")
+
+    assert [timing.status_code for timing in timings] == [404]
+
+
+def test_tv_timing_sink_failure_is_ignored(tv_server: FakeTVServer) -> None:
+    def failing_sink(timing: RequestTiming) -> None:
+        raise RuntimeError
+
+    tv_server.responses = {"/6/powerstate": {"powerstate": "On"}}
+
+    with PhilipsTV(tv_server.host, tv_server.port, timing_sink=failing_sink) as tv:
+        assert tv.get("6/powerstate") == {"powerstate": "On"}
@@ -0,0 +1,83 @@
+import pytest
+
+from philipstv import (
+    PhilipsTVAPI,
+    PhilipsTVAPIMalformedResponseError,
+    PhilipsTVRemote,
+    ValidationLevel,
+)
+from philipstv.model import AmbilightColors, CurrentVolume
+from tests.fakes import FakePhilipsTV
+
+AMBILIGHT = {
+    "layer1": {
+        "left": {"0": {"r": 255, "g": 0, "b": 0}, "1": {"r": 10, "g": 20, "b": 30}},
+        "top": {"0": {"r": 0, "g": 255, "b": 0}},
+        "right": {"0": {"r": 0, "g": 0, "b": 255}},
+    },
+}
+VOLUME = {"muted": False, "current": 15, "min": 0, "max": 60}
+
+
+def create_api(fast_json: bool, validation: dict[str, ValidationLevel]) -> PhilipsTVAPI:
+    fake_tv = FakePhilipsTV(
+        get_responses={
+            "6/ambilight/measured": AMBILIGHT,
+            "6/ambilight/processed": AMBILIGHT,
+            "6/audio/volume": VOLUME,
+        }
+    )
+    return PhilipsTVAPI(fake_tv, fast_json=fast_json, validation=validation)
+
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_raw(fast_json: bool) -> None:
+    api = create_api(fast_json, {"ambilight/measured": ValidationLevel.RAW})
+
+    assert api.get_ambilight_measured() == AMBILIGHT
+    assert isinstance(api.get_ambilight_processed(), AmbilightColors)
+    assert isinstance(api.get_volume(), CurrentVolume)
+
+
+def test_raw_prefix() -> None:
+    api = create_api(False, {"ambilight": ValidationLevel.RAW})
+
+    assert api.get_ambilight_measured() == AMBILIGHT
+    assert api.get_ambilight_processed() == AMBILIGHT
+
+
+def test_full_overrides_prefix() -> None:
+    api = create_api(
+        False, {"ambilight": ValidationLevel.RAW, "ambilight/processed": ValidationLevel.FULL}
+    )
+
+    assert api.get_ambilight_measured() == AMBILIGHT
+    assert isinstance(api.get_ambilight_processed(), AmbilightColors)
+
+
+def test_raw_malformed_json() -> None:
+    api = create_api(True, {"audio/volume": ValidationLevel.RAW})
+    api._raw_tv.get_raw = lambda path: b"{"  # type: ignore[method-assign, union-attr]
+
+    with pytest.raises(PhilipsTVAPIMalformedResponseError):
+        api.get_volume()
+
+
+def test_raw_rejected_by_model_consumers() -> None:
+    api = create_api(
+        False, {"audio/volume": ValidationLevel.RAW, "notifychange": ValidationLevel.RAW}
+    )
+
+    with pytest.raises(ValueError, match="get_snapshot needs models of audio/volume"):
+        api.get_snapshot()
+    with pytest.raises(ValueError, match="subscribe needs models of notifychange"):
+        api.subscribe(lambda change: None)
+    with pytest.raises(ValueError, match="PhilipsTVRemote needs models of audio/volume"):
+        PhilipsTVRemote(api)
+
+
+def test_raw_unused_by_model_consumers() -> None:
+    api = create_api(False, {"ambilight/measured": ValidationLevel.RAW})
+
+    PhilipsTVRemote(api)
+    assert api.get_snapshot(["volume"]).volume == CurrentVolume.parse(VOLUME)